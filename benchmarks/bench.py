@@ -1,7 +1,8 @@
 from bench_core import (
     STRATEGIES, HAR_PATH,
     bench_flatten, bench_full, bench_normalize_sizes, bench_normalize_timings, bench_cpu_heavy,
-    create_results_table, create_results_csv, average_run, get_entries
+    create_results_table, create_results_csv, average_run, get_entries,
+    TRANSFORMERS, create_transport_table, measure_transport
 )
 from rich.console import Console
 import argparse
@@ -102,6 +103,10 @@ def main() -> None:
         # Display results table
         table = create_results_table(results)
         console.print(table)
+        # Serialization around the transform, per transport
+        modes = list(bench_map) if mode == "all" else [mode]
+        transport = {name: measure_transport(entries, TRANSFORMERS[name](), use_gc=use_gc) for name in modes}
+        console.print(create_transport_table(transport, len(entries)))
         # CSV output
         if args.csv:
             filename = None if args.csv == "-" else args.csv
@@ -0,0 +1,122 @@
+from bench_core import HAR_PATH
+from rich.console import Console
+from rich.table import Table
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import os
+import time
+
+from hario_core.parse import aparse, parse
+
+# Interval of the probe task measuring event loop lag.
+TICK = 0.001
+
+
+async def parse_on_loop(path: str, executor: Optional[ProcessPoolExecutor]) -> Any:
+    """Blocking parse() called from a coroutine."""
+    return parse(path)
+
+
+async def parse_in_thread(path: str, executor: Optional[ProcessPoolExecutor]) -> Any:
+    """aparse() in the loop's thread pool."""
+    return await aparse(path)
+
+
+async def parse_in_process(path: str, executor: Optional[ProcessPoolExecutor]) -> Any:
+    """aparse() in a process pool."""
+    return await aparse(path, executor=executor)
+
+
+MODES: Dict[str, Callable[[str, Optional[ProcessPoolExecutor]], Awaitable[Any]]] = {
+    "parse() on the loop": parse_on_loop,
+    "aparse (threads)": parse_in_thread,
+    "aparse (processes)": parse_in_process,
+}
+
+
+async def _probe(stop: asyncio.Event, lags: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def measure(
+    mode: Callable[[str, Optional[ProcessPoolExecutor]], Awaitable[Any]],
+    path: str,
+    uploads: int,
+    executor: ProcessPoolExecutor,
+) -> Tuple[float, float, float]:
+    """Parses *uploads* copies of *path* concurrently while probing the loop."""
+    stop = asyncio.Event()
+    lags: List[float] = []
+    probe = asyncio.create_task(_probe(stop, lags))
+    start = time.perf_counter()
+    results = await asyncio.gather(*(mode(path, executor) for _ in range(uploads)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+    del results
+    lags.sort()
+    if not lags:
+        return elapsed, elapsed, elapsed
+    return elapsed, lags[int(len(lags) * 0.99)], lags[-1]
+
+
+def create_table(results: List[Tuple[str, float, float, float]], uploads: int) -> Table:
+    table = Table(title=f"Event loop lag while parsing {uploads} uploads concurrently")
+    table.add_column("Mode", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("p99 lag", justify="right", style="green")
+    table.add_column("Max lag", justify="right", style="green")
+    for name, elapsed, p99, worst in results:
+        table.add_row(name, f"{elapsed:.3f}s", f"{p99*1000:.1f}ms", f"{worst*1000:.1f}ms")
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Async parse benchmark: event loop responsiveness while HAR files are
+        parsed.
+
+        Example usage:
+          python benchmarks/bench_aio.py -f my.har -n 4
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    parser.add_argument(
+        "-n", "--uploads",
+        type=int,
+        default=4,
+        help="Number of concurrent parses (default: 4)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Start the workers before measuring.
+        list(executor.map(int, range(args.workers)))
+        for name, mode in MODES.items():
+            console.print(f"\n[bold]Running {name}...[/bold]")
+            elapsed, p99, worst = asyncio.run(measure(mode, args.file, args.uploads, executor))
+            results.append((name, elapsed, p99, worst))
+    console.print(create_table(results, args.uploads))
+
+
+if __name__ == "__main__":
+    main()
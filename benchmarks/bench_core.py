@@ -3,11 +3,13 @@ import time
 import tracemalloc
 import hashlib
 import orjson
-from typing import Dict, Tuple, Any
+from typing import Any, Callable, Dict, Tuple
 import gc
 import psutil
 import os
 import csv
+import copy
+import pickle
 from rich.table import Table
 
 from hario_core.transform import (
@@ -19,6 +21,7 @@ from hario_core.transform import (
     normalize_timings,
     set_id,
 )
+from hario_core.transform.worker import decode_entries, encode_entries, has_datetimes, process_batch
 from hario_core.parse import parse
 
 REPEAT = 5
@@ -26,7 +29,18 @@ BATCH_SIZE = 12
 MAX_WORKERS = 6
 
 HAR_PATH = "benchmarks/test_lg.har"
-STRATEGIES = ["process", "thread", "sequential", "async"]
+STRATEGIES = ["process", "process-json", "fork-json", "thread", "sequential", "async"]
+
+
+def pipeline_config(strategy: str) -> PipelineConfig:
+    """Config for a STRATEGIES name; "process-json" is the process strategy with the json transport, etc."""
+    processing_strategy, _, transport = strategy.partition("-")
+    return PipelineConfig(
+        batch_size=BATCH_SIZE,
+        processing_strategy=processing_strategy,
+        max_workers=MAX_WORKERS if processing_strategy in ["process", "thread"] else None,
+        transport=transport or "pickle",
+    )
 
 def get_entries(har_path: str) -> dict:
     """
@@ -36,58 +50,41 @@ def get_entries(har_path: str) -> dict:
     return har_log.model_dump()['entries']
 
 
+def _with_id(*transformers: Any) -> list:
+    return [set_id(by_field(["request.url", "startedDateTime"])), *transformers]
+
+
 def bench_flatten(entries: dict, strategy: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
-    config = PipelineConfig(
-        batch_size=BATCH_SIZE,
-        processing_strategy=strategy,
-        max_workers=MAX_WORKERS if strategy in ["process", "thread"] else None,
-    )
+    config = pipeline_config(strategy)
     pipeline = Pipeline(
-        transformers=[set_id(by_field(["request.url", "startedDateTime"])), flatten()],
+        transformers=TRANSFORMERS["flatten"](),
         config=config,
     )
     return run_pipeline(pipeline, entries, f"flatten ({strategy})", use_gc=use_gc)
 
 
 def bench_normalize_sizes(entries: dict, strategy: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
-    config = PipelineConfig(
-        batch_size=BATCH_SIZE,
-        processing_strategy=strategy,
-        max_workers=MAX_WORKERS if strategy in ["process", "thread"] else None,
-    )
+    config = pipeline_config(strategy)
     pipeline = Pipeline(
-        transformers=[set_id(by_field(["request.url", "startedDateTime"])), normalize_sizes()],
+        transformers=TRANSFORMERS["normalize_sizes"](),
         config=config,
     )
     return run_pipeline(pipeline, entries, f"normalize_sizes ({strategy})", use_gc=use_gc)
 
 
 def bench_normalize_timings(entries: dict, strategy: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
-    config = PipelineConfig(
-        batch_size=BATCH_SIZE,
-        processing_strategy=strategy,
-        max_workers=MAX_WORKERS if strategy in ["process", "thread"] else None,
-    )
+    config = pipeline_config(strategy)
     pipeline = Pipeline(
-        transformers=[set_id(by_field(["request.url", "startedDateTime"])), normalize_timings()],
+        transformers=TRANSFORMERS["normalize_timings"](),
         config=config,
     )
     return run_pipeline(pipeline, entries, f"normalize_timings ({strategy})", use_gc=use_gc)
 
 
 def bench_full(entries: dict, strategy: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
-    config = PipelineConfig(
-        batch_size=BATCH_SIZE,
-        processing_strategy=strategy,
-        max_workers=MAX_WORKERS if strategy in ["process", "thread"] else None,
-    )
+    config = pipeline_config(strategy)
     pipeline = Pipeline(
-        transformers=[
-            set_id(by_field(["request.url", "startedDateTime"])),
-            normalize_sizes(),
-            normalize_timings(),
-            flatten(),
-        ],
+        transformers=TRANSFORMERS["full"](),
         config=config,
     )
     return run_pipeline(pipeline, entries, f"full pipeline ({strategy})", use_gc=use_gc)
@@ -106,19 +103,60 @@ def cpu_heavy_transformer() -> CpuHeavy:
     return CpuHeavy()
 
 
+# Transformers of every benchmark, by mode name.
+TRANSFORMERS: Dict[str, Callable[[], list]] = {
+    "flatten": lambda: _with_id(flatten()),
+    "normalize_sizes": lambda: _with_id(normalize_sizes()),
+    "normalize_timings": lambda: _with_id(normalize_timings()),
+    "full": lambda: _with_id(normalize_sizes(), normalize_timings(), flatten()),
+    "cpu_heavy": lambda: _with_id(cpu_heavy_transformer(), flatten()),
+}
+
+
 def bench_cpu_heavy(entries: dict, strategy: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
-    config = PipelineConfig(
-        batch_size=BATCH_SIZE,
-        processing_strategy=strategy,
-        max_workers=MAX_WORKERS if strategy in ["process", "thread"] else None,
-    )
+    config = pipeline_config(strategy)
     pipeline = Pipeline(
-        transformers=[set_id(by_field(["request.url", "startedDateTime"])), cpu_heavy_transformer(), flatten()],
+        transformers=TRANSFORMERS["cpu_heavy"](),
         config=config,
     )
     return run_pipeline(pipeline, entries, f"cpu_heavy_transformer ({strategy})", use_gc=use_gc)
 
 
+def measure_transport(entries: dict, transformers: list, use_gc: bool = True) -> Dict[str, float]:
+    """
+    Times, in this process, what the process strategy does around the
+    transform: every batch and its results serialized and deserialized once
+    with each transport, next to the transform itself.
+    """
+    if use_gc:
+        gc.collect()
+    batches = [entries[i : i + BATCH_SIZE] for i in range(0, len(entries), BATCH_SIZE)]
+    copies = copy.deepcopy(batches)
+    start = time.perf_counter()
+    results = [process_batch(batch, transformers) for batch in copies]
+    timings = {"transform": time.perf_counter() - start}
+    start = time.perf_counter()
+    for data in batches + results:
+        pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+    timings["pickle"] = time.perf_counter() - start
+    start = time.perf_counter()
+    for data in batches + results:
+        decode_entries(encode_entries(data), has_datetimes(data))
+    timings["json"] = time.perf_counter() - start
+    return timings
+
+
+def create_transport_table(results: Dict[str, Dict[str, float]], entries: int) -> Table:
+    table = Table(title=f"Serialization vs transform ({entries} entries, batches of {BATCH_SIZE}, in one process)")
+    table.add_column("Test", style="cyan")
+    table.add_column("Transform", justify="right", style="green")
+    table.add_column("pickle round trips", justify="right", style="green")
+    table.add_column("json round trips", justify="right", style="green")
+    for test_name, timings in results.items():
+        table.add_row(test_name, f"{timings['transform']:.3f}s", f"{timings['pickle']:.3f}s", f"{timings['json']:.3f}s")
+    return table
+
+
 def run_pipeline(pipeline: Pipeline, entries: dict, label: str, use_gc: bool = True) -> Tuple[float, int, int, int]:
     if use_gc:
         gc.collect()
@@ -128,6 +166,7 @@ def run_pipeline(pipeline: Pipeline, entries: dict, label: str, use_gc: bool = T
     start = time.perf_counter()
     result = pipeline.process(entries)
     elapsed = time.perf_counter() - start
+    pipeline.close()
     current, peak = tracemalloc.get_traced_memory()
     tracemalloc.stop()
     rss = psutil.Process(os.getpid()).memory_info().rss
@@ -0,0 +1,106 @@
+from bench_core import HAR_PATH, REPEAT
+from rich.console import Console
+from rich.table import Table
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pydantic import BaseModel
+
+from hario_core.models import HarLog
+from hario_core.parse import parse
+
+
+def dump_double(har_log: HarLog) -> Any:
+    """Previous HarLog.model_dump: full dump, then every entry dumped again."""
+    dump = BaseModel.model_dump(har_log)
+    dump["entries"] = [entry.model_dump() for entry in har_log.entries]
+    return dump
+
+
+def dump_single(har_log: HarLog) -> Any:
+    """HarLog.model_dump: each entry dumped once with its concrete type."""
+    return har_log.model_dump()
+
+
+def dump_json(har_log: HarLog) -> Any:
+    """HarLog.model_dump_json: straight to JSON bytes, extensions included."""
+    return har_log.model_dump_json()
+
+
+DUMPERS: Dict[str, Callable[[HarLog], Any]] = {
+    "double dump (before)": dump_double,
+    "model_dump": dump_single,
+    "model_dump_json": dump_json,
+}
+
+
+def time_dumper(dumper: Callable[[HarLog], Any], har_log: HarLog) -> float:
+    times = []
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        dumper(har_log)
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times)
+
+
+def peak_allocations(dumper: Callable[[HarLog], Any], har_log: HarLog) -> int:
+    gc.collect()
+    tracemalloc.start()
+    dumper(har_log)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def create_table(results: List[Tuple[str, float, int]], entries: int) -> Table:
+    table = Table(title=f"HarLog serialization ({entries} entries, avg of {REPEAT} runs)")
+    table.add_column("Dump", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    table.add_column("Peak alloc", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed, peak in results:
+        table.add_row(
+            name,
+            f"{elapsed:.3f}s",
+            f"{baseline/elapsed:.2f}x",
+            f"{peak/1024/1024:.1f}MB",
+        )
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Serialization benchmark: HarLog.model_dump before and after
+        single-pass entry serialization.
+
+        Example usage:
+          python benchmarks/bench_dump.py -f my.har
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    console.print(f"Loading HAR file: {args.file} ...")
+    har_log = parse(args.file)
+
+    results = []
+    for name, dumper in DUMPERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, time_dumper(dumper, har_log), peak_allocations(dumper, har_log)))
+    console.print(create_table(results, len(har_log.entries)))
+
+
+if __name__ == "__main__":
+    main()
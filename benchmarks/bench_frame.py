@@ -0,0 +1,90 @@
+from bench_core import HAR_PATH, REPEAT
+from rich.console import Console
+from rich.table import Table
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import gc
+import time
+
+from hario_core.analysis import HarFrame
+from hario_core.models import HarLog
+from hario_core.parse import parse
+
+
+def query_loop(har_log: HarLog, frame: HarFrame) -> Any:
+    """Python loop over the entries: bytes per MIME type of slow GETs."""
+    sizes: Dict[str, float] = {}
+    for entry in har_log.entries:
+        if entry.time > 100 and entry.request.method == "GET" and entry.response.status < 400:
+            mime_type = entry.response.content.mimeType
+            sizes[mime_type] = sizes.get(mime_type, 0) + entry.response.content.size
+    return sizes
+
+
+def query_frame(har_log: HarLog, frame: HarFrame) -> Any:
+    """The same query, vectorized over a HarFrame."""
+    mask = (frame["time"] > 100) & (frame["request.method"] == "GET") & (frame["response.status"] < 400)
+    return frame[mask].aggregate("response.content.mimeType", "response.content.size")
+
+
+QUERIES: Dict[str, Callable[[HarLog, HarFrame], Any]] = {
+    "loop over HarLog.entries": query_loop,
+    "HarFrame mask + aggregate": query_frame,
+}
+
+
+def time_call(call: Callable[[], Any]) -> float:
+    times = []
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times)
+
+
+def create_table(results: List[Tuple[str, float]], entries: int) -> Table:
+    table = Table(title=f"Analytics query ({entries} entries, avg of {REPEAT} runs)")
+    table.add_column("Query", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed in results:
+        table.add_row(name, f"{elapsed*1000:.2f}ms", f"{baseline/elapsed:.1f}x")
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Analytics benchmark: a filter + group-by query as a Python loop over
+        models and vectorized over a HarFrame (requires numpy).
+
+        Example usage:
+          python benchmarks/bench_frame.py -f my.har
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    console.print(f"Loading HAR file: {args.file} ...")
+    har_log = parse(args.file)
+    build = time_call(lambda: HarFrame.from_log(har_log))
+    frame = HarFrame.from_log(har_log)
+    console.print(f"HarFrame.from_log: {build*1000:.1f}ms, {len(frame.columns)} columns")
+
+    results = []
+    for name, query in QUERIES.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, time_call(lambda: query(har_log, frame))))
+    console.print(create_table(results, len(har_log.entries)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+from bench_core import HAR_PATH, REPEAT
+from collections import Counter
+from rich.console import Console
+from rich.table import Table
+from typing import Any, Callable, List, Tuple
+from urllib.parse import urlsplit
+import argparse
+import gc
+import time
+
+from hario_core.analysis import HarIndex
+from hario_core.parse import parse
+
+
+def time_call(call: Callable[[], Any]) -> float:
+    times = []
+    for _ in range(REPEAT):
+        gc.collect()
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return sum(times) / len(times)
+
+
+def scan(entries: Any, host: str, status_class: int) -> List[int]:
+    """Linear scan over the entries, the baseline for `HarIndex.query`."""
+    return [
+        position
+        for position, entry in enumerate(entries)
+        if urlsplit(entry.request.url).hostname == host
+        and entry.response.status // 100 == status_class
+    ]
+
+
+def create_table(results: List[Tuple[str, float]], entries: int) -> Table:
+    table = Table(title=f"Entry lookup ({entries} entries, avg of {REPEAT} runs)")
+    table.add_column("Lookup", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed in results:
+        table.add_row(name, f"{elapsed*1000:.3f}ms", f"{baseline/elapsed:.0f}x")
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Secondary index benchmark: entries of the most common host with a
+        given status class, by linear scan and with HarIndex (requires numpy).
+
+        Example usage:
+          python benchmarks/bench_index.py -f my.har
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    console.print(f"Loading HAR file: {args.file} ...")
+    entries = parse(args.file, compact=True).entries
+    build = time_call(lambda: HarIndex(entries))
+    index = HarIndex(entries)
+    console.print(f"HarIndex: built in {build*1000:.1f}ms")
+
+    hosts = Counter(index.values("host"))
+    host = hosts.most_common(1)[0][0]
+    status_class = 2 if index.values("status_class").get(4, 0) == 0 else 4
+    lookups = {
+        f"scan (host={host}, status_class={status_class})": (
+            lambda: scan(entries, host, status_class)
+        ),
+        "HarIndex.query": lambda: index.query(host=host, status_class=status_class),
+        "HarIndex.query + startedDateTime": lambda: index.query(
+            host=host, status_class=status_class, started_after=entries[0].startedDateTime
+        ),
+    }
+    results = []
+    for name, lookup in lookups.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, time_call(lookup)))
+    console.print(create_table(results, len(entries)))
+
+
+if __name__ == "__main__":
+    main()
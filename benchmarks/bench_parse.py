@@ -0,0 +1,493 @@
+from bench_core import HAR_PATH, REPEAT
+from rich.console import Console
+from rich.table import Table
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import ctypes
+import gc
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from urllib.parse import urlsplit
+
+import orjson
+import psutil
+
+from hario_core.models import BodyStore, interning
+from hario_core.parse import SnapshotCache, Where, open_indexed, parse, parse_entries, validate
+from hario_core.parse.index import index_path_for
+from hario_core.parse.stream import map_file
+
+
+def parse_current(data: bytes) -> Any:
+    """orjson decode into dicts, then validate entries and HarLog separately."""
+    return validate(orjson.loads(data))
+
+
+def parse_fast(data: bytes) -> Any:
+    """Raw bytes validated by pydantic-core in a single pass."""
+    return parse(data)
+
+
+def parse_pause_gc(data: bytes) -> Any:
+    """Single pydantic-core pass with the cyclic GC paused."""
+    return parse(data, pause_gc=True)
+
+
+PARSERS: Dict[str, Callable[[bytes], Any]] = {
+    "current (orjson + validate)": parse_current,
+    "fast (parse)": parse_fast,
+    "pause_gc (parse pause_gc=True)": parse_pause_gc,
+}
+
+
+def parse_path_read(path: str) -> Any:
+    """Whole file read into a bytes object."""
+    with open(path, "rb") as fh:
+        return parse(fh.read())
+
+
+def parse_path_mapped(path: str) -> Any:
+    """File memory-mapped, entries validated in chunks."""
+    with map_file(path) as mapped:
+        return parse(mapped)
+
+
+MEMORY_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "read into bytes": parse_path_read,
+    "memory-mapped": parse_path_mapped,
+}
+
+
+def entries_via_model_dump(path: str) -> Any:
+    """Full HarLog built, then dumped to entry dicts."""
+    return parse(path).model_dump()["entries"]
+
+
+def entries_direct(path: str) -> Any:
+    """Entries validated and dumped in chunks, no HarLog built."""
+    return parse_entries(path)
+
+
+def entries_unvalidated(path: str) -> Any:
+    """Entries decoded only."""
+    return parse_entries(path, validate=False)
+
+
+ENTRIES_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "parse().model_dump()": entries_via_model_dump,
+    "parse_entries": entries_direct,
+    "parse_entries(validate=False)": entries_unvalidated,
+}
+
+
+def _peak_rss_worker(parser: Callable[[str], Any], path: str, queue: Any) -> None:
+    start = time.perf_counter()
+    parser(path)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KB on Linux
+    queue.put((elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024))
+
+
+def measure_peak_rss(parser: Callable[[str], Any], path: str) -> Tuple[float, int]:
+    """Runs *parser* in a fresh process and returns (elapsed, peak RSS in bytes)."""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_peak_rss_worker, args=(parser, path, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def time_parser(parser: Callable[[Any], Any], data: Any, use_gc: bool = True) -> float:
+    times = []
+    for _ in range(REPEAT):
+        if use_gc:
+            gc.collect()
+        else:
+            gc.disable()
+        start = time.perf_counter()
+        parser(data)
+        times.append(time.perf_counter() - start)
+        if not use_gc:
+            gc.enable()
+    return sum(times) / len(times)
+
+
+def create_throughput_table(results: List[Tuple[str, float]], size: int) -> Table:
+    table = Table(title=f"Parse throughput ({size/1024/1024:.1f}MB, avg of {REPEAT} runs)")
+    table.add_column("Parser", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Throughput", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed in results:
+        table.add_row(
+            name,
+            f"{elapsed:.3f}s",
+            f"{size/1024/1024/elapsed:.1f}MB/s",
+            f"{baseline/elapsed:.2f}x",
+        )
+    return table
+
+
+def create_scaling_table(results: List[Tuple[int, float]], size: int) -> Table:
+    table = Table(title=f"parse(workers=N) scaling ({size/1024/1024:.1f}MB, avg of {REPEAT} runs)")
+    table.add_column("Workers", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Throughput", justify="right", style="green")
+    table.add_column("Speedup vs 1", justify="right", style="green")
+    baseline = results[0][1]
+    for workers, elapsed in results:
+        table.add_row(
+            str(workers),
+            f"{elapsed:.3f}s",
+            f"{size/1024/1024/elapsed:.1f}MB/s",
+            f"{baseline/elapsed:.2f}x",
+        )
+    return table
+
+
+def create_memory_table(results: List[Tuple[str, float, int]], size: int) -> Table:
+    table = Table(title=f"Peak RSS of parse(path) ({size/1024/1024:.1f}MB, fresh process each)")
+    table.add_column("Input", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Peak RSS", justify="right", style="green")
+    table.add_column("vs first", justify="right", style="green")
+    baseline = results[0][2]
+    for name, elapsed, rss in results:
+        table.add_row(
+            name,
+            f"{elapsed:.3f}s",
+            f"{rss/1024/1024:.1f}MB",
+            f"{rss/baseline:.2f}x",
+        )
+    return table
+
+
+def bench_memory(console: Console, path: str, size: int) -> None:
+    results = []
+    for name, parse_func in MEMORY_PARSERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        elapsed, rss = measure_peak_rss(parse_func, path)
+        results.append((name, elapsed, rss))
+    console.print(create_memory_table(results, size))
+
+
+def bench_entries(console: Console, path: str, size: int) -> None:
+    results = []
+    for name, parse_func in ENTRIES_PARSERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        elapsed, rss = measure_peak_rss(parse_func, path)
+        results.append((name, elapsed, rss))
+    table = create_memory_table(results, size)
+    table.title = f"Pipeline-ready entry dicts ({size/1024/1024:.1f}MB, fresh process each)"
+    console.print(table)
+
+
+def _retained_worker(path: str, store_dir: Optional[str], queue: Any) -> None:
+    start = time.perf_counter()
+    har_log = parse(path, bodies=BodyStore(store_dir) if store_dir else None)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    # Hand freed memory back to the OS, so RSS reflects what the log holds.
+    ctypes.CDLL("libc.so.6").malloc_trim(0)
+    queue.put((elapsed, psutil.Process().memory_info().rss))
+    del har_log
+
+
+def measure_retained(path: str, store_dir: Optional[str]) -> Tuple[float, int]:
+    """Parses *path* in a fresh process and returns (elapsed, RSS after parse)."""
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_retained_worker, args=(path, store_dir, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def bench_bodies(console: Console, path: str, size: int) -> None:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, store_dir in [("bodies in memory", None), ("BodyStore", directory)]:
+            console.print(f"\n[bold]Running {name}...[/bold]")
+            elapsed, rss = measure_retained(path, store_dir)
+            results.append((name, elapsed, rss))
+    table = create_memory_table(results, size)
+    table.title = f"RSS holding the parsed HarLog ({size/1024/1024:.1f}MB, fresh process each)"
+    table.columns[2].header = "RSS after parse"
+    console.print(table)
+
+
+def strings_validate(path: str) -> Any:
+    """orjson dicts validated with validate()."""
+    with open(path, "rb") as fh:
+        return validate(orjson.loads(fh.read()))
+
+
+STRING_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "validate(dict)": strings_validate,
+    "parse_entries": entries_direct,
+}
+
+
+def _measure_held(parser: Callable[[str], Any], path: str) -> Tuple[float, int, int]:
+    """Returns (elapsed, RSS held by the result, live bytes of the result)."""
+    base = psutil.Process().memory_info().rss
+    start = time.perf_counter()
+    result = parser(path)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    ctypes.CDLL("libc.so.6").malloc_trim(0)
+    rss = psutil.Process().memory_info().rss - base
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = parser(path)
+    gc.collect()
+    live, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, rss, live
+
+
+def _strings_worker(parser: Callable[[str], Any], path: str, intern: bool, queue: Any) -> None:
+    if not intern:
+        interning.INTERN_MAX_LENGTH = -1
+    queue.put(_measure_held(parser, path))
+
+
+def bench_strings(console: Console, path: str, size: int) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    table = Table(title=f"String interning ({size/1024/1024:.1f}MB, fresh process each)")
+    table.add_column("Parser", style="cyan")
+    table.add_column("Interning", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("RSS held", justify="right", style="green")
+    table.add_column("Live (tracemalloc)", justify="right", style="green")
+    for name, parser in STRING_PARSERS.items():
+        for intern in (False, True):
+            console.print(f"\n[bold]Running {name} (interning {'on' if intern else 'off'})...[/bold]")
+            queue = ctx.Queue()
+            process = ctx.Process(target=_strings_worker, args=(parser, path, intern, queue))
+            process.start()
+            elapsed, rss, live = queue.get()
+            process.join()
+            table.add_row(
+                name,
+                "on" if intern else "off",
+                f"{elapsed:.3f}s",
+                f"{rss/1024/1024:.1f}MB",
+                f"{live/1024/1024:.1f}MB",
+            )
+    console.print(table)
+
+
+def parse_compact(path: str) -> Any:
+    """parse(path, compact=True), slots-based records."""
+    return parse(path, compact=True)
+
+
+COMPACT_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "parse (models)": parse,
+    "parse(compact=True)": parse_compact,
+}
+
+
+def _compact_worker(parser: Callable[[str], Any], path: str, queue: Any) -> None:
+    queue.put(_measure_held(parser, path))
+
+
+def bench_compact(console: Console, path: str, size: int) -> None:
+    ctx = multiprocessing.get_context("spawn")
+    table = Table(title=f"Models vs compact records ({size/1024/1024:.1f}MB, fresh process each)")
+    table.add_column("Parser", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("RSS held", justify="right", style="green")
+    table.add_column("Live (tracemalloc)", justify="right", style="green")
+    for name, parser in COMPACT_PARSERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        queue = ctx.Queue()
+        process = ctx.Process(target=_compact_worker, args=(parser, path, queue))
+        process.start()
+        elapsed, rss, live = queue.get()
+        process.join()
+        table.add_row(name, f"{elapsed:.3f}s", f"{rss/1024/1024:.1f}MB", f"{live/1024/1024:.1f}MB")
+    console.print(table)
+
+
+def bench_index(console: Console, path: str, size: int) -> None:
+    sidecar = index_path_for(path)
+    sidecar.unlink(missing_ok=True)
+    results = []
+    start = time.perf_counter()
+    entry_count = len(parse(path, pause_gc=True).entries)
+    results.append(("parse(path).entries[N] (whole file)", time.perf_counter() - start))
+    start = time.perf_counter()
+    open_indexed(path).close()
+    results.append(("open_indexed, first time (builds index)", time.perf_counter() - start))
+    try:
+        times = []
+        for n in range(REPEAT):
+            start = time.perf_counter()
+            with open_indexed(path) as har:
+                har[(n * 7919) % entry_count]
+            times.append(time.perf_counter() - start)
+        results.append(("open_indexed(path)[N]", sum(times) / len(times)))
+        index_size = sidecar.stat().st_size
+    finally:
+        sidecar.unlink(missing_ok=True)
+    table = create_throughput_table(results, size)
+    table.title = f"Entry #N ({size/1024/1024:.1f}MB, {entry_count} entries, index {index_size/1024:.0f}KB)"
+    console.print(table)
+
+
+def bench_where(console: Console, data: bytes, size: int, use_gc: bool) -> None:
+    entries = orjson.loads(data)["log"]["entries"]
+    keep_all = Where(host=urlsplit(entries[0]["request"]["url"]).hostname)
+    # Every tenth request URL, standing in for a selective filter.
+    urls = {entry["request"]["url"] for entry in entries[::10]}
+
+    def keep_tenth(entry: Dict[str, Any]) -> bool:
+        return entry["request"]["url"] in urls
+
+    filters: List[Tuple[str, Callable[[Dict[str, Any]], bool]]] = [
+        ("keeping all entries", keep_all),
+        ("keeping 10% of entries", keep_tenth),
+    ]
+    results = [("parse (no filter)", time_parser(parse, data, use_gc=use_gc))]
+    for name, where in filters:
+        console.print(f"\n[bold]Running parse(where=...) {name}...[/bold]")
+        elapsed = time_parser(lambda d: parse(d, where=where), data, use_gc=use_gc)
+        results.append((f"parse(where=...) {name}", elapsed))
+    table = create_throughput_table(results, size)
+    table.title = f"Filtering before validation ({size/1024/1024:.1f}MB, {len(entries)} entries)"
+    console.print(table)
+
+
+def create_cache_table(results: List[Tuple[str, float]], size: int) -> Table:
+    table = Table(title=f"parse(path, cache=...) ({size/1024/1024:.1f}MB, avg of {REPEAT} runs)")
+    table.add_column("Load", style="cyan")
+    table.add_column("Time", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed in results:
+        table.add_row(name, f"{elapsed:.3f}s", f"{baseline/elapsed:.2f}x")
+    return table
+
+
+def bench_cache(console: Console, path: str, size: int, use_gc: bool) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cache = SnapshotCache(directory)
+        console.print("\n[bold]Running parse without cache...[/bold]")
+        results = [("no cache", time_parser(parse, path, use_gc=use_gc))]
+        console.print("\n[bold]Running parse without cache, pause_gc=True...[/bold]")
+        elapsed = time_parser(
+            lambda p: parse(p, pause_gc=True), path, use_gc=use_gc
+        )
+        results.append(("no cache, pause_gc=True", elapsed))
+        parse(path, cache=cache)
+        console.print("\n[bold]Running parse from snapshot...[/bold]")
+        elapsed = time_parser(lambda p: parse(p, cache=cache), path, use_gc=use_gc)
+        results.append(("snapshot", elapsed))
+    console.print(create_cache_table(results, size))
+
+
+def bench_throughput(console: Console, data: bytes, size: int, use_gc: bool) -> None:
+    results = []
+    for name, parse_func in PARSERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, time_parser(parse_func, data, use_gc=use_gc)))
+    console.print(create_throughput_table(results, size))
+
+
+def bench_scaling(console: Console, data: bytes, size: int, use_gc: bool, max_workers: int) -> None:
+    results = []
+    for workers in range(1, max_workers + 1):
+        console.print(f"\n[bold]Running parse with {workers} worker(s)...[/bold]")
+        elapsed = time_parser(lambda d: parse(d, workers=workers), data, use_gc=use_gc)
+        results.append((workers, elapsed))
+    console.print(create_scaling_table(results, size))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Parse benchmarks: compares HAR parsing paths in MB/s.
+
+        Example usage:
+          python benchmarks/bench_parse.py -f my.har
+          python benchmarks/bench_parse.py throughput --no-gc
+          python benchmarks/bench_parse.py scaling -w 8
+          python benchmarks/bench_parse.py memory
+          python benchmarks/bench_parse.py cache
+          python benchmarks/bench_parse.py entries
+          python benchmarks/bench_parse.py bodies -f har_with_bodies.har
+          python benchmarks/bench_parse.py strings
+          python benchmarks/bench_parse.py compact
+          python benchmarks/bench_parse.py index
+          python benchmarks/bench_parse.py where
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "mode",
+        nargs="?",
+        default="all",
+        choices=["throughput", "scaling", "memory", "cache", "entries", "bodies", "strings", "compact", "index", "where", "all"],
+        help="Benchmark mode: throughput, scaling, memory, cache, entries, bodies, strings, compact, index, where, all (default: all)"
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of workers for the scaling mode (default: CPU count)"
+    )
+    parser.add_argument(
+        "--no-gc",
+        action="store_true",
+        help="Disable GC during measurement (default: GC enabled)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    console.print(f"Loading HAR file: {args.file} ...")
+    with open(args.file, "rb") as fh:
+        data = fh.read()
+    size = os.path.getsize(args.file)
+
+    use_gc = not args.no_gc
+    if args.mode in ("throughput", "all"):
+        bench_throughput(console, data, size, use_gc)
+    if args.mode in ("where", "all"):
+        bench_where(console, data, size, use_gc)
+    if args.mode in ("scaling", "all"):
+        bench_scaling(console, data, size, use_gc, args.workers)
+    if args.mode in ("cache", "all"):
+        bench_cache(console, args.file, size, use_gc)
+    if args.mode in ("memory", "all"):
+        del data
+        bench_memory(console, args.file, size)
+    if args.mode in ("entries", "all"):
+        bench_entries(console, args.file, size)
+    if args.mode in ("bodies", "all"):
+        bench_bodies(console, args.file, size)
+    if args.mode in ("strings", "all"):
+        bench_strings(console, args.file, size)
+    if args.mode in ("compact", "all"):
+        bench_compact(console, args.file, size)
+    if args.mode in ("index", "all"):
+        bench_index(console, args.file, size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+from bench_core import HAR_PATH, REPEAT, get_entries
+from rich.console import Console
+from rich.table import Table
+from typing import Any, Callable, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import pickle
+import time
+
+from hario_core.transform import Pipeline, PipelineConfig, by_field, flatten, set_id
+from hario_core.transform.worker import init_worker, process_batch
+
+CALLS = 20
+
+
+def _pipeline(workers: int) -> Pipeline:
+    config = PipelineConfig(batch_size=10, processing_strategy="process", max_workers=workers)
+    return Pipeline(
+        transformers=[set_id(by_field(["request.url", "startedDateTime"])), flatten()],
+        config=config,
+    )
+
+
+def per_call_pool(entries: List[Dict[str, Any]], workers: int) -> float:
+    """A pool started and shut down on every call (the previous behavior)."""
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        with _pipeline(workers) as pipeline:
+            pipeline.process(entries)
+    return (time.perf_counter() - start) / CALLS
+
+
+def persistent_pool(entries: List[Dict[str, Any]], workers: int) -> float:
+    """One pipeline, its pool reused by every call."""
+    with _pipeline(workers) as pipeline:
+        pipeline.process(entries)  # starts the pool
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            pipeline.process(entries)
+        return (time.perf_counter() - start) / CALLS
+
+
+RUNNERS: Dict[str, Callable[[List[Dict[str, Any]], int], float]] = {
+    "new pool per call": per_call_pool,
+    "persistent pool": persistent_pool,
+}
+
+
+class LookupTransformer:
+    """Tags entries from a large lookup table, like a GeoIP or URL-category map."""
+
+    def __init__(self, size: int):
+        self.table = {f"https://host{index}.test/": index for index in range(size)}
+
+    def __call__(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        data["category"] = self.table.get(data["request"]["url"], -1)
+        return data
+
+
+def _start_worker(_: int) -> None:
+    """Starts the workers before timing."""
+
+
+def lookup_pickled_per_batch(entries: List[Dict[str, Any]], workers: int, transformer: LookupTransformer) -> float:
+    """Transformers sent along with every batch (the previous behavior)."""
+    transformers = [transformer]
+    batches = [entries[i : i + 10] for i in range(0, len(entries), 10)]
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(transformers,)) as executor:
+        list(executor.map(_start_worker, range(workers)))
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            list(executor.map(process_batch, batches, [transformers] * len(batches)))
+        return (time.perf_counter() - start) / CALLS
+
+
+def lookup_installed(entries: List[Dict[str, Any]], workers: int, transformer: LookupTransformer) -> float:
+    """Transformers installed once per worker, batches carry a token."""
+    config = PipelineConfig(batch_size=10, processing_strategy="process", max_workers=workers)
+    with Pipeline(transformers=[transformer], config=config) as pipeline:
+        pipeline.process(entries)
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            pipeline.process(entries)
+        return (time.perf_counter() - start) / CALLS
+
+
+def create_table(results: List[Tuple[str, float]], entries: int, workers: int) -> Table:
+    table = Table(title=f"Pipeline.process latency ({entries} entries, {workers} workers, {CALLS} calls)")
+    table.add_column("Pool", style="cyan")
+    table.add_column("Per call", justify="right", style="green")
+    table.add_column("Speedup", justify="right", style="green")
+    baseline = results[0][1]
+    for name, elapsed in results:
+        table.add_row(name, f"{elapsed*1000:.1f}ms", f"{baseline/elapsed:.1f}x")
+    return table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Process pool benchmark: per-call latency of Pipeline.process on small
+        inputs with a pool per call and with the pipeline's persistent pool.
+
+        Example usage:
+          python benchmarks/bench_pool.py -f my.har -n 50 -w 4
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    parser.add_argument("-n", "--entries", type=int, default=50, help="Entries per call (default: 50)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Worker processes (default: 4)")
+    parser.add_argument(
+        "--table-size", type=int, default=200_000, help="Keys in the lookup table of the large transformer (default: 200000)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    console.print(f"Loading HAR file: {args.file} ...")
+    entries = get_entries(args.file)[: args.entries]
+    results = []
+    for name, runner in RUNNERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, min(runner(entries, args.workers) for _ in range(REPEAT))))
+    console.print(create_table(results, len(entries), args.workers))
+
+    transformer = LookupTransformer(args.table_size)
+    pickled_mb = len(pickle.dumps(transformer)) / 1024 / 1024
+    results = []
+    for name, lookup_runner in (
+        ("transformers pickled per batch", lookup_pickled_per_batch),
+        ("transformers installed once", lookup_installed),
+    ):
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        results.append((name, min(lookup_runner(entries, args.workers, transformer) for _ in range(REPEAT))))
+    table = create_table(results, len(entries), args.workers)
+    table.title = f"Transformer with a {pickled_mb:.1f}MB lookup table ({len(entries)} entries in batches of 10, {CALLS} calls)"
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+from bench_core import HAR_PATH
+from bench_parse import create_memory_table, measure_peak_rss
+from rich.console import Console
+from typing import Any, Callable, Dict
+import argparse
+import os
+
+from hario_core.parse import iter_entries
+from hario_core.transform import Pipeline, PipelineConfig, flatten, normalize_sizes
+
+BATCH_SIZE = 500
+
+
+def _pipeline(strategy: str) -> Pipeline:
+    config = PipelineConfig(batch_size=BATCH_SIZE, processing_strategy=strategy)
+    return Pipeline(transformers=[normalize_sizes(), flatten()], config=config)
+
+
+def _drain(results: Any) -> int:
+    """Stands in for a writer: every result is consumed, none is kept."""
+    count = 0
+    for _ in results:
+        count += 1
+    return count
+
+
+def process_list(path: str) -> Any:
+    """All entry dicts and all results held at once."""
+    return _drain(_pipeline("sequential").process(list(iter_entries(path, raw=True))))
+
+
+def process_iter_sequential(path: str) -> Any:
+    """Entries streamed from the file through process_iter."""
+    return _drain(_pipeline("sequential").process_iter(iter_entries(path, raw=True)))
+
+
+def process_iter_thread(path: str) -> Any:
+    """The same, with a thread pool and bounded batches in flight."""
+    return _drain(_pipeline("thread").process_iter(iter_entries(path, raw=True)))
+
+
+RUNNERS: Dict[str, Callable[[str], Any]] = {
+    "list(iter_entries) + process": process_list,
+    "iter_entries + process_iter (sequential)": process_iter_sequential,
+    "iter_entries + process_iter (thread)": process_iter_thread,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="""
+        Streaming pipeline benchmark: peak RSS of transforming a whole list of
+        entries vs streaming them through Pipeline.process_iter.
+
+        Example usage:
+          python benchmarks/bench_stream.py -f my.har
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "-f", "--file",
+        default=HAR_PATH,
+        help="Path to HAR file (default: benchmarks/test_lg.har)"
+    )
+    args = parser.parse_args()
+
+    console = Console()
+    size = os.path.getsize(args.file)
+    results = []
+    for name, runner in RUNNERS.items():
+        console.print(f"\n[bold]Running {name}...[/bold]")
+        elapsed, rss = measure_peak_rss(runner, args.file)
+        results.append((name, elapsed, rss))
+    table = create_memory_table(results, size)
+    table.title = f"Pipeline memory ({size/1024/1024:.1f}MB, batches of {BATCH_SIZE}, fresh process each)"
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from .frame import Categories, HarFrame
+from .index import HarIndex
+
+__all__ = [
+    "HarFrame",
+    "HarIndex",
+    "Categories",
+]
@@ -0,0 +1,399 @@
+"""
+Columnar representation of HAR entries backed by NumPy arrays.
+
+- `HarFrame` pulls the numeric fields of entries (times, timings, sizes,
+  status codes, timestamps) into one array per field, and low-cardinality
+  strings (methods, MIME types, ...) into dictionary-encoded `Categories`,
+  so filters and aggregates run vectorized instead of looping over models.
+- Frames are built from any iterable of entries: a `HarLog`, a
+  `CompactHarLog`, or `iter_entries` for files too large to parse whole.
+- Column names are the dotted paths of the fields, as used by `flatten`
+  and `by_field`.
+"""
+
+from datetime import datetime, timezone
+from itertools import islice
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "HarFrame requires the 'numpy' package (pip install hario-core[numpy])"
+    ) from exc
+
+from hario_core.parse.har_parser import iter_entries
+from hario_core.parse.interfaces import JsonSource
+from hario_core.parse.stream import CHUNK_SIZE
+
+# Number of entries read into Python lists before they become arrays.
+ROWS_PER_CHUNK = 1 << 16
+
+# Float columns; missing values are NaN. HAR's -1 ("not applicable") is
+# kept as is.
+FLOAT_COLUMNS = (
+    "time",
+    "timings.blocked",
+    "timings.dns",
+    "timings.connect",
+    "timings.send",
+    "timings.wait",
+    "timings.receive",
+    "timings.ssl",
+)
+
+# Integer columns; missing values are -1, as HAR does for unknown sizes.
+INT_COLUMNS = (
+    "request.headersSize",
+    "request.bodySize",
+    "response.status",
+    "response.headersSize",
+    "response.bodySize",
+    "response.content.size",
+    "response.transferSize",
+)
+
+# Dictionary-encoded string columns.
+CATEGORY_COLUMNS = (
+    "pageref",
+    "request.method",
+    "request.httpVersion",
+    "response.statusText",
+    "response.httpVersion",
+    "response.content.mimeType",
+    "serverIPAddress",
+    "resourceType",
+    "priority",
+)
+
+# `startedDateTime` as int64 nanoseconds since the Unix epoch (UTC).
+DATETIME_COLUMN = "startedDateTime"
+
+# Columns of entry extensions (DevTools); missing on other entries.
+OPTIONAL_COLUMNS = frozenset({"response.transferSize", "resourceType", "priority"})
+
+COLUMNS = (DATETIME_COLUMN,) + FLOAT_COLUMNS + INT_COLUMNS + CATEGORY_COLUMNS
+
+_DTYPES = dict(
+    {name: np.float64 for name in FLOAT_COLUMNS},
+    **{name: np.int64 for name in INT_COLUMNS + (DATETIME_COLUMN,)},
+    **{name: np.int32 for name in CATEGORY_COLUMNS},
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+
+class Categories:
+    """
+    Dictionary-encoded strings: `codes[i]` indexes `values`, -1 is None.
+
+    Comparing with a string gives a boolean mask, so
+    `frame["request.method"] == "GET"` filters without decoding.
+
+    Args:
+        codes: np.ndarray
+            int32 code of every row.
+        values: Sequence[str]
+            The distinct strings, in order of their codes.
+    """
+
+    __slots__ = ("codes", "values", "_lookup")
+
+    def __init__(self, codes: "np.ndarray[Any, Any]", values: Sequence[str]):
+        self.codes = codes
+        self.values = list(values)
+        self._lookup = {value: code for code, value in enumerate(self.values)}
+
+    @classmethod
+    def encode(cls, strings: Iterable[Optional[str]]) -> "Categories":
+        """Encodes *strings*, giving codes in order of first occurrence."""
+        lookup: Dict[Optional[str], int] = {None: -1}
+        return cls(_encode(strings, lookup), _lookup_values(lookup))
+
+    def code(self, value: Optional[str]) -> int:
+        """Returns the code of *value*; -1 for None, -2 if it never occurs."""
+        if value is None:
+            return -1
+        return self._lookup.get(value, -2)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __eq__(self, value: object) -> Any:
+        if isinstance(value, Categories):
+            return NotImplemented
+        return self.codes == self.code(value)  # type: ignore[arg-type]
+
+    def __ne__(self, value: object) -> Any:
+        if isinstance(value, Categories):
+            return NotImplemented
+        return self.codes != self.code(value)  # type: ignore[arg-type]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def isin(self, values: Iterable[Optional[str]]) -> "np.ndarray[Any, Any]":
+        """Returns the mask of rows holding any of *values*."""
+        return np.isin(self.codes, [self.code(value) for value in values])
+
+    def __getitem__(self, rows: Any) -> "Categories":
+        selected = Categories.__new__(Categories)
+        selected.codes = self.codes[rows]
+        selected.values = self.values
+        selected._lookup = self._lookup
+        return selected
+
+    def decode(self) -> List[Optional[str]]:
+        """Returns the strings of all rows."""
+        values: List[Optional[str]] = list(self.values) + [None]
+        return [values[code] for code in self.codes.tolist()]
+
+    def counts(self) -> Dict[Optional[str], int]:
+        """Returns the number of rows per distinct value, most common first."""
+        counts = np.bincount(self.codes + 1, minlength=len(self.values) + 1)
+        keys: List[Optional[str]] = [None] + list(self.values)
+        return {
+            keys[index]: int(counts[index])
+            for index in np.argsort(-counts, kind="stable")
+            if counts[index]
+        }
+
+    def __repr__(self) -> str:
+        return f"Categories({len(self)} rows, {len(self.values)} values)"
+
+
+def _encode(
+    strings: Iterable[Optional[str]], lookup: Dict[Optional[str], int]
+) -> "np.ndarray[Any, Any]":
+    """Codes of *strings*, adding new strings to *lookup* (None is -1)."""
+    return np.fromiter(
+        (lookup.setdefault(value, len(lookup) - 1) for value in strings),
+        dtype=np.int32,
+    )
+
+
+def _lookup_values(lookup: Dict[Optional[str], int]) -> List[str]:
+    return [value for value in lookup if value is not None]
+
+
+Column = Union["np.ndarray[Any, Any]", Categories]
+
+# Selections of rows: a boolean mask, row numbers or a slice.
+Rows = Union["np.ndarray[Any, Any]", Sequence[int], slice]
+
+# Aggregates of `HarFrame.aggregate`.
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+def _epoch_ns(value: Any) -> int:
+    if not isinstance(value, datetime):
+        return int(np.iinfo(np.int64).min)
+    delta = value - (_EPOCH if value.tzinfo is not None else _EPOCH_NAIVE)
+    seconds = delta.days * 86400 + delta.seconds
+    return seconds * 1_000_000_000 + delta.microseconds * 1000
+
+
+def _row_getter() -> Callable[[Any], Tuple[Any, ...]]:
+    """Returns a function reading every column of an entry at once."""
+    required = attrgetter(*(name for name in COLUMNS if name not in OPTIONAL_COLUMNS))
+    # Inserted in order of their position, so earlier inserts don't shift them.
+    optional = sorted(
+        (COLUMNS.index(name), name.split(".")) for name in OPTIONAL_COLUMNS
+    )
+
+    def row(entry: Any) -> Tuple[Any, ...]:
+        values = list(required(entry))
+        for index, path in optional:
+            value = entry
+            for part in path:
+                value = getattr(value, part, None)
+            values.insert(index, value)
+        return tuple(values)
+
+    return row
+
+
+def _chunk_columns(
+    rows: List[Tuple[Any, ...]], lookups: Dict[str, Dict[Optional[str], int]]
+) -> Dict[str, "np.ndarray[Any, Any]"]:
+    """Turns *rows* into arrays, strings into codes of their *lookups*."""
+    columns: Dict[str, "np.ndarray[Any, Any]"] = {}
+    for name, values in zip(COLUMNS, zip(*rows)):
+        if name in FLOAT_COLUMNS:
+            columns[name] = np.array(values, dtype=np.float64)
+        elif name in INT_COLUMNS:
+            columns[name] = np.array(
+                [-1 if value is None else value for value in values], dtype=np.int64
+            )
+        elif name == DATETIME_COLUMN:
+            columns[name] = np.fromiter(map(_epoch_ns, values), dtype=np.int64)
+        else:
+            columns[name] = _encode(values, lookups[name])
+    return columns
+
+
+class HarFrame:
+    """
+    Columns of HAR entries as NumPy arrays, one row per entry.
+
+    Index with a column name to get its array (or `Categories`), with a
+    boolean mask or an array of row numbers to get the selected rows as a
+    new frame:
+
+        slow = frame[(frame["time"] > 1000) & (frame["request.method"] == "GET")]
+        slow.aggregate("response.content.mimeType", "response.content.size")
+
+    Args:
+        columns: Dict[str, Column]
+            Arrays (or `Categories`) of the same length, by column name.
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns of a HarFrame must have the same length")
+        self._columns = dict(columns)
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_entries(
+        cls, entries: Iterable[Any], rows_per_chunk: int = ROWS_PER_CHUNK
+    ) -> "HarFrame":
+        """
+        Builds a frame from *entries*: `Entry` models (of any registered
+        model) or `CompactEntry` records. Entries are consumed
+        *rows_per_chunk* at a time, so a streaming source is never held
+        whole.
+        """
+        row = _row_getter()
+        lookups: Dict[str, Dict[Optional[str], int]] = {
+            name: {None: -1} for name in CATEGORY_COLUMNS
+        }
+        chunks: List[Dict[str, "np.ndarray[Any, Any]"]] = []
+        iterator: Iterator[Any] = iter(entries)
+        while True:
+            rows = [row(entry) for entry in islice(iterator, rows_per_chunk)]
+            if not rows:
+                break
+            chunks.append(_chunk_columns(rows, lookups))
+        columns: Dict[str, Column] = {}
+        for name in COLUMNS:
+            if chunks:
+                array = np.concatenate([chunk[name] for chunk in chunks])
+            else:
+                array = np.empty(0, dtype=_DTYPES[name])
+            if name in CATEGORY_COLUMNS:
+                columns[name] = Categories(array, _lookup_values(lookups[name]))
+            else:
+                columns[name] = array
+        return cls(columns)
+
+    @classmethod
+    def from_log(cls, har_log: Any) -> "HarFrame":
+        """Builds a frame from the entries of a `HarLog` or `CompactHarLog`."""
+        return cls.from_entries(har_log.entries)
+
+    @classmethod
+    def read(cls, src: JsonSource, chunk_size: int = CHUNK_SIZE) -> "HarFrame":
+        """
+        Builds a frame from *src* with `iter_entries`, without ever holding
+        more than a chunk of entries in memory.
+
+        Raises `ValueError` if the JSON is invalid HAR.
+        """
+        return cls.from_entries(iter_entries(src, chunk_size=chunk_size))
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    # Columns are typed as Any: an array or `Categories` depending on the name.
+    @overload
+    def __getitem__(self, key: str) -> Any: ...
+
+    @overload
+    def __getitem__(self, key: Rows) -> "HarFrame": ...
+
+    def __getitem__(self, key: Union[str, Rows]) -> Any:
+        if isinstance(key, str):
+            return self._columns[key]
+        return HarFrame({name: column[key] for name, column in self._columns.items()})
+
+    def datetimes(self) -> "np.ndarray[Any, Any]":
+        """Returns `startedDateTime` as a `datetime64[ns]` (UTC) array."""
+        started = self._columns[DATETIME_COLUMN]
+        assert not isinstance(started, Categories)
+        return started.view("datetime64[ns]")
+
+    def aggregate(
+        self, by: str, column: Optional[str] = None, func: str = "sum"
+    ) -> Dict[Optional[str], float]:
+        """
+        Aggregates *column* for every value of the category column *by*.
+
+        Args:
+            by: str
+                Name of a category column, e.g. `"response.content.mimeType"`.
+            column: Optional[str]
+                Name of a numeric column; not needed for `"count"`.
+            func: str
+                One of `AGGREGATES`. Missing values (NaN, or -1 in
+                `INT_COLUMNS`) are left out of `"sum"`, `"mean"`, `"min"`
+                and `"max"`.
+
+        Returns:
+            Dict[Optional[str], float]: the aggregate per value of *by*,
+            values without rows left out.
+        """
+        if func not in AGGREGATES:
+            raise ValueError(
+                f"Unknown aggregate {func!r}, expected one of {AGGREGATES}"
+            )
+        groups = self._columns[by]
+        if not isinstance(groups, Categories):
+            raise ValueError(f"Column {by!r} is not a category column")
+        codes = groups.codes + 1
+        size = len(groups.values) + 1
+        keys: List[Optional[str]] = [None] + list(groups.values)
+        if func == "count" or column is None:
+            if func != "count":
+                raise ValueError(f"Aggregate {func!r} requires a column")
+            counts = np.bincount(codes, minlength=size)
+            return {keys[i]: float(counts[i]) for i in range(size) if counts[i]}
+        numbers = self._columns[column]
+        if isinstance(numbers, Categories):
+            raise ValueError(f"Column {column!r} is not numeric")
+        values = numbers.astype(np.float64)
+        present = numbers != -1 if column in INT_COLUMNS else ~np.isnan(values)
+        codes, values = codes[present], values[present]
+        counts = np.bincount(codes, minlength=size)
+        result: "np.ndarray[Any, Any]"
+        if func in ("sum", "mean"):
+            result = np.bincount(codes, weights=values, minlength=size)
+            if func == "mean":
+                result = result / np.maximum(counts, 1)
+        else:
+            fill = np.inf if func == "min" else -np.inf
+            result = np.full(size, fill)
+            ufunc = np.minimum if func == "min" else np.maximum
+            ufunc.at(result, codes, values)
+        return {keys[i]: float(result[i]) for i in range(size) if counts[i]}
+
+    def __repr__(self) -> str:
+        return f"HarFrame({self._length} rows, {len(self._columns)} columns)"
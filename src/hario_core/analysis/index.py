@@ -0,0 +1,234 @@
+"""
+Secondary in-memory indexes over the entries of a HAR log.
+
+- `HarIndex` is built once per log and maps host, status class, MIME type,
+  pageref and DevTools connection id and resource type to postings lists
+  (sorted entry positions), and keeps the entries sorted by
+  `startedDateTime`.
+- `query` starts from the shortest postings list of the criteria and
+  checks the remaining ones against per-entry code arrays, so the cost
+  depends on the number of candidates, not on the size of the log.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from hario_core.analysis.frame import Categories, _encode, _epoch_ns, _lookup_values
+
+# Indexed keys, in the order of the `query` arguments.
+INDEX_KEYS = (
+    "host",
+    "status_class",
+    "mimeType",
+    "pageref",
+    "connectionId",
+    "resourceType",
+)
+
+# A value to match, or any of several values.
+Criterion = Union[Any, Iterable[Any]]
+
+
+def _host(url: str) -> Optional[str]:
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        return None
+
+
+def _mime_type(mime_type: Optional[str]) -> Optional[str]:
+    """`text/html; charset=utf-8` -> `text/html`."""
+    if not mime_type:
+        return None
+    return mime_type.split(";", 1)[0].strip().lower() or None
+
+
+def _normalize(key: str, value: Any) -> Any:
+    """Turns a criterion value into the form *key* is indexed in."""
+    if key == "mimeType":
+        return _mime_type(value)
+    if key == "host" and isinstance(value, str):
+        # `urlsplit().hostname` is lowercase.
+        return value.lower()
+    return value
+
+
+def _key_values(entry: Any) -> Tuple[Any, ...]:
+    response = entry.response
+    return (
+        _host(entry.request.url),
+        response.status // 100,
+        _mime_type(response.content.mimeType),
+        entry.pageref,
+        getattr(entry, "connectionId", None),
+        getattr(entry, "resourceType", None),
+    )
+
+
+class HarIndex:
+    """
+    Hash indexes and a sorted time index over *entries*.
+
+    Args:
+        entries: Sequence[Any]
+            `Entry` models or `CompactEntry` records, e.g. `har_log.entries`.
+            Query results are positions in this sequence.
+    """
+
+    def __init__(self, entries: Sequence[Any]):
+        self.entries = entries
+        lookups: List[Dict[Any, int]] = [{None: -1} for _ in INDEX_KEYS]
+        rows = [_key_values(entry) for entry in entries]
+        columns = zip(*rows) if rows else [()] * len(INDEX_KEYS)
+        self._codes: Dict[str, Categories] = {}
+        self._postings: Dict[str, List["np.ndarray[Any, Any]"]] = {}
+        for key, lookup, values in zip(INDEX_KEYS, lookups, columns):
+            codes = _encode(values, lookup)
+            self._codes[key] = Categories(codes, _lookup_values(lookup))
+            # Positions grouped by code, ascending within every group.
+            order = np.argsort(codes, kind="stable").astype(np.int64)
+            counts = np.bincount(codes + 1, minlength=len(lookup))
+            self._postings[key] = np.split(order, np.cumsum(counts)[:-1])[1:]
+        self._started = np.fromiter(
+            (_epoch_ns(entry.startedDateTime) for entry in entries),
+            dtype=np.int64,
+            count=len(entries),
+        )
+        self._by_time = np.argsort(self._started, kind="stable")
+        self._sorted_started = self._started[self._by_time]
+
+    @classmethod
+    def from_log(cls, har_log: Any) -> "HarIndex":
+        """Indexes the entries of a `HarLog` or `CompactHarLog`."""
+        return cls(har_log.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def values(self, key: str) -> Dict[Any, int]:
+        """Returns the number of entries per value of *key*."""
+        return {
+            value: len(postings)
+            for value, postings in zip(self._codes[key].values, self._postings[key])
+        }
+
+    def lookup(self, key: str, value: Any) -> "np.ndarray[Any, Any]":
+        """Returns the sorted positions of the entries whose *key* is *value*."""
+        code = self._codes[key].code(_normalize(key, value))
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        return self._postings[key][code]
+
+    def _codes_of(self, key: str, criterion: Criterion) -> List[int]:
+        values = (
+            criterion
+            if isinstance(criterion, Iterable)
+            and not isinstance(criterion, (str, bytes))
+            else [criterion]
+        )
+        codes = [self._codes[key].code(_normalize(key, value)) for value in values]
+        return [code for code in codes if code >= 0]
+
+    def _time_range(
+        self, started_after: Optional[datetime], started_before: Optional[datetime]
+    ) -> Tuple[int, int]:
+        """Index range of `_sorted_started` within the given bounds."""
+        low, high = 0, len(self._sorted_started)
+        if started_after is not None:
+            low = int(
+                np.searchsorted(self._sorted_started, _epoch_ns(started_after), "left")
+            )
+        if started_before is not None:
+            high = int(
+                np.searchsorted(self._sorted_started, _epoch_ns(started_before), "left")
+            )
+        return low, max(low, high)
+
+    def query(
+        self,
+        host: Optional[Criterion] = None,
+        status_class: Optional[Criterion] = None,
+        mimeType: Optional[Criterion] = None,
+        pageref: Optional[Criterion] = None,
+        connectionId: Optional[Criterion] = None,
+        resourceType: Optional[Criterion] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+    ) -> "np.ndarray[Any, Any]":
+        """
+        Returns the sorted positions of the entries matching every given
+        criterion; an iterable of values (other than a string), e.g. a
+        list or a `range`, matches any of them.
+
+        Args:
+            host: Optional[Criterion]
+                Host name of the request URL, without port,
+                case-insensitive.
+            status_class: Optional[Criterion]
+                First digit of the response status, e.g. 5 for 5xx.
+            mimeType: Optional[Criterion]
+                `response.content.mimeType` without parameters
+                (`text/html` matches `text/html; charset=utf-8`).
+            pageref: Optional[Criterion]
+                The entry's page.
+            connectionId: Optional[Criterion]
+                DevTools `_connectionId`.
+            resourceType: Optional[Criterion]
+                DevTools `_resourceType`.
+            started_after: Optional[datetime]
+                Only entries started at or after this time (naive times
+                are UTC).
+            started_before: Optional[datetime]
+                Only entries started before this time.
+
+        Returns:
+            np.ndarray: int64 positions in `entries`.
+        """
+        given = {
+            key: criterion
+            for key, criterion in zip(
+                INDEX_KEYS,
+                (host, status_class, mimeType, pageref, connectionId, resourceType),
+            )
+            if criterion is not None
+        }
+        allowed = {key: self._codes_of(key, value) for key, value in given.items()}
+        timed = started_after is not None or started_before is not None
+        low, high = self._time_range(started_after, started_before)
+        if not allowed:
+            if not timed:
+                return np.arange(len(self), dtype=np.int64)
+            return np.sort(self._by_time[low:high])
+        sizes = {
+            key: sum(len(self._postings[key][code]) for code in codes)
+            for key, codes in allowed.items()
+        }
+        first = min(sizes, key=sizes.__getitem__)
+        if timed and high - low < sizes[first]:
+            candidates = np.sort(self._by_time[low:high])
+            timed = False
+        else:
+            postings = [self._postings[first][code] for code in allowed.pop(first)]
+            if not postings:
+                return np.empty(0, dtype=np.int64)
+            candidates = (
+                postings[0] if len(postings) == 1 else np.sort(np.concatenate(postings))
+            )
+        for key, codes in allowed.items():
+            candidates = candidates[np.isin(self._codes[key].codes[candidates], codes)]
+        if timed:
+            started = self._started[candidates]
+            mask = np.ones(len(candidates), dtype=bool)
+            if started_after is not None:
+                mask &= started >= _epoch_ns(started_after)
+            if started_before is not None:
+                mask &= started < _epoch_ns(started_before)
+            candidates = candidates[mask]
+        return candidates
+
+    def find(self, **criteria: Any) -> List[Any]:
+        """Returns the entries matching *criteria* (see `query`), in order."""
+        return [self.entries[position] for position in self.query(**criteria)]
@@ -1,8 +1,18 @@
+from .bodies import BodyRef, BodyStore
+from .compact import CompactDevToolsEntry, CompactEntry, CompactHarLog
 from .extensions.chrome_devtools import DevToolsEntry
 from .har_1_2 import Entry, HarLog
+from .lazy import LazyEntries, LazyHarLog
 
 __all__ = [
     "Entry",
     "HarLog",
     "DevToolsEntry",
+    "LazyHarLog",
+    "LazyEntries",
+    "BodyRef",
+    "BodyStore",
+    "CompactHarLog",
+    "CompactEntry",
+    "CompactDevToolsEntry",
 ]
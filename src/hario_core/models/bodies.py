@@ -0,0 +1,158 @@
+"""
+Out-of-line storage of large request and response bodies.
+
+- `BodyStore` keeps bodies in a content-addressed directory, one file per
+  distinct body named by its hash, so identical bodies are stored once.
+- `BodyRef` takes the place of the text in `Content.text` and
+  `PostData.text`; the body is read from the store only when accessed.
+- Serialization reads the body back, so dumps are the same as without a
+  store.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Set, Union
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from hario_core.models.compact import CompactEntry
+    from hario_core.models.har_1_2 import Entry
+
+# Bodies shorter than this (in characters) stay in the model.
+DEFAULT_THRESHOLD = 8 << 10
+
+
+class BodyRef:
+    """
+    A body kept in a `BodyStore`.
+
+    Use `read()` (or `str()`) to get the text. References compare equal
+    when they stand for the same text; a reference does not compare equal to
+    a `str`, compare `read()` instead.
+    """
+
+    __slots__ = ("store", "digest", "size")
+
+    def __init__(self, store: "BodyStore", digest: str, size: int):
+        self.store = store
+        self.digest = digest
+        # Length of the text in characters.
+        self.size = size
+
+    def read(self) -> str:
+        """Reads the body from the store."""
+        return self.store.get(self.digest)
+
+    def __str__(self) -> str:
+        return self.read()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BodyRef):
+            return self.digest == other.digest
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f"BodyRef({self.digest!r}, size={self.size})"
+
+    def __reduce__(self) -> Any:
+        return BodyRef, (self.store, self.digest, self.size)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                BodyRef.read, return_schema=core_schema.str_schema()
+            ),
+        )
+
+
+class BodyStore:
+    """
+    Content-addressed on-disk store of HAR bodies.
+
+    Pass an instance to `parse(..., bodies=...)` to move bodies of at least
+    *threshold* characters out of the parsed models. The directory can be
+    shared by many HAR files and processes; a body is written once per
+    distinct content.
+
+    Args:
+        directory: Union[str, Path]
+            Where bodies are stored, created if missing.
+        threshold: int
+            Minimum length of a body, in characters, to be stored.
+    """
+
+    def __init__(self, directory: Union[str, Path], threshold: int = DEFAULT_THRESHOLD):
+        self.directory = Path(directory)
+        self.threshold = threshold
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._known: Set[str] = set()
+
+    def __getstate__(self) -> Any:
+        # Other processes check the directory for bodies they don't know.
+        return {"directory": self.directory, "threshold": self.threshold}
+
+    def __setstate__(self, state: Any) -> None:
+        self.__dict__.update(state, _known=set())
+
+    def _path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / digest[2:]
+
+    def put(self, text: str) -> BodyRef:
+        """Stores *text* (unless already stored) and returns its reference."""
+        data = text.encode("utf-8", "surrogatepass")
+        digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        if digest not in self._known:
+            path = self._path(digest)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as fh:
+                        fh.write(data)
+                    os.replace(tmp_name, path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+            self._known.add(digest)
+        return BodyRef(self, digest, len(text))
+
+    def get(self, digest: str) -> str:
+        """Returns the body stored under *digest*."""
+        return self._path(digest).read_bytes().decode("utf-8", "surrogatepass")
+
+    def offload(self, entries: Iterable[Union["Entry", "CompactEntry"]]) -> int:
+        """
+        Replaces response and request bodies of *entries* of at least
+        `threshold` characters with references into the store.
+
+        Returns the number of bodies replaced.
+        """
+        count = 0
+        for entry in entries:
+            content = entry.response.content
+            if isinstance(content.text, str) and len(content.text) >= self.threshold:
+                content.text = self.put(content.text)
+                count += 1
+            post_data = entry.request.postData
+            if (
+                post_data is not None
+                and isinstance(post_data.text, str)
+                and len(post_data.text) >= self.threshold
+            ):
+                post_data.text = self.put(post_data.text)
+                count += 1
+        return count
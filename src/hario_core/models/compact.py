@@ -0,0 +1,446 @@
+"""
+Compact, slots-based records of parsed HAR logs.
+
+- `parse(..., compact=True)` validates entries with the usual models and
+  keeps them as these records instead, so large logs can stay in memory
+  for analysis.
+- Records have `__slots__` named like the model fields and nothing else:
+  no instance dict, no fields-set or extras bookkeeping. Headers and query
+  strings are tuples of `(name, value)` pairs rather than one model each.
+- `to_dict()` gives the dict of `model_dump()` (the input of
+  `Pipeline.process`), except that header and query string comments are
+  not kept.
+"""
+
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from hario_core.models.bodies import BodyRef
+from hario_core.models.extensions.chrome_devtools import (
+    DevToolsEntry,
+    DevToolsRequest,
+    DevToolsResponse,
+    DevToolsTimings,
+)
+from hario_core.models.har_1_2 import (
+    Content,
+    Cookie,
+    Entry,
+    HarLog,
+    PostData,
+    Request,
+    Response,
+    Timings,
+)
+
+R = TypeVar("R", bound="Record")
+
+# (name, value) of a header or query string parameter.
+Pair = Tuple[str, str]
+
+
+class Record:
+    """
+    Base of the compact records.
+
+    Subclasses declare their fields in `__slots__`; fields holding nested
+    models are listed in `_convert` with the function turning the model into
+    its compact form. A record with an `extra` slot keeps the model's extra
+    keys (and the fields of custom model subclasses) there.
+    """
+
+    __slots__ = ()
+
+    # Names of the slots of the class and its bases, but `extra`.
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _has_extra: ClassVar[bool] = False
+    _convert: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        slots = tuple(cls.__dict__.get("__slots__", ()))
+        cls._fields = cls._fields + tuple(name for name in slots if name != "extra")
+        cls._has_extra = cls._has_extra or "extra" in slots
+
+    def __init__(self, **values: Any):
+        for name in self._fields:
+            setattr(self, name, values.pop(name, None))
+        if self._has_extra:
+            setattr(self, "extra", values or None)
+        elif values:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {list(values)}")
+
+    @classmethod
+    def from_model(cls: type[R], model: BaseModel) -> R:
+        """Copies *model* into a new record, converting nested models."""
+        record = cls.__new__(cls)
+        convert = cls._convert
+        for name in cls._fields:
+            value = getattr(model, name, None)
+            if value is not None and name in convert:
+                value = convert[name](value)
+            setattr(record, name, value)
+        if cls._has_extra:
+            setattr(record, "extra", _extra(cls, model))
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record as a dict shaped like `model_dump()`."""
+        data = {name: _plain(getattr(self, name)) for name in self._fields}
+        extra = getattr(self, "extra", None)
+        if extra:
+            data.update(extra)
+        return data
+
+    def _state(self) -> Tuple[Any, ...]:
+        extra = (getattr(self, "extra"),) if self._has_extra else ()
+        return tuple(getattr(self, name) for name in self._fields) + extra
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        assert isinstance(other, Record)
+        return self._state() == other._state()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self._state()
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        names = self._fields + (("extra",) if self._has_extra else ())
+        for name, value in zip(names, state):
+            setattr(self, name, value)
+
+
+def _extra(cls: type[Record], model: BaseModel) -> Optional[Dict[str, Any]]:
+    extra = dict(model.__pydantic_extra__ or {})
+    unknown = _unknown_fields(cls, type(model))
+    if unknown:
+        extra.update(model.model_dump(include=set(unknown)))
+    return extra or None
+
+
+@lru_cache(maxsize=None)
+def _unknown_fields(cls: type[Record], model_cls: type[BaseModel]) -> FrozenSet[str]:
+    """Fields of *model_cls* (e.g. a custom entry model) *cls* has no slot for."""
+    return frozenset(model_cls.model_fields) - frozenset(cls._fields)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        # Headers and query strings are (name, value) pairs, cookies records.
+        return [
+            (
+                {"name": item[0], "value": item[1], "comment": None}
+                if isinstance(item, tuple)
+                else _plain(item)
+            )
+            for item in value
+        ]
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, BodyRef):
+        return value.read()
+    return value
+
+
+def compact(model: BaseModel) -> Any:
+    """Returns the compact record of *model* (e.g. an `Entry`)."""
+    return compact_type(type(model)).from_model(model)
+
+
+@lru_cache(maxsize=None)
+def compact_type(model_cls: type[BaseModel]) -> type[Record]:
+    """
+    Returns the record class for *model_cls*, or for its nearest base with
+    one, so custom entry models map to `CompactEntry` or
+    `CompactDevToolsEntry`.
+    """
+    for base in model_cls.__mro__:
+        if base in COMPACT_TYPES:
+            return COMPACT_TYPES[base]
+    raise TypeError(f"No compact record for {model_cls.__name__}")
+
+
+def _pairs(items: List[Any]) -> Tuple[Pair, ...]:
+    return tuple((item.name, item.value) for item in items)
+
+
+def _records(items: List[BaseModel]) -> Tuple[Record, ...]:
+    return tuple(compact(item) for item in items)
+
+
+def _dump(model: BaseModel) -> Dict[str, Any]:
+    return model.model_dump()
+
+
+def _dump_all(items: List[BaseModel]) -> List[Dict[str, Any]]:
+    return [item.model_dump() for item in items]
+
+
+class CompactCookie(Record):
+    __slots__ = (
+        "name",
+        "value",
+        "path",
+        "domain",
+        "expires",
+        "httpOnly",
+        "secure",
+        "sameSite",
+        "comment",
+    )
+
+    name: str
+    value: str
+    path: Optional[str]
+    domain: Optional[str]
+    expires: Optional[str]
+    httpOnly: Optional[bool]
+    secure: Optional[bool]
+    sameSite: Optional[str]
+    comment: Optional[str]
+
+
+class CompactPostData(Record):
+    __slots__ = ("mimeType", "params", "text", "comment")
+    _convert = {"params": _dump_all}
+
+    mimeType: str
+    params: Optional[List[Dict[str, Any]]]
+    text: Union[str, BodyRef]
+    comment: Optional[str]
+
+
+class CompactContent(Record):
+    __slots__ = ("size", "compression", "mimeType", "text", "encoding", "comment")
+
+    size: int
+    compression: Optional[int]
+    mimeType: str
+    text: Optional[Union[str, BodyRef]]
+    encoding: Optional[str]
+    comment: Optional[str]
+
+
+class CompactRequest(Record):
+    __slots__ = (
+        "method",
+        "url",
+        "httpVersion",
+        "headers",
+        "queryString",
+        "cookies",
+        "headersSize",
+        "bodySize",
+        "postData",
+        "comment",
+    )
+    _convert = {
+        "headers": _pairs,
+        "queryString": _pairs,
+        "cookies": _records,
+        "postData": compact,
+    }
+
+    method: str
+    url: str
+    httpVersion: str
+    headers: Tuple[Pair, ...]
+    queryString: Tuple[Pair, ...]
+    cookies: Tuple[CompactCookie, ...]
+    headersSize: int
+    bodySize: int
+    postData: Optional[CompactPostData]
+    comment: Optional[str]
+
+
+class CompactResponse(Record):
+    __slots__ = (
+        "status",
+        "statusText",
+        "httpVersion",
+        "headers",
+        "cookies",
+        "content",
+        "redirectURL",
+        "headersSize",
+        "bodySize",
+        "comment",
+    )
+    _convert = {"headers": _pairs, "cookies": _records, "content": compact}
+
+    status: int
+    statusText: str
+    httpVersion: str
+    headers: Tuple[Pair, ...]
+    cookies: Tuple[CompactCookie, ...]
+    content: CompactContent
+    redirectURL: str
+    headersSize: int
+    bodySize: int
+    comment: Optional[str]
+
+
+class CompactTimings(Record):
+    __slots__ = (
+        "blocked",
+        "dns",
+        "connect",
+        "send",
+        "wait",
+        "receive",
+        "ssl",
+        "comment",
+    )
+
+    blocked: Optional[float]
+    dns: Optional[float]
+    connect: Optional[float]
+    send: float
+    wait: float
+    receive: float
+    ssl: Optional[float]
+    comment: Optional[str]
+
+
+class CompactEntry(Record):
+    """Compact record of an `Entry`; extra keys of the entry are in `extra`."""
+
+    __slots__ = (
+        "pageref",
+        "startedDateTime",
+        "time",
+        "request",
+        "response",
+        "cache",
+        "timings",
+        "serverIPAddress",
+        "connection",
+        "comment",
+        "extra",
+    )
+    _convert = {"request": compact, "response": compact, "timings": compact}
+
+    pageref: Optional[str]
+    startedDateTime: Any
+    time: float
+    request: CompactRequest
+    response: CompactResponse
+    cache: Dict[str, Any]
+    timings: CompactTimings
+    serverIPAddress: Optional[str]
+    connection: Optional[str]
+    comment: Optional[str]
+    extra: Optional[Dict[str, Any]]
+
+
+class CompactDevToolsTimings(CompactTimings):
+    __slots__ = ("blocked_queueing", "push_start", "push_end")
+
+    blocked_queueing: Optional[float]
+    push_start: Optional[float]
+    push_end: Optional[float]
+
+
+class CompactDevToolsRequest(CompactRequest):
+    __slots__ = ("requestId",)
+
+    requestId: Optional[str]
+
+
+class CompactDevToolsResponse(CompactResponse):
+    __slots__ = (
+        "transferSize",
+        "error",
+        "fromDiskCache",
+        "fromServiceWorker",
+        "fromPrefetchCache",
+    )
+
+    transferSize: Optional[int]
+    error: Optional[str]
+    fromDiskCache: Optional[bool]
+    fromServiceWorker: Optional[bool]
+    fromPrefetchCache: Optional[bool]
+
+
+class CompactDevToolsEntry(CompactEntry):
+    """Compact record of a `DevToolsEntry`."""
+
+    __slots__ = (
+        "initiator",
+        "priority",
+        "resourceType",
+        "connectionId",
+        "webSocketMessages",
+    )
+    _convert = dict(CompactEntry._convert, initiator=_dump, webSocketMessages=_dump_all)
+
+    initiator: Optional[Dict[str, Any]]
+    priority: Optional[str]
+    resourceType: str
+    connectionId: Optional[str]
+    webSocketMessages: Optional[List[Dict[str, Any]]]
+
+
+class CompactHarLog(Record):
+    """
+    A HAR log whose entries are compact records.
+
+    Everything but the entries is kept as plain dicts.
+    """
+
+    __slots__ = ("version", "creator", "browser", "pages", "entries", "extra")
+    _convert = {"creator": _dump, "browser": _dump, "pages": _dump_all}
+
+    version: str
+    creator: Dict[str, Any]
+    browser: Optional[Dict[str, Any]]
+    pages: List[Dict[str, Any]]
+    entries: List[CompactEntry]
+    extra: Optional[Dict[str, Any]]
+
+    @classmethod
+    def from_log(cls, log: HarLog, entries: List[CompactEntry]) -> "CompactHarLog":
+        """Copies everything but the entries of *log*, using *entries*."""
+        har_log = cls.from_model(log.model_copy(update={"entries": []}))
+        har_log.entries = entries
+        return har_log
+
+
+# Record classes of the models, looked up along the MRO of custom models.
+COMPACT_TYPES: Dict[type[BaseModel], type[Record]] = {
+    Cookie: CompactCookie,
+    PostData: CompactPostData,
+    Content: CompactContent,
+    Request: CompactRequest,
+    Response: CompactResponse,
+    Timings: CompactTimings,
+    Entry: CompactEntry,
+    DevToolsTimings: CompactDevToolsTimings,
+    DevToolsRequest: CompactDevToolsRequest,
+    DevToolsResponse: CompactDevToolsResponse,
+    DevToolsEntry: CompactDevToolsEntry,
+    HarLog: CompactHarLog,
+}
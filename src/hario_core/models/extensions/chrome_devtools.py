@@ -7,14 +7,15 @@ from typing import List, Optional
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..har_1_2 import Entry, Request, Response, Timings
+from ..interning import Interned
 
 
 class DevToolsCallFrame(BaseModel):
     """DevTools call frame."""
 
-    functionName: str
-    scriptId: str
-    url: str
+    functionName: Interned
+    scriptId: Interned
+    url: Interned
     lineNumber: int
     columnNumber: int
     stack: Optional[DevToolsStackTrace] = None
@@ -30,7 +31,7 @@ class DevToolsStackTrace(BaseModel):
 class DevToolsInitiator(BaseModel):
     """DevTools initiator object."""
 
-    type: str
+    type: Interned
     stack: Optional[DevToolsStackTrace] = None
 
 
@@ -74,9 +75,9 @@ class DevToolsEntry(Entry):
     )
 
     initiator: Optional[DevToolsInitiator] = Field(None, alias="_initiator")
-    priority: Optional[str] = Field(None, alias="_priority")
-    resourceType: str = Field(alias="_resourceType")
-    connectionId: Optional[str] = Field(None, alias="_connectionId")
+    priority: Optional[Interned] = Field(None, alias="_priority")
+    resourceType: Interned = Field(alias="_resourceType")
+    connectionId: Optional[Interned] = Field(None, alias="_connectionId")
     webSocketMessages: Optional[List[DevToolsWebSocketMessage]] = Field(
         None, alias="_webSocketMessages"
     )
@@ -6,26 +6,29 @@ Only a subset of rarely‑used fields are omitted for brevity;
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SerializeAsAny
+
+from hario_core.models.bodies import BodyRef
+from hario_core.models.interning import Interned, InternedValue
 
 
 class Header(BaseModel):
-    name: str
-    value: str
+    name: Interned
+    value: InternedValue
     comment: Optional[str] = None
 
 
 class Cookie(BaseModel):
-    name: str
+    name: Interned
     value: str
-    path: Optional[str] = None
-    domain: Optional[str] = None
+    path: Optional[Interned] = None
+    domain: Optional[Interned] = None
     expires: Optional[str] = None
     httpOnly: Optional[bool] = None
     secure: Optional[bool] = None
-    sameSite: Optional[str] = Field(None, alias="sameSite")
+    sameSite: Optional[Interned] = Field(None, alias="sameSite")
     comment: Optional[str] = None
 
 
@@ -42,25 +45,27 @@ class PostParam(BaseModel):
 
 
 class PostData(BaseModel):
-    mimeType: str
+    mimeType: Interned
     params: Optional[List[PostParam]] = None
-    text: str
+    # A BodyRef when the body was moved to a BodyStore.
+    text: Union[str, BodyRef]
     comment: Optional[str] = None
 
 
 class Content(BaseModel):
     size: int
     compression: Optional[int] = None
-    mimeType: str
-    text: Optional[str] = None
-    encoding: Optional[str] = None
+    mimeType: Interned
+    # A BodyRef when the body was moved to a BodyStore.
+    text: Optional[Union[str, BodyRef]] = None
+    encoding: Optional[Interned] = None
     comment: Optional[str] = None
 
 
 class Request(BaseModel):
-    method: str
+    method: Interned
     url: str
-    httpVersion: str
+    httpVersion: Interned
     headers: List[Header]
     queryString: List[QueryString]
     cookies: List[Cookie]
@@ -72,8 +77,8 @@ class Request(BaseModel):
 
 class Response(BaseModel):
     status: int
-    statusText: str
-    httpVersion: str
+    statusText: Interned
+    httpVersion: Interned
     headers: List[Header]
     cookies: List[Cookie]
     content: Content
@@ -102,15 +107,15 @@ class Entry(BaseModel):
         populate_by_name=True,
     )
 
-    pageref: Optional[str] = None
+    pageref: Optional[Interned] = None
     startedDateTime: datetime
     time: float
     request: Request
     response: Response
     cache: Dict[str, Any]
     timings: Timings
-    serverIPAddress: Optional[str] = None
-    connection: Optional[str] = None
+    serverIPAddress: Optional[Interned] = None
+    connection: Optional[Interned] = None
     comment: Optional[str] = None
 
 
@@ -145,12 +150,6 @@ class HarLog(BaseModel):
     creator: Creator
     browser: Optional[Browser] = None
     pages: List[Page] = []
-    entries: List[Entry]
-
-    def model_dump(self: HarLog, **kwargs: Any) -> Dict[str, Any]:
-        dump = super().model_dump(**kwargs)
-        # manually serialize entries with the actual type
-        dump["entries"] = [
-            entry.model_dump(**kwargs) for entry in self.entries if entry is not None
-        ]
-        return dump
+    # Entries are serialized with their actual type (e.g. DevToolsEntry), so
+    # extension fields are kept in a single dump pass.
+    entries: List[SerializeAsAny[Entry]]
@@ -0,0 +1,96 @@
+"""
+Interning of low-cardinality strings in HAR models.
+
+- Header names and values, MIME types, HTTP versions, status texts and
+  similar fields repeat across entries; `Interned` fields share a single
+  string object per distinct value instead of one per occurrence.
+- Values validated from dicts (`validate`, lazy entries, `parse_entries`)
+  are interned here; values validated from JSON bytes are already shared
+  by pydantic-core's string cache (pydantic 2.7 or later), which is
+  cheaper than a Python call. That cache only holds strings of up to
+  `JSON_CACHE_MAX_LENGTH` characters, so header values (`InternedValue`),
+  where long repeated strings such as `user-agent` are common, are
+  interned here when longer.
+- The table is bounded and owned by this module, unlike `sys.intern`, so
+  unique values (dates, ETags) never pile up for the life of the process.
+"""
+
+from typing import Annotated, Any, Dict
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+# Longer strings are rarely repeated and are left alone.
+INTERN_MAX_LENGTH = 512
+
+# The table is emptied once it holds this many strings.
+INTERN_TABLE_SIZE = 1 << 16
+
+# Longest string shared by pydantic-core's string cache when decoding JSON.
+JSON_CACHE_MAX_LENGTH = 64
+
+_TABLE: Dict[str, str] = {}
+
+
+def intern(value: str) -> str:
+    """Returns the shared instance of *value*."""
+    if len(value) > INTERN_MAX_LENGTH:
+        return value
+    if len(_TABLE) >= INTERN_TABLE_SIZE:
+        _TABLE.clear()
+    return _TABLE.setdefault(value, value)
+
+
+def intern_long(value: str) -> str:
+    """Interns *value* if pydantic-core's string cache left it alone."""
+    return intern(value) if len(value) > JSON_CACHE_MAX_LENGTH else value
+
+
+def clear_interned() -> None:
+    """Empties the intern table, e.g. after a large batch of files."""
+    _TABLE.clear()
+
+
+class _InternPython:
+    """
+    Interns values validated from Python objects. Values validated from
+    JSON are already shared by pydantic-core's string cache, so they skip
+    the extra Python call.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        schema = handler(source)
+        return core_schema.json_or_python_schema(
+            json_schema=schema,
+            python_schema=core_schema.no_info_after_validator_function(intern, schema),
+        )
+
+
+class _InternValue:
+    """
+    Interns values validated from Python objects, and those validated from
+    JSON that are too long for pydantic-core's string cache.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        schema = handler(source)
+        return core_schema.json_or_python_schema(
+            json_schema=core_schema.no_info_after_validator_function(
+                intern_long, schema
+            ),
+            python_schema=core_schema.no_info_after_validator_function(intern, schema),
+        )
+
+
+# A string field whose values are shared between models.
+Interned = Annotated[str, _InternPython]
+
+# An `Interned` field whose values are often longer than pydantic-core's
+# string cache allows, e.g. header values.
+InternedValue = Annotated[str, _InternValue]
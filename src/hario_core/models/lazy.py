@@ -0,0 +1,100 @@
+"""Lazy HAR log whose entries are validated on first access."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Union, overload
+
+from pydantic import GetCoreSchemaHandler, ValidationError
+from pydantic_core import core_schema
+
+from .har_1_2 import Entry, HarLog
+
+# Number of validated entries kept by default.
+DEFAULT_CACHE_SIZE = 1024
+
+
+class LazyEntries(Sequence[Entry]):
+    """
+    Read-only sequence of HAR entries validated the first time they are
+    indexed or iterated.
+
+    The most recently used validated entries are kept in a small LRU cache,
+    so repeated access to the same entries does not re-validate them.
+
+    Args:
+        entries: List[Dict[str, Any]]
+            Raw (decoded, not validated) entry dicts.
+        selector: Callable[[Dict[str, Any]], type[Entry]]
+            Selects the Entry model for an entry; called once per entry
+            validation.
+        cache_size: int
+            Maximum number of validated entries kept in memory.
+    """
+
+    def __init__(
+        self,
+        entries: List[Dict[str, Any]],
+        selector: Callable[[Dict[str, Any]], type[Entry]],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self._raw = entries
+        self._selector = selector
+        self._cache_size = cache_size
+        self._cache: OrderedDict[int, Entry] = OrderedDict()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Entries are serialized as a list of their actual models.
+        return core_schema.is_instance_schema(
+            cls, serialization=core_schema.plain_serializer_function_ser_schema(list)
+        )
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> Entry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Entry]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Entry, List[Entry]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entry index out of range")
+        entry = self._cache.get(index)
+        if entry is not None:
+            self._cache.move_to_end(index)
+            return entry
+        entry = self._validate(index)
+        self._cache[index] = entry
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return entry
+
+    def __iter__(self) -> Iterator[Entry]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _validate(self, index: int) -> Entry:
+        raw = self._raw[index]
+        try:
+            return self._selector(raw).model_validate(raw)
+        except ValidationError as exc:
+            raise ValueError(f"Invalid HAR entry at index {index}") from exc
+
+
+class LazyHarLog(HarLog):
+    """
+    HarLog whose `entries` is a `LazyEntries` sequence.
+
+    Everything but the entries is validated eagerly.
+    """
+
+    entries: LazyEntries  # type: ignore[assignment]
@@ -1,13 +1,37 @@
-from .har_parser import entry_selector, parse, register_entry_model, validate
+from .aio import aiter_entries, aparse
+from .batch import parse_many
+from .cache import SnapshotCache
+from .har_parser import (
+    entry_selector,
+    iter_entries,
+    parse,
+    parse_entries,
+    register_entry_model,
+    validate,
+    validate_json,
+)
+from .index import IndexedHar, build_index, open_indexed
 from .interfaces import HarParser, JsonSource
+from .where import Where
 
 __all__ = [
     # Parsers and validators
     "parse",
+    "parse_many",
+    "parse_entries",
     "validate",
+    "validate_json",
+    "iter_entries",
+    "aparse",
+    "aiter_entries",
+    "open_indexed",
     # Utils
     "register_entry_model",
     "entry_selector",
+    "SnapshotCache",
+    "build_index",
+    "IndexedHar",
+    "Where",
     # Interfaces
     "HarParser",
     "JsonSource",
@@ -0,0 +1,208 @@
+"""
+Asyncio front-ends of the HAR parsers.
+
+- File reads, decompression and validation run in an executor, never on
+  the event loop.
+- A thread executor (the default) keeps the loop responsive, but still
+  shares the GIL with it; a `ProcessPoolExecutor` moves the CPU-bound
+  work out of the process, and parsed logs travel back as snapshots (see
+  `SnapshotCache`). Rebuilding the models still validates every entry in
+  the parent, so snapshots are loaded in slices of `BATCH_SIZE` entries
+  and the loop gets the GIL back between them.
+"""
+
+import asyncio
+import io
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+
+from pydantic import ValidationError
+
+from hario_core.models.har_1_2 import Entry, HarLog
+from hario_core.parse.cache import SnapshotCache, SnapshotReader, dump_snapshot
+from hario_core.parse.har_parser import (
+    ENTRY_MODEL_REGISTRY,
+    _validate_json_chunk,
+    iter_entries,
+    parse,
+)
+from hario_core.parse.interfaces import JsonSource
+from hario_core.parse.parallel import paused_gc
+from hario_core.parse.stream import BUFFER_TYPES, CHUNK_SIZE, open_scanner
+
+# Number of entries handed over from the executor at once by `aiter_entries`,
+# and loaded from a snapshot at once by `aparse`.
+BATCH_SIZE = 256
+
+
+def _parse_to_snapshot(
+    src: Union[str, Path, bytes],
+    pause_gc: bool,
+    cache: Optional[SnapshotCache],
+    section_size: int,
+) -> bytes:
+    with paused_gc():
+        har_log = parse(src, pause_gc=pause_gc, cache=cache)
+        buffer = io.BytesIO()
+        dump_snapshot(har_log, buffer, section_size)
+        return buffer.getvalue()
+
+
+def _read_all(src: JsonSource) -> Union[str, Path, bytes]:
+    """Turns *src* into something that can be sent to another process."""
+    if isinstance(src, (str, Path, bytes)):
+        return src
+    if isinstance(src, BUFFER_TYPES):
+        return bytes(src)
+    data = src.read()
+    return data.encode() if isinstance(data, str) else bytes(data)
+
+
+async def aparse(
+    src: JsonSource,
+    executor: Optional[Executor] = None,
+    pause_gc: bool = False,
+    cache: Optional[SnapshotCache] = None,
+) -> HarLog:
+    """
+    Parse *src* into a validated `HarLog` without blocking the event loop.
+
+    Args:
+        src: JsonSource
+            Path, bytes, or file-like object containing HAR JSON, compressed
+            or not.
+        executor: Optional[Executor]
+            Where the work runs, by default the loop's thread pool. With a
+            `ProcessPoolExecutor` the file is parsed in a worker process
+            (file-like objects and mappings are read in a thread first) and
+            only its snapshot is loaded here, in a thread, `BATCH_SIZE`
+            entries per call. Loading still validates every entry, but the
+            loop is held up for one slice at most. Prefer a process pool
+            when many large uploads are parsed at once: threads share the
+            GIL with the event loop.
+        pause_gc: bool
+            Disable the cyclic garbage collector while models are built (see
+            `parse`). Full collections otherwise stall every thread,
+            including the event loop's; in turn, the event loop's objects
+            are not collected meanwhile.
+        cache: Optional[SnapshotCache]
+            Store and load snapshots of file paths (see `parse`).
+
+    Raises `ValueError` if the JSON is invalid HAR.
+    """
+    loop = asyncio.get_running_loop()
+    if not isinstance(executor, ProcessPoolExecutor):
+        return await loop.run_in_executor(
+            executor, partial(parse, src, pause_gc=pause_gc, cache=cache)
+        )
+    data = await loop.run_in_executor(None, _read_all, src)
+    snapshot = await loop.run_in_executor(
+        executor, _parse_to_snapshot, data, pause_gc, cache, BATCH_SIZE
+    )
+    models = [model for _, model in ENTRY_MODEL_REGISTRY] + [Entry]
+    reader = await loop.run_in_executor(
+        None, SnapshotReader, io.BytesIO(snapshot), models
+    )
+    while await loop.run_in_executor(None, reader.read_section):
+        pass
+    return reader.har_log()
+
+
+class _BatchReader:
+    """Hands out batches of an iterator to whichever thread asks next."""
+
+    def __init__(self, iterator: Iterator[Any]):
+        self._iterator = iterator
+        self._lock = threading.Lock()
+
+    def take(self, size: int) -> List[Any]:
+        with self._lock:
+            batch = []
+            for item in self._iterator:
+                batch.append(item)
+                if len(batch) >= size:
+                    break
+            return batch
+
+    def close(self) -> None:
+        # Waits for a running `take`, then closes the source.
+        with self._lock:
+            close = getattr(self._iterator, "close", None)
+            if close is not None:
+                close()
+
+
+def _iter_entry_json(src: JsonSource, chunk_size: int) -> Iterator[bytes]:
+    with open_scanner(src, chunk_size) as scanner:
+        for _, _, data in scanner.entries():
+            yield data
+
+
+async def aiter_entries(
+    src: JsonSource,
+    raw: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    batch_size: int = BATCH_SIZE,
+) -> AsyncIterator[Union[Entry, Dict[str, Any]]]:
+    """
+    Asynchronously yield the entries of *src*, like `iter_entries`.
+
+    Scanning and validation run in an executor, *batch_size* entries per
+    call, so memory stays bounded by a batch and the event loop only hands
+    over finished entries.
+
+    Args:
+        src: JsonSource
+            Path, bytes, or file-like object containing HAR JSON.
+        raw: bool
+            Yield plain entry dicts instead of validated models.
+        chunk_size: int
+            Number of bytes read from the source at once.
+        executor: Optional[Executor]
+            Where entries are scanned and validated, by default the loop's
+            thread pool. With a `ProcessPoolExecutor` entries are scanned in
+            a thread and every batch is validated in a worker process (raw
+            entries are only decoded, in the thread); the
+            registered entry models and detectors must be importable by the
+            workers.
+        batch_size: int
+            Number of entries per executor call.
+
+    Raises `ValueError` if the JSON is invalid HAR.
+    """
+    loop = asyncio.get_running_loop()
+    # Sources can't be sent to other processes, so they are always read in a
+    # thread; raw entries need no further work.
+    scan_executor = None if isinstance(executor, ProcessPoolExecutor) else executor
+    in_process = isinstance(executor, ProcessPoolExecutor) and not raw
+    if in_process:
+        reader = _BatchReader(_iter_entry_json(src, chunk_size))
+        registry = tuple(ENTRY_MODEL_REGISTRY)
+    else:
+        reader = _BatchReader(
+            iter_entries(src, raw=True, chunk_size=chunk_size)
+            if raw
+            else iter_entries(src, chunk_size=chunk_size)
+        )
+    try:
+        while True:
+            batch = await loop.run_in_executor(scan_executor, reader.take, batch_size)
+            if not batch:
+                return
+            if in_process:
+                data = b"[" + b",".join(batch) + b"]"
+                try:
+                    batch = await loop.run_in_executor(
+                        executor, _validate_json_chunk, registry, data
+                    )
+                except ValidationError as exc:
+                    raise ValueError(f"Invalid HAR file: {exc}") from None
+            for entry in batch:
+                yield entry
+    finally:
+        # Closing waits for a `take` still running in the executor.
+        await loop.run_in_executor(scan_executor, reader.close)
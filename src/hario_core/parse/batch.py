@@ -0,0 +1,144 @@
+"""
+Parsing many HAR files in parallel.
+
+- Files are parsed in a pool of worker processes, one file per task.
+- Results are yielded as files finish, not in input order.
+- At most `max_in_flight` files are submitted at once, so memory stays flat
+  however many paths are given.
+- Parsed logs travel back as snapshots instead of pickled models, but the
+  parent still validates every entry again to rebuild them; `apply` runs a
+  function on the log in the worker and sends back only its result.
+"""
+
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from hario_core.models.har_1_2 import Entry, HarLog
+from hario_core.parse.cache import dump_snapshot, load_snapshot
+from hario_core.parse.har_parser import ENTRY_MODEL_REGISTRY, parse
+from hario_core.parse.parallel import paused_gc
+
+PathLike = Union[str, Path]
+
+# A parsed file, entry dicts (with `as_dicts=True`), the result of `apply`
+# or the error raised.
+ParseResult = Union[HarLog, List[Dict[str, Any]], Any, Exception]
+
+# Runs on the parsed log in the worker; its result is sent back instead.
+Apply = Callable[[HarLog], Any]
+
+
+def _load(path: PathLike, as_dicts: bool, apply: Optional[Apply]) -> Any:
+    har_log = parse(path)
+    if apply is not None:
+        return apply(har_log)
+    if as_dicts:
+        entries: List[Dict[str, Any]] = har_log.model_dump()["entries"]
+        return entries
+    return har_log
+
+
+def _parse_file(
+    path: PathLike, as_dicts: bool, apply: Optional[Apply]
+) -> Tuple[bool, Any]:
+    """Returns whether the result is a snapshot, and the result."""
+    # Workers do nothing else, so the collector can stay off while parsing.
+    with paused_gc():
+        result = _load(path, as_dicts, apply)
+        if apply is None and isinstance(result, HarLog):
+            # Snapshots load faster than pickled models.
+            buffer = io.BytesIO()
+            dump_snapshot(result, buffer)
+            return True, buffer.getvalue()
+        return False, result
+
+
+def parse_many(
+    paths: Iterable[PathLike],
+    workers: Optional[int] = None,
+    as_dicts: bool = False,
+    max_in_flight: Optional[int] = None,
+    apply: Optional[Apply] = None,
+) -> Iterator[Tuple[PathLike, ParseResult]]:
+    """
+    Parse many HAR files in a pool of worker processes.
+
+    Yields `(path, result)` as files finish. `result` is the parsed `HarLog`
+    (or what *apply* returned for it), or the exception raised for that
+    file (e.g. `ValueError` for invalid HAR, `FileNotFoundError`), so one
+    bad file does not stop the batch.
+
+    Returned models are rebuilt in the parent from snapshots, one file at a
+    time: `load_snapshot` validates every entry again, which costs about 80%
+    of parsing the file. That caps the speedup over a plain loop at about
+    1.2x whatever *workers* is. To use all the workers, reduce each log in
+    the worker with *apply* and return something small.
+
+    Args:
+        paths: Iterable[PathLike]
+            Paths of HAR files. Consumed lazily.
+        workers: Optional[int]
+            Number of worker processes, by default the number of CPUs. With
+            a single worker files are parsed in the calling process.
+        as_dicts: bool
+            Return the validated entries as plain dicts
+            (`HarLog.model_dump()["entries"]`, the input of
+            `Pipeline.process`), so no models are rebuilt in the parent;
+            unpickling the dicts still takes the parent's time.
+        max_in_flight: Optional[int]
+            Maximum number of files submitted but not yet yielded, by
+            default twice the number of workers.
+        apply: Optional[Callable[[HarLog], Any]]
+            Called with the parsed `HarLog` in the worker; its result is
+            pickled and yielded instead of the log. It must be picklable,
+            e.g. a module-level function.
+
+    Raises `ValueError` if both *as_dicts* and *apply* are given.
+
+    Returns:
+        Iterator[Tuple[PathLike, ParseResult]]
+    """
+    if as_dicts and apply is not None:
+        raise ValueError("parse_many(as_dicts=True) is not supported with apply")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for path in paths:
+            result: ParseResult
+            try:
+                result = _load(path, as_dicts, apply)
+            except Exception as exc:
+                result = exc
+            yield path, result
+        return
+    limit = max_in_flight or workers * 2
+    pending: Dict[Future[Tuple[bool, Any]], PathLike] = {}
+    models = [model for _, model in ENTRY_MODEL_REGISTRY] + [Entry]
+    path_iter = iter(paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                for path in path_iter:
+                    pending[executor.submit(_parse_file, path, as_dicts, apply)] = path
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    try:
+                        snapshot, data = future.result()
+                        if snapshot:
+                            result = load_snapshot(io.BytesIO(data), models)
+                        else:
+                            result = data
+                    except Exception as exc:
+                        result = exc
+                    yield path, result
+        finally:
+            # Files not started yet are dropped if the caller stops early.
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,249 @@
+"""
+On-disk snapshot cache for parsed HAR files.
+
+- A snapshot holds the validated `HarLog` as JSON: entries are grouped by
+  their model and every group is stored as the JSON that pydantic-core
+  dumped for it. Loading still validates every entry, but skips
+  decompression, scanning and per-entry model selection of the source.
+- Snapshots are keyed by the source path, size and mtime plus the set of
+  registered entry models, like the sidecar index; the file content is not
+  read to look a snapshot up.
+- The cache directory is bounded in size; least recently used snapshots
+  are evicted first.
+
+Validation is the fastest way pydantic offers to rebuild models: unpickling
+them, or `model_construct` on every nested model, runs Python code for each
+object and is slower than validating the JSON again. A hit is therefore
+only about 1.2x faster than `parse(path, pause_gc=True)` on an uncompressed
+file, and about 2x on a gzip-compressed one, whose decompression is skipped.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+
+import orjson
+from pydantic import ValidationError
+
+from hario_core.models.har_1_2 import Entry, HarLog
+from hario_core.parse.parallel import entries_adapter, paused_gc
+
+# Bumped whenever the snapshot layout or key changes.
+SNAPSHOT_VERSION = 2
+
+# Default upper bound of the cache directory size.
+DEFAULT_MAX_BYTES = 1 << 30
+
+_MAGIC = b"HARSNAP\x00"
+_LENGTH = struct.Struct("<Q")
+_SUFFIX = ".snap"
+
+
+def _model_name(model_cls: type) -> str:
+    return f"{model_cls.__module__}:{model_cls.__qualname__}"
+
+
+def dump_snapshot(
+    har_log: HarLog, fh: IO[bytes], section_size: Optional[int] = None
+) -> None:
+    """
+    Write *har_log* to *fh* as a snapshot.
+
+    Layout: magic, header length, JSON header, then the `log` metadata and
+    one JSON array of entries per model, in the order listed by the header.
+    With *section_size*, the entries of a model are split into arrays of at
+    most that many entries, so that `SnapshotReader` can load them in
+    bounded steps.
+    """
+    groups: Dict[type, List[int]] = {}
+    for index, entry in enumerate(har_log.entries):
+        groups.setdefault(entry.__class__, []).append(index)
+    sections = [
+        har_log.model_dump_json(
+            by_alias=True, exclude_unset=True, exclude={"entries"}
+        ).encode()
+    ]
+    header: Dict[str, Any] = {"count": len(har_log.entries), "groups": []}
+    for model_cls, indices in groups.items():
+        step = section_size or len(indices)
+        for start in range(0, len(indices), step):
+            part = indices[start : start + step]
+            entries = [har_log.entries[index] for index in part]
+            sections.append(
+                entries_adapter(model_cls).dump_json(
+                    entries, by_alias=True, exclude_unset=True
+                )
+            )
+            header["groups"].append([_model_name(model_cls), part])
+    header["sections"] = [len(section) for section in sections]
+    encoded = orjson.dumps(header)
+    fh.write(_MAGIC + _LENGTH.pack(len(encoded)) + encoded)
+    for section in sections:
+        fh.write(section)
+
+
+class SnapshotReader:
+    """
+    Reads a snapshot written by `dump_snapshot` one section at a time.
+
+    Every `read_section` call validates one array of entries and holds the
+    GIL throughout, so callers that must stay responsive (e.g. an event
+    loop) call it step by step on snapshots dumped with a `section_size`.
+
+    Args:
+        fh: IO[bytes]
+            The snapshot file.
+        models: Iterable[type[Entry]]
+            The Entry models the snapshot may reference.
+
+    Raises `ValueError` if the snapshot is corrupt or references a model
+    not in *models*.
+    """
+
+    def __init__(self, fh: IO[bytes], models: Iterable[type[Entry]]):
+        if fh.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("Invalid HAR snapshot")
+        (length,) = _LENGTH.unpack(fh.read(_LENGTH.size))
+        header = orjson.loads(fh.read(length))
+        self._fh = fh
+        self._by_name = {_model_name(model): model for model in models}
+        meta_size, *sizes = header["sections"]
+        self._log = HarLog.model_validate(
+            dict(orjson.loads(fh.read(meta_size)), entries=[])
+        )
+        self._entries: List[Any] = [None] * header["count"]
+        self._sections = iter(zip(header["groups"], sizes))
+
+    def read_section(self) -> bool:
+        """Validates the next array of entries; False once all are read."""
+        section = next(self._sections, None)
+        if section is None:
+            return False
+        (name, indices), size = section
+        if name not in self._by_name:
+            raise ValueError(f"Unknown entry model in HAR snapshot: {name}")
+        with paused_gc():
+            group = entries_adapter(self._by_name[name]).validate_json(
+                self._fh.read(size)
+            )
+        for index, entry in zip(indices, group):
+            self._entries[index] = entry
+        return True
+
+    def har_log(self) -> HarLog:
+        """Returns the `HarLog` once every section is read."""
+        return HarLog.model_construct(
+            _fields_set=self._log.model_fields_set,
+            **dict(self._log, entries=self._entries),
+        )
+
+
+def load_snapshot(fh: IO[bytes], models: Iterable[type[Entry]]) -> HarLog:
+    """
+    Read a snapshot written by `dump_snapshot` at once.
+
+    Args:
+        fh: IO[bytes]
+            The snapshot file.
+        models: Iterable[type[Entry]]
+            The Entry models the snapshot may reference.
+
+    Raises `ValueError` if the snapshot is corrupt or references a model
+    not in *models*.
+    """
+    with paused_gc():
+        reader = SnapshotReader(fh, models)
+        while reader.read_section():
+            pass
+    return reader.har_log()
+
+
+class SnapshotCache:
+    """
+    Size-bounded on-disk cache of parsed HAR files.
+
+    Pass an instance to `parse(path, cache=...)`. The first parse of a file
+    stores a snapshot, later parses of the unchanged file load it instead
+    of decoding and validating the JSON again.
+
+    Args:
+        directory: Union[str, Path]
+            Where snapshots are stored, created if missing.
+        max_bytes: int
+            Upper bound of the total snapshot size. Least recently used
+            snapshots are evicted once it is exceeded.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, path: Union[str, Path], models: Iterable[type[Entry]]) -> str:
+        """
+        Returns the snapshot key of the file at *path* parsed with *models*.
+        """
+        stat = os.stat(path)
+        parts = [
+            str(SNAPSHOT_VERSION),
+            os.path.abspath(path),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            *sorted({_model_name(model) for model in models}),
+        ]
+        return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def load(self, key: str, models: Iterable[type[Entry]]) -> Optional[HarLog]:
+        """Returns the cached HarLog for *key*, None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                har_log = load_snapshot(fh, models)
+        except FileNotFoundError:
+            return None
+        except (ValueError, ValidationError, KeyError, struct.error):
+            # Corrupt or stale snapshots are dropped and rebuilt.
+            path.unlink(missing_ok=True)
+            return None
+        # Mark as recently used for eviction.
+        os.utime(path)
+        return har_log
+
+    def store(self, key: str, har_log: HarLog) -> None:
+        """Stores a snapshot of *har_log* under *key* and evicts old ones."""
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                dump_snapshot(har_log, fh)
+            os.replace(tmp_name, self._path(key))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used snapshots above `max_bytes`."""
+        snapshots = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshots.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in snapshots)
+        for _, size, path in sorted(snapshots):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes all snapshots."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
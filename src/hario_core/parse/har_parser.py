@@ -6,20 +6,73 @@ Core logic for reading, validating, and extending HAR (HTTP Archive) files.
 - Handles both standard HAR and Chrome DevTools extensions out of the box.
 """
 
+from contextlib import nullcontext
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Callable, Dict, cast
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 import orjson
-from pydantic import ValidationError
+from pydantic import (
+    BaseModel,
+    Discriminator,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+)
+from pydantic_core import from_json
 
+from hario_core.models.bodies import BodyStore
+from hario_core.models.compact import CompactHarLog, compact
 from hario_core.models.extensions.chrome_devtools import DevToolsEntry
 from hario_core.models.har_1_2 import Entry, HarLog
-from hario_core.parse.interfaces import JsonSource
+from hario_core.models.lazy import LazyEntries, LazyHarLog
+from hario_core.parse.cache import SnapshotCache
+from hario_core.parse.interfaces import JsonSource, Reader
+from hario_core.parse.parallel import (
+    CHUNKS_PER_WORKER,
+    encode_chunks,
+    entries_adapter,
+    paused_gc,
+    validate_chunks,
+)
+from hario_core.parse.stream import (
+    BUFFER_TYPES,
+    CHUNK_SIZE,
+    Buffer,
+    EntryScanner,
+    iter_entry_spans,
+    loads,
+    open_input,
+)
+from hario_core.parse.where import _DATETIME, EntryFilter
+
+# Number of entries validated and dumped at once by `parse_entries`.
+ENTRY_CHUNK_SIZE = 1000
+
+# Bytes of entries validated at once when validating a memory-mapped or
+# compressed document.
+JSON_CHUNK_SIZE = 8 << 20
 
 # The registry for custom Entry models.
 # It's a list of (detector_function, model_class) tuples.
 ENTRY_MODEL_REGISTRY: list[tuple[Callable[[dict[str, Any]], bool], type[Entry]]] = []
 
+# An immutable snapshot of ENTRY_MODEL_REGISTRY.
+Registry = Tuple[Tuple[Callable[[dict[str, Any]], bool], type[Entry]], ...]
+
 
 def register_entry_model(
     detector: Callable[[dict[str, Any]], bool], model: type[Entry]
@@ -29,6 +82,9 @@ def register_entry_model(
     The new model is inserted at the beginning of the registry, so it's
     checked first. This allows overriding default behavior.
 
+    Detector results are memoized by the entry's top-level keys, so a
+    detector should only depend on which keys an entry has.
+
     Args:
         detector: A function that takes an entry dict and returns True if
                   the `model` should be used for it.
@@ -61,52 +117,527 @@ def entry_selector(entry_json: dict[str, Any]) -> type[Entry]:
     return Entry  # Default model
 
 
-def _to_bytes(src: JsonSource) -> bytes:
-    if isinstance(src, (str, Path)):
-        with open(src, "rb") as fh:
-            return fh.read()
-    if isinstance(src, (bytes, bytearray)):
-        return cast(bytes, src)
-    return cast(bytes, src.read())
+class CachedEntrySelector:
+    """An `entry_selector` memoized by the entry's top-level keys.
+
+    Entries of one HAR share a handful of key signatures, so the detectors
+    run once per signature instead of once per entry.
+
+    Args:
+        registry: Optional[Registry]
+            The detectors and models to select from, by default a snapshot
+            of `ENTRY_MODEL_REGISTRY`.
+    """
+
+    def __init__(self, registry: Optional[Registry] = None):
+        self.registry = tuple(ENTRY_MODEL_REGISTRY) if registry is None else registry
+        self._cache: Dict[Tuple[str, ...], type[Entry]] = {}
+
+    def __call__(self, entry_json: dict[str, Any]) -> type[Entry]:
+        if not isinstance(entry_json, dict):
+            return Entry
+        signature = tuple(entry_json)
+        model = self._cache.get(signature)
+        if model is None:
+            model = next(
+                (model for detector, model in self.registry if detector(entry_json)),
+                Entry,
+            )
+            self._cache[signature] = model
+        return model
+
+
+@lru_cache(maxsize=None)
+def _entry_type(registry: Registry) -> Any:
+    """
+    Returns a type validating every entry with the model selected for it,
+    a union discriminated by `CachedEntrySelector(registry)`.
+    """
+    models = list(dict.fromkeys([model for _, model in registry] + [Entry]))
+    if len(models) == 1:
+        return Entry
+    select = CachedEntrySelector(registry)
+    tags = {model: str(index) for index, model in enumerate(models)}
+
+    def discriminate(value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            return tags[select(value)]
+        return tags.get(type(value))
+
+    members = tuple(Annotated[model, Tag(tags[model])] for model in models)
+    return Annotated[Union[members], Discriminator(discriminate)]
+
 
+@lru_cache(maxsize=None)
+def _entry_adapter(registry: Registry) -> TypeAdapter[Entry]:
+    return TypeAdapter(_entry_type(registry))
 
-def _read_json(src: JsonSource) -> dict[str, Any]:
-    return cast(dict[str, Any], orjson.loads(_to_bytes(src)))
 
+def _read_json(
+    data: Union[Buffer, Reader], shared_strings: bool = False
+) -> dict[str, Any]:
+    if not isinstance(data, BUFFER_TYPES):
+        data = data.read()
+    har_dict = _loads_shared(data) if shared_strings else loads(data)
+    if not isinstance(har_dict, dict):
+        raise ValueError("Invalid HAR file: root element must be a JSON object")
+    return har_dict
+
+
+class _HarDocument(BaseModel):
+    """Root of a HAR document, only used for validation from JSON."""
+
+    log: HarLog
+
+
+@lru_cache(maxsize=None)
+def _document_model(registry: Registry) -> type[_HarDocument]:
+    """
+    Returns a compiled model for a whole HAR document whose entries are
+    validated by the models selected from *registry*, so raw JSON bytes
+    can be decoded and validated by pydantic-core in a single native pass.
+    """
+    entry_type = _entry_type(registry)
+    log_model: type[HarLog] = HarLog
+    if entry_type is not Entry:
+        log_model = create_model(
+            "HarLog",
+            __base__=HarLog,
+            __module__=HarLog.__module__,
+            entries=(List[entry_type], ...),  # type: ignore[valid-type]
+        )
+    return create_model("HarDocument", __base__=_HarDocument, log=(log_model, ...))
+
+
+def validate_json(data: Buffer) -> HarLog:
+    """
+    Validate a HAR document given as raw JSON bytes.
+
+    The entry model is selected for every entry (as in `validate`) while
+    decoding and validation of the whole document happen in one pass.
+    Memory-mapped documents (`mmap.mmap`, `memoryview`) are validated in
+    chunks of entries instead, so the mapping is never copied as a whole.
+
+    Args:
+        data: Buffer
+            The raw HAR JSON.
+
+    Returns:
+        HarLog
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        return _validate_scanned(EntryScanner(buffer=data))
+    log = _document_model(tuple(ENTRY_MODEL_REGISTRY)).model_validate_json(data).log
+    if type(log) is HarLog:
+        return log
+    # Rebuild as a plain HarLog (no re-validation) so it stays picklable.
+    return HarLog.model_construct(_fields_set=log.model_fields_set, **dict(log))
 
+
+def _scanner(data: Union[Buffer, Reader]) -> EntryScanner:
+    if isinstance(data, BUFFER_TYPES):
+        return EntryScanner(buffer=data)
+    return EntryScanner(read=data.read)
+
+
+def _json_chunks(
+    scanner: EntryScanner,
+    size: Optional[int] = None,
+    where: Optional[EntryFilter] = None,
+) -> Iterator[bytearray]:
+    """
+    Yields the entries of *scanner* as JSON arrays of about *size* bytes
+    (by default `JSON_CHUNK_SIZE`). With *where*, every entry is decoded
+    on its own and only those it accepts are kept.
+    """
+    size = JSON_CHUNK_SIZE if size is None else size
+    chunk = bytearray()
+    for _, _, data in scanner.entries():
+        if where is not None and not where(orjson.loads(data)):
+            continue
+        chunk += b"," if chunk else b"["
+        chunk += data
+        if len(chunk) >= size:
+            chunk += b"]"
+            yield chunk
+            chunk = bytearray()
+    if chunk:
+        chunk += b"]"
+        yield chunk
+
+
+def _validate_json_chunk(registry: Registry, data: bytes) -> List[Entry]:
+    """Validates a JSON array of entries with the models of *registry*."""
+    with paused_gc():
+        return entries_adapter(_entry_type(registry)).validate_json(data)
+
+
+def _validate_scanned(
+    scanner: EntryScanner,
+    workers: Optional[int] = None,
+    size: Optional[int] = None,
+    where: Optional[EntryFilter] = None,
+) -> HarLog:
+    """
+    Validate the document behind *scanner* in chunks of entries of about
+    `JSON_CHUNK_SIZE` bytes, so it is never held in memory as a whole.
+
+    With `workers=N` the chunks, raw byte slices of the source, are
+    validated in a pool of N processes. *size* is the size of the document
+    if known, used to split it into `CHUNKS_PER_WORKER` chunks per worker.
+    With *where*, only the entries it accepts are validated.
+    """
+    registry = tuple(ENTRY_MODEL_REGISTRY)
+    entries: List[Entry] = []
+    if workers is not None and workers > 1:
+        chunk_size = None
+        if size is not None:
+            chunk_size = min(JSON_CHUNK_SIZE, size // (workers * CHUNKS_PER_WORKER))
+        entries = validate_chunks(
+            partial(_validate_json_chunk, registry),
+            _json_chunks(scanner, chunk_size, where),
+            workers,
+        )
+    else:
+        adapter = entries_adapter(_entry_type(registry))
+        for chunk in _json_chunks(scanner, where=where):
+            entries.extend(adapter.validate_json(chunk))
+    # Everything but the entries is validated with an empty entries array.
+    log = HarLog.model_validate_json(scanner.log_json())
+    return HarLog.model_construct(
+        _fields_set=log.model_fields_set, **dict(log, entries=entries)
+    )
+
+
+@overload
 def parse(
     src: JsonSource,
     *args: Any,
-) -> HarLog:
+    lazy: bool = False,
+    workers: Optional[int] = None,
+    pause_gc: bool = False,
+    cache: Optional[SnapshotCache] = None,
+    bodies: Optional[BodyStore] = None,
+    compact: Literal[False] = False,
+    where: Optional[EntryFilter] = None,
+) -> HarLog: ...
+
+
+@overload
+def parse(
+    src: JsonSource,
+    *args: Any,
+    lazy: bool = False,
+    workers: Optional[int] = None,
+    pause_gc: bool = False,
+    cache: Optional[SnapshotCache] = None,
+    bodies: Optional[BodyStore] = None,
+    compact: Literal[True],
+    where: Optional[EntryFilter] = None,
+) -> CompactHarLog: ...
+
+
+def parse(
+    src: JsonSource,
+    *args: Any,
+    lazy: bool = False,
+    workers: Optional[int] = None,
+    pause_gc: bool = False,
+    cache: Optional[SnapshotCache] = None,
+    bodies: Optional[BodyStore] = None,
+    compact: bool = False,
+    where: Optional[EntryFilter] = None,
+) -> Union[HarLog, CompactHarLog]:
     """Parse *src* into a validated `HarLog` instance.
 
     It uses a model selector strategy to determine which `Entry` model to use,
-    allowing for extensions like DevTools.
+    allowing for extensions like DevTools. The raw bytes are handed to
+    pydantic-core once (see `validate_json`), without building an
+    intermediate dict. Large files are memory-mapped rather than read.
+    Compressed input (gzip, bz2, xz, or zstd with the `zstandard` package)
+    is detected by its magic bytes and decompressed while entries are
+    validated in chunks, so the decompressed document is never held whole.
 
-    Raises `ValueError` if the JSON is invalid HAR.
+    With `lazy=True` the JSON is decoded, but entries are only validated
+    when accessed. With `workers=N` entries are validated in a pool of N
+    processes: the parent only scans the document for entry boundaries and
+    ships raw byte slices of it to the workers (see `validate`). `workers`
+    cannot be combined with `lazy=True`.
+
+    With `pause_gc=True` the cyclic garbage collector is disabled while the
+    models are built. The freshly built tree is acyclic, yet its hundreds
+    of thousands of objects otherwise trigger repeated full collections,
+    which can take as long as the parsing itself. The input is still fully
+    validated. The collector is disabled for the whole process, other
+    threads included, until `parse` returns.
+
+    With a `SnapshotCache`, a snapshot of the result is stored for file
+    paths, and later parses of the unchanged file (with the same registered
+    entry models) load it instead. The cache is not used with `lazy=True`.
+
+    With a `BodyStore`, response and request bodies of at least its
+    `threshold` are moved to the store once validated, and read back only
+    when accessed (see `BodyRef`). A `BodyStore` cannot be combined with
+    `lazy=True`.
+
+    With `compact=True` a `CompactHarLog` is returned instead: entries are
+    validated as usual and kept as slots-based records (see `CompactEntry`)
+    that take a fraction of the memory of the models. Memory-mapped and
+    compressed documents are turned into records a chunk of entries at a
+    time, so the models of the whole log never exist at once. `lazy`,
+    `workers` and `cache` cannot be combined with `compact=True`.
+
+    With a `where` filter (a `Where`, or any callable taking the raw entry
+    dict), entries are decoded one at a time while the document is scanned,
+    and only those the filter accepts are validated and kept; the others
+    never reach pydantic. The cache is not used with `where`.
+
+    Raises `ValueError` if the JSON is invalid HAR, or if options that
+    cannot be combined are given.
     """
+    if bodies is not None and lazy:
+        raise ValueError("parse(bodies=...) is not supported with lazy=True")
+    if compact:
+        unsupported = [
+            name
+            for name, value in (("lazy", lazy), ("workers", workers), ("cache", cache))
+            if value
+        ]
+        if unsupported:
+            raise ValueError(
+                f"parse({', '.join(unsupported)}=...) is not supported "
+                "with compact=True"
+            )
+        compact_log = _parse_compact(src, pause_gc, where)
+        if bodies is not None:
+            bodies.offload(compact_log.entries)
+        return compact_log
+    if lazy and workers:
+        raise ValueError("parse(workers=...) is not supported with lazy=True")
+    if bodies is not None:
+        parsed = parse(
+            src, workers=workers, pause_gc=pause_gc, cache=cache, where=where
+        )
+        bodies.offload(parsed.entries)
+        return parsed
+    if (
+        cache is not None
+        and where is None
+        and not lazy
+        and isinstance(src, (str, Path))
+    ):
+        models = [model for _, model in ENTRY_MODEL_REGISTRY] + [Entry]
+        key = cache.key(src, models)
+        har_log = cache.load(key, models)
+        if har_log is None:
+            har_log = parse(src, workers=workers, pause_gc=pause_gc)
+            cache.store(key, har_log)
+        return har_log
     try:
-        data = _read_json(src)
-        if not isinstance(data, dict):
-            raise ValueError("Invalid HAR file: root element must be a JSON object")
-        return validate(data)
+        with paused_gc() if pause_gc else nullcontext(), open_input(src) as data:
+            if where is not None:
+                return _validate_filtered(data, where, lazy=lazy, workers=workers)
+            if lazy:
+                return validate(_read_json(data), lazy=lazy)
+            if not isinstance(data, BUFFER_TYPES):
+                return _validate_scanned(EntryScanner(read=data.read), workers)
+            if workers is not None and workers > 1:
+                return _validate_scanned(
+                    EntryScanner(buffer=data), workers, size=len(data)
+                )
+            return validate_json(data)
     except (KeyError, ValidationError, orjson.JSONDecodeError) as exc:
         raise ValueError("Invalid HAR file") from exc
 
 
-def validate(har_dict: Dict[str, Any]) -> HarLog:
+def _parse_compact(
+    src: JsonSource, pause_gc: bool, where: Optional[EntryFilter] = None
+) -> CompactHarLog:
+    """
+    Validates *src* as `parse` does and replaces every entry model with its
+    compact record. Memory-mapped and streamed documents are validated in
+    chunks of entries (as in `_validate_scanned`), each chunk turned into
+    records before the next one is validated.
+    """
+    try:
+        with paused_gc() if pause_gc else nullcontext(), open_input(src) as data:
+            if where is None and isinstance(data, (bytes, bytearray)):
+                return _compacted(validate_json(data))
+            scanner = _scanner(data)
+            adapter = entries_adapter(_entry_type(tuple(ENTRY_MODEL_REGISTRY)))
+            entries: List[Any] = []
+            for chunk in _json_chunks(scanner, where=where):
+                entries.extend(map(compact, adapter.validate_json(chunk)))
+            log = HarLog.model_validate_json(scanner.log_json())
+            return CompactHarLog.from_log(log, entries)
+    except (KeyError, ValidationError, orjson.JSONDecodeError) as exc:
+        raise ValueError("Invalid HAR file") from exc
+
+
+def _compacted(log: HarLog) -> CompactHarLog:
+    """Replaces the entry models of *log* with records, one at a time."""
+    entries: List[Any] = log.entries
+    for index, entry in enumerate(entries):
+        entries[index] = compact(entry)
+    return CompactHarLog.from_log(log, entries)
+
+
+def parse_entries(src: JsonSource, validate: bool = True) -> List[Dict[str, Any]]:
+    """
+    Parse the entries of *src* straight into dicts ready for
+    `Pipeline.process`.
+
+    The result has the shape of `parse(src).model_dump()["entries"]`, but
+    entries are validated and dumped `ENTRY_CHUNK_SIZE` at a time, replacing
+    the decoded entries in place, so the models of only one chunk exist at
+    a time and the full `HarLog` is never built. The rest of the log is
+    validated as well. Compressed and file-like input is scanned in chunks
+    of about `JSON_CHUNK_SIZE` bytes instead of being decoded as a whole.
+
+    With `validate=False` entries are only decoded: they keep the keys of
+    the source (no defaults are filled in). `startedDateTime` is still
+    converted to a `datetime`, so IDs from `by_field` match validated
+    entries.
+
+    Either way, repeated strings such as header names and values share one
+    object: validated entries through `Interned` model fields, decoded ones
+    through pydantic-core's string cache (strings of up to 64 characters).
+
+    Args:
+        src: JsonSource
+            Path, bytes, or file-like object containing HAR JSON.
+        validate: bool
+            Validate entries with the model selected for each of them.
+
+    Raises `ValueError` if the JSON is invalid HAR.
+    """
+    adapter = entries_adapter(_entry_type(tuple(ENTRY_MODEL_REGISTRY)))
+    try:
+        with open_input(src, stream=True) as data:
+            if not isinstance(data, BUFFER_TYPES):
+                return _parse_scanned_entries(
+                    EntryScanner(read=data.read), adapter if validate else None
+                )
+            har_dict = _read_json(data, shared_strings=not validate)
+        entries = _log_entries(har_dict)
+        if not validate:
+            return _with_datetimes(entries)
+        for start in range(0, len(entries), ENTRY_CHUNK_SIZE):
+            chunk = entries[start : start + ENTRY_CHUNK_SIZE]
+            entries[start : start + ENTRY_CHUNK_SIZE] = adapter.dump_python(
+                adapter.validate_python(chunk)
+            )
+        HarLog.model_validate(dict(har_dict["log"], entries=[]))
+        return entries
+    except (ValidationError, orjson.JSONDecodeError) as exc:
+        raise ValueError("Invalid HAR file") from exc
+
+
+def _parse_scanned_entries(
+    scanner: EntryScanner, adapter: Optional[TypeAdapter[List[Entry]]]
+) -> List[Dict[str, Any]]:
+    entries: List[Dict[str, Any]] = []
+    for chunk in _json_chunks(scanner):
+        if adapter is None:
+            entries.extend(_with_datetimes(_loads_shared(chunk)))
+        else:
+            entries.extend(adapter.dump_python(adapter.validate_json(chunk)))
+    if adapter is not None:
+        HarLog.model_validate_json(scanner.log_json())
+    return entries
+
+
+def _with_datetimes(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Converts `startedDateTime` of decoded entries as validation would."""
+    for entry in entries:
+        started = entry.get("startedDateTime") if isinstance(entry, dict) else None
+        if isinstance(started, str):
+            try:
+                entry["startedDateTime"] = _DATETIME.validate_python(started)
+            except ValidationError:
+                pass
+    return entries
+
+
+def _loads_shared(data: Buffer) -> Any:
+    """
+    Decodes JSON with pydantic-core, whose string cache makes repeated
+    strings (header names and values, MIME types) share one object.
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    try:
+        return from_json(data)
+    except ValueError as exc:
+        raise ValueError("Invalid HAR file") from exc
+
+
+def _validate_filtered(
+    data: Union[Buffer, Reader],
+    where: EntryFilter,
+    lazy: bool = False,
+    workers: Optional[int] = None,
+) -> HarLog:
+    """
+    Scans *data*, decoding one entry at a time, drops the entries *where*
+    rejects and validates the rest as `validate` does. Only the accepted
+    entries are held in memory, in chunks as in `_validate_scanned`.
+    """
+    scanner = _scanner(data)
+    if not lazy:
+        size = len(data) if isinstance(data, BUFFER_TYPES) else None
+        return _validate_scanned(scanner, workers, size=size, where=where)
+    entries = []
+    for _, _, raw in scanner.entries():
+        entry = orjson.loads(raw)
+        if where(entry):
+            entries.append(entry)
+    log = orjson.loads(scanner.log_json())
+    return validate({"log": dict(log, entries=entries)}, lazy=True)
+
+
+def validate(
+    har_dict: Dict[str, Any], lazy: bool = False, workers: Optional[int] = None
+) -> HarLog:
     """
     Validate HAR-structure (dict) with support for extensions.
-    All entries are validated by one model, defined by the first entry.
+    The model is selected for every entry (see `CachedEntrySelector`),
+    entries are grouped by model and every group is validated in bulk, so
+    merged HARs mixing plain and DevTools entries are supported.
     Returns HarLog with Entry/DevToolsEntry.
 
     Args:
         har_dict: dict
             The HAR-structure to validate.
+        lazy: bool
+            Validate everything but the entries up front and return a
+            `LazyHarLog`, whose entries are validated on first access.
+        workers: Optional[int]
+            Validate entries in a pool of this many processes. Entries are
+            sent to workers in chunks encoded as JSON bytes, whatever their
+            model, and reassembled in the original order. The registered
+            entry models and detectors must be importable by the workers.
+            Not supported with *lazy*.
 
     Returns:
         HarLog
+
+    Raises `ValueError` if both *lazy* and *workers* are given.
     """
+    if lazy and workers:
+        raise ValueError("validate(workers=...) is not supported with lazy=True")
+    entries = _log_entries(har_dict)
+    if lazy:
+        log_copy = dict(har_dict["log"])
+        log_copy["entries"] = LazyEntries(entries, CachedEntrySelector())
+        return LazyHarLog.model_validate(log_copy)
+    log_copy = dict(har_dict["log"])
+    log_copy["entries"] = _validate_grouped(entries, workers)
+    return HarLog.model_validate(log_copy)
+
+
+def _log_entries(har_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Returns `log.entries` of *har_dict*, checking the HAR structure."""
     if "log" not in har_dict:
         raise ValueError("Invalid HAR file: missing 'log'")
     if not isinstance(har_dict["log"], dict):
@@ -115,13 +646,92 @@ def validate(har_dict: Dict[str, Any]) -> HarLog:
         raise ValueError("Invalid HAR file: missing 'entries' in 'log'")
     if not isinstance(har_dict["log"]["entries"], list):
         raise ValueError("Invalid HAR file: 'entries' must be a list")
-    entries = har_dict["log"]["entries"]
-    if not entries:
-        log_copy = dict(har_dict["log"])
-        log_copy["entries"] = []
-        return HarLog.model_validate(log_copy)
-    model_cls = entry_selector(entries[0])
-    validated_entries = [model_cls.model_validate(entry) for entry in entries]
-    log_copy = dict(har_dict["log"])
-    log_copy["entries"] = validated_entries
-    return HarLog.model_validate(log_copy)
+    entries: List[Dict[str, Any]] = har_dict["log"]["entries"]
+    return entries
+
+
+def _validate_grouped(
+    entries: List[Dict[str, Any]], workers: Optional[int] = None
+) -> List[Entry]:
+    """Validate *entries* grouped by their selected model, keeping order."""
+    if workers is not None and workers > 1:
+        # Workers select the model per entry, so every model shares one pool.
+        chunk_size = max(1, -(-len(entries) // (workers * CHUNKS_PER_WORKER)))
+        return validate_chunks(
+            partial(_validate_json_chunk, tuple(ENTRY_MODEL_REGISTRY)),
+            encode_chunks(entries, chunk_size),
+            workers,
+        )
+    select = CachedEntrySelector()
+    groups: Dict[type[Entry], List[int]] = {}
+    for index, entry in enumerate(entries):
+        groups.setdefault(select(entry), []).append(index)
+    if len(groups) == 1:
+        (model_cls,) = groups
+        return entries_adapter(model_cls).validate_python(entries)
+    validated: List[Any] = [None] * len(entries)
+    for model_cls, indices in groups.items():
+        group = [entries[i] for i in indices]
+        for index, validated_entry in zip(
+            indices, entries_adapter(model_cls).validate_python(group)
+        ):
+            validated[index] = validated_entry
+    return validated
+
+
+@overload
+def iter_entries(
+    src: JsonSource,
+    raw: Literal[False] = False,
+    chunk_size: int = CHUNK_SIZE,
+    where: Optional[EntryFilter] = None,
+) -> Iterator[Entry]: ...
+
+
+@overload
+def iter_entries(
+    src: JsonSource,
+    raw: Literal[True],
+    chunk_size: int = CHUNK_SIZE,
+    where: Optional[EntryFilter] = None,
+) -> Iterator[Dict[str, Any]]: ...
+
+
+def iter_entries(
+    src: JsonSource,
+    raw: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    where: Optional[EntryFilter] = None,
+) -> Iterator[Union[Entry, Dict[str, Any]]]:
+    """
+    Incrementally scan `log.entries` of *src* and yield entries one at a time.
+
+    Unlike `parse`, the document is never decoded as a whole: file and
+    file-like sources are read in chunks of *chunk_size* bytes, so memory is
+    bounded by the largest single entry. As in `validate`, every entry is
+    validated by the model selected for it.
+
+    Args:
+        src: JsonSource
+            Path, bytes, or file-like object containing HAR JSON.
+        raw: bool
+            Yield plain entry dicts instead of validated models.
+        chunk_size: int
+            Number of bytes read from the source at once.
+        where: Optional[EntryFilter]
+            Only yield the entries this filter (e.g. a `Where`) accepts; it
+            is called with the decoded entry dict, before validation.
+
+    Raises `ValueError` if the JSON is invalid HAR.
+    """
+    try:
+        adapter = _entry_adapter(tuple(ENTRY_MODEL_REGISTRY))
+        for _, _, data in iter_entry_spans(src, chunk_size):
+            if where is None:
+                yield orjson.loads(data) if raw else adapter.validate_json(data)
+                continue
+            entry = orjson.loads(data)
+            if where(entry):
+                yield entry if raw else adapter.validate_python(entry)
+    except (ValidationError, orjson.JSONDecodeError) as exc:
+        raise ValueError("Invalid HAR file") from exc
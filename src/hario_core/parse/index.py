@@ -0,0 +1,332 @@
+"""
+Random access to the entries of large HAR files through a sidecar index.
+
+- `build_index` scans a HAR file once and records the byte span of every
+  item of `log.entries` in a compact sidecar file next to it (12 bytes per
+  entry), together with the rest of the `log` object.
+- The sidecar is tied to the size and mtime of the HAR file and is rebuilt
+  when either changes.
+- `open_indexed` memory-maps the HAR file and decodes and validates only
+  the entries that are accessed, so entry #N costs the same however large
+  the file is.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from pydantic import ValidationError
+
+from hario_core.models.har_1_2 import Entry, HarLog
+from hario_core.parse.har_parser import (
+    ENTRY_MODEL_REGISTRY,
+    _entry_adapter,
+    _entry_type,
+)
+from hario_core.parse.parallel import entries_adapter
+from hario_core.parse.stream import BUFFER_TYPES, EntryScanner, open_input
+
+PathLike = Union[str, Path]
+
+# Bumped whenever the index layout changes.
+INDEX_VERSION = 1
+
+# Appended to the HAR path to name its sidecar index.
+INDEX_SUFFIX = ".idx"
+
+_MAGIC = b"HARIDX\x00\x00"
+# Version, size and mtime (ns) of the HAR file, number of entries, length of
+# the `log` JSON.
+_HEADER = struct.Struct("<IQqQQ")
+_MAX_ENTRY_SIZE = (1 << 32) - 1
+
+
+def index_path_for(path: PathLike) -> Path:
+    """Returns the default sidecar path of the HAR file at *path*."""
+    return Path(f"{os.fspath(path)}{INDEX_SUFFIX}")
+
+
+class EntryIndex:
+    """
+    Byte spans of the entries of a HAR file.
+
+    Args:
+        size: int
+            Size of the HAR file the index was built from.
+        mtime_ns: int
+            Modification time of that file, in nanoseconds.
+        starts: array
+            Offset of the first byte of every entry (`array("Q")`).
+        lengths: array
+            Length in bytes of every entry (`array("I")`).
+        log_json: bytes
+            The `log` object without its entries, as JSON with an empty
+            `entries` array.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        mtime_ns: int,
+        starts: "array[int]",
+        lengths: "array[int]",
+        log_json: bytes,
+    ):
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.starts = starts
+        self.lengths = lengths
+        self.log_json = log_json
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """Returns the `(start, end)` byte offsets of entry *index*."""
+        start = self.starts[index]
+        return start, start + self.lengths[index]
+
+    def matches(self, path: PathLike) -> bool:
+        """Tells whether the file at *path* is the one the index was built from."""
+        stat = os.stat(path)
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def dump(self, fh: IO[bytes]) -> None:
+        """Writes the index to *fh* in the sidecar layout."""
+        starts, lengths = self.starts, self.lengths
+        if sys.byteorder != "little":
+            starts, lengths = array("Q", starts), array("I", lengths)
+            starts.byteswap()
+            lengths.byteswap()
+        fh.write(_MAGIC)
+        fh.write(
+            _HEADER.pack(
+                INDEX_VERSION, self.size, self.mtime_ns, len(starts), len(self.log_json)
+            )
+        )
+        fh.write(starts.tobytes())
+        fh.write(lengths.tobytes())
+        fh.write(self.log_json)
+
+    @classmethod
+    def load(cls, fh: IO[bytes]) -> "EntryIndex":
+        """
+        Reads an index written by `dump`.
+
+        Raises `ValueError` if the data is not a current index.
+        """
+        if fh.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError("Invalid HAR index")
+        try:
+            version, size, mtime_ns, count, log_size = _HEADER.unpack(
+                fh.read(_HEADER.size)
+            )
+        except struct.error as exc:
+            raise ValueError("Invalid HAR index") from exc
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported HAR index version {version}")
+        starts, lengths = array("Q"), array("I")
+        starts.frombytes(fh.read(count * starts.itemsize))
+        lengths.frombytes(fh.read(count * lengths.itemsize))
+        log_json = fh.read(log_size)
+        if len(starts) != count or len(lengths) != count or len(log_json) != log_size:
+            raise ValueError("Invalid HAR index: truncated")
+        if sys.byteorder != "little":
+            starts.byteswap()
+            lengths.byteswap()
+        return cls(size, mtime_ns, starts, lengths, log_json)
+
+
+def scan_index(path: PathLike) -> EntryIndex:
+    """
+    Scans the HAR file at *path* and returns its index, without writing it.
+
+    Raises `ValueError` if the file is not HAR or is compressed: offsets
+    into compressed data cannot be memory-mapped.
+    """
+    stat = os.stat(path)
+    starts, lengths = array("Q"), array("I")
+    with open_input(path, stream=True, mmap_threshold=0) as data:
+        if not isinstance(data, BUFFER_TYPES):
+            raise ValueError("Compressed HAR files cannot be indexed")
+        scanner = EntryScanner(buffer=data)
+        for start, end in scanner.spans():
+            if end - start > _MAX_ENTRY_SIZE:
+                raise ValueError("HAR entry too large to be indexed")
+            starts.append(start)
+            lengths.append(end - start)
+        log_json = scanner.log_json()
+    return EntryIndex(stat.st_size, stat.st_mtime_ns, starts, lengths, log_json)
+
+
+def load_index(
+    path: PathLike, index_path: Optional[PathLike] = None
+) -> Optional[EntryIndex]:
+    """
+    Returns the sidecar index of the HAR file at *path*, None if it is
+    missing, unreadable or stale.
+    """
+    try:
+        with open(index_path or index_path_for(path), "rb") as fh:
+            index = EntryIndex.load(fh)
+    except (OSError, ValueError):
+        return None
+    return index if index.matches(path) else None
+
+
+def build_index(path: PathLike, index_path: Optional[PathLike] = None) -> EntryIndex:
+    """
+    Scans the HAR file at *path* and writes its sidecar index.
+
+    Args:
+        path: PathLike
+            The HAR file, uncompressed.
+        index_path: Optional[PathLike]
+            Where the index is written, by default next to the HAR file
+            (`<path>.idx`).
+
+    Raises `ValueError` if the file is not HAR or is compressed.
+    """
+    index = scan_index(path)
+    target = Path(index_path or index_path_for(path))
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            index.dump(fh)
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return index
+
+
+class IndexedHar(Sequence[Entry]):
+    """
+    Read-only sequence of the entries of a memory-mapped HAR file.
+
+    Entries are decoded and validated, with the model selected for each of
+    them, every time they are accessed; nothing is cached. Use as a context
+    manager, or call `close()`, to release the mapping.
+
+    Args:
+        path: PathLike
+            The HAR file.
+        index: EntryIndex
+            Its index, see `build_index`; kept as `entry_index`.
+    """
+
+    def __init__(self, path: PathLike, index: EntryIndex):
+        self.path = path
+        self.entry_index = index
+        self._registry = tuple(ENTRY_MODEL_REGISTRY)
+        self._log: Optional[HarLog] = None
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "IndexedHar":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    @property
+    def log(self) -> HarLog:
+        """Everything but the entries, validated on first access."""
+        if self._log is None:
+            try:
+                self._log = HarLog.model_validate_json(self.entry_index.log_json)
+            except ValidationError as exc:
+                raise ValueError("Invalid HAR file") from exc
+        return self._log
+
+    def __len__(self) -> int:
+        return len(self.entry_index)
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entry index out of range")
+        return index
+
+    def raw(self, index: int) -> bytes:
+        """Returns the JSON bytes of entry *index*, not validated."""
+        start, end = self.entry_index.span(self._position(index))
+        return self._map[start:end]
+
+    @overload
+    def __getitem__(self, index: int) -> Entry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Entry]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Entry, List[Entry]]:
+        if isinstance(index, slice):
+            return self.get_many(range(*index.indices(len(self))))
+        position = self._position(index)
+        try:
+            return _entry_adapter(self._registry).validate_json(self.raw(position))
+        except ValidationError as exc:
+            raise ValueError(f"Invalid HAR entry at index {position}") from exc
+
+    def get_many(self, indices: Iterable[int]) -> List[Entry]:
+        """Validates the entries at *indices* in a single call."""
+        positions = [self._position(index) for index in indices]
+        data = b"[" + b",".join(self.raw(position) for position in positions) + b"]"
+        try:
+            return entries_adapter(_entry_type(self._registry)).validate_json(data)
+        except ValidationError as exc:
+            raise ValueError("Invalid HAR entry") from exc
+
+    def __iter__(self) -> Iterator[Entry]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def open_indexed(path: PathLike, index_path: Optional[PathLike] = None) -> IndexedHar:
+    """
+    Open the HAR file at *path* for random access to its entries.
+
+    The sidecar index is loaded, or built and written if it is missing or
+    the file changed since (see `build_index`). If the sidecar cannot be
+    written, the index is kept in memory only.
+
+    Args:
+        path: PathLike
+            The HAR file, uncompressed.
+        index_path: Optional[PathLike]
+            Location of the sidecar index, by default `<path>.idx`.
+
+    Raises `ValueError` if the file is not HAR or is compressed.
+    """
+    index = load_index(path, index_path)
+    if index is None:
+        try:
+            index = build_index(path, index_path)
+        except OSError:
+            index = scan_index(path)
+    return IndexedHar(path, index)
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+import mmap
 from pathlib import Path
 from typing import IO, Any, Protocol, Union
 
 from hario_core.models.har_1_2 import HarLog
 
-JsonSource = Union[str, Path, bytes, bytearray, IO[Any]]
+JsonSource = Union[str, Path, bytes, bytearray, memoryview, mmap.mmap, IO[Any]]
+
+
+class Reader(Protocol):
+    """Protocol for a readable binary stream, e.g. a decompressing file."""
+
+    def read(self, size: int = -1, /) -> Any:
+        """Reads up to *size* bytes, everything if *size* is negative."""
+        ...
+
+    def close(self) -> None:
+        """Closes the stream."""
+        ...
 
 
 class HarParser(Protocol):
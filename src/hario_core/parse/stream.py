@@ -0,0 +1,500 @@
+"""
+Incremental scanning of HAR documents.
+
+- Locates `log.entries` without decoding the rest of the document.
+- Yields the raw bytes of every entry one at a time, so memory stays bounded
+  by the largest single entry instead of by the size of the file.
+- Backs `iter_entries`, the streaming counterpart of `parse`.
+- Memory-maps file sources, so the OS page cache is used directly.
+- Detects gzip, bz2, xz and zstd input by its magic bytes and decompresses
+  it on the fly.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
+import re
+import zlib
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import orjson
+
+from hario_core.parse.interfaces import JsonSource, Reader
+
+# Size of a single read from a file-like source.
+CHUNK_SIZE = 1 << 20
+
+# Files at least this large are memory-mapped by `open_input` instead of
+# being read into memory.
+MMAP_THRESHOLD = 64 << 20
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+# Magic bytes of the supported compression formats.
+COMPRESSION_MAGIC: Dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+_MAGIC_SIZE = max(len(magic) for magic in COMPRESSION_MAGIC.values())
+
+# A scanned entry: absolute (start, end) byte offsets and the entry bytes.
+EntrySpan = Tuple[int, int, bytes]
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+# Skips strings and plain bytes up to (and including) the next bracket
+# that is not part of a string.
+_NEXT_BRACKET = re.compile(
+    rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*([\[\]{}])', re.S
+)
+
+_OPENING = frozenset(b"[{")
+_QUOTE = ord('"')
+_COMMA = ord(",")
+_RBRACE = ord("}")
+_RBRACKET = ord("]")
+
+
+class EntryScanner:
+    """
+    Scans a HAR document and yields the byte spans of `log.entries` items.
+
+    The scanner works either over a complete in-memory buffer or over a
+    `read(size)` callable. In the latter case data is read in chunks and
+    everything before the current entry is released as soon as the entry
+    has been yielded.
+
+    Args:
+        read: Optional[Callable[[int], Any]]
+            A callable returning up to `size` bytes, `b""` at end of input.
+        buffer: Optional[Buffer]
+            The whole document, used when `read` is not given.
+        chunk_size: int
+            Minimal number of bytes requested from `read` at once.
+    """
+
+    def __init__(
+        self,
+        read: Optional[Callable[[int], Any]] = None,
+        buffer: Optional[Buffer] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        if read is None and buffer is None:
+            raise TypeError("EntryScanner requires either `read` or `buffer`")
+        self._read = read
+        self._chunk_size = chunk_size
+        self._buf: Buffer = bytearray() if read is not None else buffer or b""
+        # Index of the next unread byte in `_buf`.
+        self._pos = 0
+        # Absolute offset of `_buf[0]` in the document.
+        self._base = 0
+        # Absolute offsets of the `log.entries` array brackets, set once the
+        # array has been scanned (`array_end` points past the `]`).
+        self.array_start: Optional[int] = None
+        self.array_end: Optional[int] = None
+        # Raw JSON of every other `log` member, collected while scanning.
+        self.log_members: Dict[str, bytes] = {}
+
+    def _fill(self) -> bool:
+        """Appends more data to the buffer, returns False at end of input."""
+        if self._read is None:
+            return False
+        # Grow geometrically so values spanning many chunks stay linear.
+        size = max(self._chunk_size, len(self._buf) - self._pos)
+        chunk = self._read(size)
+        if not chunk:
+            self._read = None
+            return False
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        assert isinstance(self._buf, bytearray)
+        self._buf += chunk
+        return True
+
+    def _release(self) -> None:
+        """Drops already consumed bytes from a chunked buffer."""
+        if self._read is not None and self._pos >= self._chunk_size:
+            assert isinstance(self._buf, bytearray)
+            del self._buf[: self._pos]
+            self._base += self._pos
+            self._pos = 0
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(
+            f"Invalid HAR file: {message} at offset {self._base + self._pos}"
+        )
+
+    def _peek(self) -> Optional[int]:
+        """Skips whitespace and returns the next byte, None at end of input."""
+        while True:
+            match = _WS.match(self._buf, self._pos)
+            assert match is not None
+            self._pos = match.end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char: bytes) -> None:
+        if self._peek() != char[0]:
+            raise self._error(f"expected {char.decode()!r}")
+        self._pos += 1
+
+    def _match(self, pattern: "re.Pattern[bytes]") -> int:
+        """Matches `pattern` at the current position and returns its end."""
+        while True:
+            match = pattern.match(self._buf, self._pos)
+            if match is not None and match.end() < len(self._buf):
+                return match.end()
+            if not self._fill():
+                if match is None:
+                    raise self._error("unexpected end of data")
+                return match.end()
+
+    def _skip_value(self) -> Tuple[int, int]:
+        """Skips the next JSON value and returns its span within the buffer."""
+        char = self._peek()
+        if char is None:
+            raise self._error("unexpected end of data")
+        start = self._pos
+        if char == _QUOTE:
+            self._pos = self._match(_STRING)
+        elif char in _OPENING:
+            depth = 0
+            while True:
+                match = _NEXT_BRACKET.match(self._buf, self._pos)
+                if match is None:
+                    if not self._fill():
+                        raise self._error("unexpected end of data")
+                    continue
+                self._pos = match.end()
+                depth += 1 if self._buf[self._pos - 1] in _OPENING else -1
+                if depth == 0:
+                    break
+        else:
+            self._pos = self._match(_SCALAR)
+        return start, self._pos
+
+    def _object_keys(self) -> Iterator[str]:
+        """
+        Iterates over the keys of the next JSON object.
+
+        The consumer must skip or consume the value of every yielded key
+        before advancing the iterator.
+        """
+        self._expect(b"{")
+        if self._peek() == _RBRACE:
+            self._pos += 1
+            return
+        while True:
+            if self._peek() != _QUOTE:
+                raise self._error("expected an object key")
+            start, end = self._skip_value()
+            key = orjson.loads(bytes(self._buf[start:end]))
+            self._expect(b":")
+            yield key
+            if self._peek() == _COMMA:
+                self._pos += 1
+                continue
+            self._expect(b"}")
+            return
+
+    def _array_items(self) -> Iterator[Tuple[int, int]]:
+        self._peek()
+        self.array_start = self._base + self._pos
+        self._expect(b"[")
+        if self._peek() != _RBRACKET:
+            while True:
+                start, end = self._skip_value()
+                yield self._base + start, self._base + end
+                if self._peek() != _COMMA:
+                    break
+                self._pos += 1
+                self._release()
+        self._expect(b"]")
+        self.array_end = self._base + self._pos
+
+    def entries(self) -> Iterator[EntrySpan]:
+        """
+        Yields `(start, end, data)` for every item of `log.entries`.
+
+        Raises `ValueError` if the document is not a HAR object or
+        `log.entries` cannot be found.
+        """
+        for start, end in self.spans():
+            yield start, end, bytes(self._buf[start - self._base : end - self._base])
+
+    def spans(self) -> Iterator[Tuple[int, int]]:
+        """
+        Yields absolute `(start, end)` offsets of every item of `log.entries`.
+
+        Everything outside `log.entries` is checked as well, once the
+        entries have been yielded: other members of the root object must be
+        valid JSON, and only whitespace may follow it.
+
+        Raises `ValueError` if the document is not a HAR object or
+        `log.entries` cannot be found.
+        """
+        found = False
+        for key in self._object_keys():
+            if key == "log" and not found:
+                found = True
+                yield from self._log_spans()
+                continue
+            self._check_value()
+        if not found:
+            raise ValueError("Invalid HAR file: missing 'log'")
+        if self._peek() is not None:
+            raise self._error("unexpected data after the root object")
+
+    def _log_spans(self) -> Iterator[Tuple[int, int]]:
+        found = False
+        for log_key in self._object_keys():
+            if log_key == "entries" and not found:
+                found = True
+                yield from self._array_items()
+                continue
+            start, end = self._skip_value()
+            self.log_members[log_key] = bytes(self._buf[start:end])
+        if not found:
+            raise ValueError("Invalid HAR file: missing 'entries' in 'log'")
+
+    def _check_value(self) -> None:
+        """Skips the next JSON value, raising if it is not valid JSON."""
+        start, end = self._skip_value()
+        try:
+            orjson.loads(bytes(self._buf[start:end]))
+        except orjson.JSONDecodeError:
+            self._pos = start
+            raise self._error("invalid JSON value") from None
+
+    def log_json(self) -> bytes:
+        """
+        Returns the scanned `log` object without its entries, as JSON with
+        an empty `entries` array. Only complete once `spans()` is exhausted.
+        """
+        members = [
+            orjson.dumps(key) + b":" + raw for key, raw in self.log_members.items()
+        ]
+        members.append(b'"entries":[]')
+        return b"{" + b",".join(members) + b"}"
+
+
+def loads(data: Buffer) -> Any:
+    """Decodes JSON from any supported buffer with orjson."""
+    if isinstance(data, mmap.mmap):
+        with memoryview(data) as view:
+            return orjson.loads(view)
+    return orjson.loads(data)
+
+
+@contextmanager
+def map_file(path: Union[str, Path], sequential: bool = False) -> Iterator[Buffer]:
+    """
+    Memory-maps the file at *path* read-only.
+
+    With `sequential=True` the kernel is advised that the mapping is read
+    front to back, so pages behind the reader can be dropped early.
+    """
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if sequential and hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            yield mapped
+
+
+def detect_compression(head: Union[bytes, str]) -> Optional[str]:
+    """
+    Returns the compression format whose magic bytes start *head*
+    (`"gzip"`, `"bz2"`, `"xz"` or `"zstd"`), None for plain data.
+    """
+    if isinstance(head, str):
+        return None
+    for name, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+class _DecompressedReader:
+    """
+    Wraps a decompressing reader so that corrupt or truncated input raises
+    `ValueError`, whatever the decompressor reports it with.
+
+    Args:
+        reader: Reader
+            The decompressing reader.
+        errors: Tuple[type[Exception], ...]
+            Exceptions of the decompressor raised for corrupt data, besides
+            the stdlib ones.
+    """
+
+    def __init__(self, reader: Reader, errors: Tuple[type[Exception], ...] = ()):
+        self._reader = reader
+        self._errors = (EOFError, zlib.error, lzma.LZMAError) + errors
+
+    def read(self, size: int = -1, /) -> Any:
+        try:
+            return self._reader.read(size)
+        except self._errors as exc:
+            raise ValueError("Invalid HAR file: corrupt compressed data") from exc
+        except OSError as exc:
+            # gzip and bz2 report corrupt data as an OSError without errno;
+            # failing reads of the underlying file carry one.
+            if exc.errno is not None:
+                raise
+            raise ValueError("Invalid HAR file: corrupt compressed data") from exc
+
+    def close(self) -> None:
+        self._reader.close()
+
+
+def _open_zstd(fileobj: Any) -> Reader:
+    try:
+        from compression import zstd  # Python 3.14+
+    except ImportError:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "Reading zstd-compressed HAR files requires the 'zstandard' "
+                "package (pip install hario-core[zstd])"
+            ) from exc
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            fileobj, read_across_frames=True
+        )
+        return _DecompressedReader(reader, (zstandard.ZstdError,))
+    return _DecompressedReader(zstd.ZstdFile(fileobj), (zstd.ZstdError,))
+
+
+def decompress_stream(fileobj: Any, compression: str) -> Reader:
+    """
+    Wraps *fileobj* in a reader yielding its decompressed content.
+
+    Reads of corrupt or truncated data raise `ValueError("Invalid HAR
+    file")` for every format.
+    """
+    if compression == "gzip":
+        return _DecompressedReader(gzip.GzipFile(fileobj=fileobj, mode="rb"))
+    if compression == "bz2":
+        return _DecompressedReader(bz2.BZ2File(fileobj))
+    if compression == "xz":
+        return _DecompressedReader(lzma.LZMAFile(fileobj))
+    if compression == "zstd":
+        return _open_zstd(fileobj)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+class _PrefixedReader(io.RawIOBase):
+    """Re-attaches already consumed leading bytes to a file-like object."""
+
+    def __init__(self, head: Any, raw: IO[Any]):
+        self._head = head
+        self._raw = raw
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> Any:
+        if not self._head:
+            return (
+                self._raw.read() if size is None or size < 0 else self._raw.read(size)
+            )
+        if size is None or size < 0:
+            data, self._head = self._head + self._raw.read(), self._head[:0]
+            return data
+        data, self._head = self._head[:size], self._head[size:]
+        return data
+
+
+@contextmanager
+def open_input(
+    src: JsonSource, stream: bool = False, mmap_threshold: Optional[int] = None
+) -> Iterator[Union[Buffer, Reader]]:
+    """
+    Opens *src* either as a buffer holding the whole document or as a
+    readable stream.
+
+    Compressed input (gzip, bz2, xz, zstd) is detected by its magic bytes
+    and always returned as a stream of decompressed data, so no
+    decompressed copy is written to disk. Otherwise files of at least
+    *mmap_threshold* bytes (default `MMAP_THRESHOLD`) are memory-mapped,
+    smaller files are read, and buffers are returned as is. File-like
+    objects are returned as streams with `stream=True`, read otherwise.
+    """
+    if isinstance(src, (str, Path)):
+        with open(src, "rb") as fh:
+            compression = detect_compression(fh.read(_MAGIC_SIZE))
+            fh.seek(0)
+            if compression is not None:
+                with closing(decompress_stream(fh, compression)) as reader:
+                    yield reader
+                return
+            threshold = MMAP_THRESHOLD if mmap_threshold is None else mmap_threshold
+            if os.fstat(fh.fileno()).st_size < threshold:
+                yield fh.read()
+                return
+        with map_file(src, sequential=stream) as mapped:
+            yield mapped
+    elif isinstance(src, BUFFER_TYPES):
+        compression = detect_compression(bytes(src[:_MAGIC_SIZE]))
+        if compression is None:
+            yield src
+            return
+        with closing(decompress_stream(io.BytesIO(src), compression)) as reader:
+            yield reader
+    else:
+        head = src.read(_MAGIC_SIZE)
+        compression = detect_compression(head)
+        if compression is not None:
+            prefixed = _PrefixedReader(head, src)
+            with closing(decompress_stream(prefixed, compression)) as reader:
+                yield reader
+        elif stream:
+            yield _PrefixedReader(head, src)
+        else:
+            data = head + src.read()
+            yield data.encode("utf-8") if isinstance(data, str) else data
+
+
+@contextmanager
+def open_scanner(
+    src: JsonSource, chunk_size: int = CHUNK_SIZE
+) -> Iterator[EntryScanner]:
+    """
+    Opens *src* and returns an `EntryScanner` reading from it.
+
+    Files are memory-mapped and buffers are scanned in place; file-like
+    objects and compressed input are read in chunks of *chunk_size* bytes.
+    """
+    with open_input(src, stream=True, mmap_threshold=0) as data:
+        if isinstance(data, BUFFER_TYPES):
+            yield EntryScanner(buffer=data)
+        else:
+            yield EntryScanner(read=data.read, chunk_size=chunk_size)
+
+
+def iter_entry_spans(
+    src: JsonSource, chunk_size: int = CHUNK_SIZE
+) -> Iterator[EntrySpan]:
+    """
+    Yields `(start, end, data)` for every item of `log.entries` in *src*.
+
+    `start` and `end` are absolute byte offsets in the (decoded) document,
+    `data` holds the raw JSON bytes of the entry.
+    """
+    with open_scanner(src, chunk_size) as scanner:
+        yield from scanner.entries()
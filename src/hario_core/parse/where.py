@@ -0,0 +1,138 @@
+"""
+Filters evaluated on raw entry dicts, before validation.
+
+- `parse(src, where=...)` and `iter_entries(src, where=...)` drop entries
+  that do not match before they are validated, so they never pay for it.
+- `Where` covers the common cases (URL prefix or host, method, status,
+  `_resourceType`, time window); any callable taking the raw entry dict
+  and returning a bool works as well.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Collection, Dict, FrozenSet, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from pydantic import TypeAdapter, ValidationError
+
+# A filter on raw entry dicts.
+EntryFilter = Callable[[Dict[str, Any]], bool]
+
+# Parses `startedDateTime` of entries decoded without validation as the
+# models do: `datetime.fromisoformat` rejects a trailing `Z`, 7-digit
+# fractions and `+0100` offsets on Python 3.10.
+_DATETIME: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+def _as_set(value: Union[str, Collection[str]], upper: bool = False) -> FrozenSet[str]:
+    values = [value] if isinstance(value, str) else list(value)
+    return frozenset(value.upper() if upper else value.lower() for value in values)
+
+
+def _as_aware(value: datetime) -> datetime:
+    """Naive datetimes are taken as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _started(entry: Dict[str, Any]) -> Optional[datetime]:
+    started = entry.get("startedDateTime")
+    if isinstance(started, str):
+        try:
+            started = _DATETIME.validate_python(started)
+        except ValidationError:
+            return None
+    return _as_aware(started) if isinstance(started, datetime) else None
+
+
+class Where:
+    """
+    A filter on the raw fields of entries; an entry matches if it satisfies
+    every given condition.
+
+    Entries lacking a field a condition refers to (including malformed
+    ones) do not match, and are dropped without being validated.
+
+    Args:
+        url_prefix: Optional[Union[str, Collection[str]]]
+            `request.url` starts with this prefix (or any of these).
+        host: Optional[Union[str, Collection[str]]]
+            Host name of `request.url`, without port, case-insensitive.
+        method: Optional[Union[str, Collection[str]]]
+            `request.method`, case-insensitive.
+        status: Optional[Union[int, range]]
+            `response.status`, e.g. `404` or `range(500, 600)`.
+        resource_type: Optional[Union[str, Collection[str]]]
+            DevTools `_resourceType`, e.g. `"xhr"` or `["xhr", "fetch"]`.
+        started_after: Optional[datetime]
+            `startedDateTime` at or after this time (naive times are UTC).
+        started_before: Optional[datetime]
+            `startedDateTime` before this time.
+    """
+
+    def __init__(
+        self,
+        url_prefix: Optional[Union[str, Collection[str]]] = None,
+        host: Optional[Union[str, Collection[str]]] = None,
+        method: Optional[Union[str, Collection[str]]] = None,
+        status: Optional[Union[int, range]] = None,
+        resource_type: Optional[Union[str, Collection[str]]] = None,
+        started_after: Optional[datetime] = None,
+        started_before: Optional[datetime] = None,
+    ):
+        self.url_prefix: Optional[Tuple[str, ...]] = None
+        if url_prefix is not None:
+            self.url_prefix = (
+                (url_prefix,) if isinstance(url_prefix, str) else tuple(url_prefix)
+            )
+        self.host = _as_set(host) if host is not None else None
+        self.method = _as_set(method, upper=True) if method is not None else None
+        self.status = range(status, status + 1) if isinstance(status, int) else status
+        self.resource_type = (
+            _as_set(resource_type) if resource_type is not None else None
+        )
+        self.started_after = _as_aware(started_after) if started_after else None
+        self.started_before = _as_aware(started_before) if started_before else None
+
+    def __call__(self, entry: Dict[str, Any]) -> bool:
+        try:
+            request = entry["request"]
+            if self.url_prefix is not None or self.host is not None:
+                url = request["url"]
+                if self.url_prefix is not None and not url.startswith(self.url_prefix):
+                    return False
+                if self.host is not None:
+                    host = urlsplit(url).hostname
+                    if host is None or host not in self.host:
+                        return False
+            if self.method is not None and request["method"].upper() not in (
+                self.method
+            ):
+                return False
+            if self.status is not None and entry["response"]["status"] not in (
+                self.status
+            ):
+                return False
+            if self.resource_type is not None:
+                resource_type = entry.get("_resourceType")
+                if not isinstance(resource_type, str) or (
+                    resource_type.lower() not in self.resource_type
+                ):
+                    return False
+        except (KeyError, TypeError, AttributeError, ValueError):
+            return False
+        if self.started_after is not None or self.started_before is not None:
+            started = _started(entry)
+            if started is None:
+                return False
+            if self.started_after is not None and started < self.started_after:
+                return False
+            if self.started_before is not None and started >= self.started_before:
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        conditions = ", ".join(
+            f"{name}={value!r}"
+            for name, value in vars(self).items()
+            if value is not None
+        )
+        return f"Where({conditions})"
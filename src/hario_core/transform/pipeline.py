@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Any, Optional, Sequence
+from itertools import islice
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 from hario_core.transform.interfaces import Processor, ProcessorConfig, Transformer
 from hario_core.transform.strategies import (
     AsyncStrategy,
+    ForkStrategy,
     ProcessingStrategy,
     ProcessPoolStrategy,
     SequentialStrategy,
@@ -17,11 +21,27 @@ def _chunked(seq: list[Any], size: int) -> list[list[Any]]:
     return [seq[i : i + size] for i in range(0, len(seq), size)]
 
 
+def _iter_chunked(entries: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(entries)
+    while batch := list(islice(iterator, size)):
+        if not isinstance(batch[0], dict):
+            raise TypeError(
+                "Pipeline.process_iter expects an iterable of dicts "
+                "(model_dump'ed entries)"
+            )
+        yield batch
+
+
 @dataclass
 class PipelineConfig(ProcessorConfig):
     batch_size: int = 20000
     processing_strategy: str = "sequential"
     max_workers: Optional[int] = None
+    # Batches taken from the input but not yet yielded by `process_iter`;
+    # by default twice the number of workers.
+    max_in_flight: Optional[int] = None
+    # How the process strategy ships batches to workers: "pickle" or "json".
+    transport: str = "pickle"
 
 
 DEFAULT_PIPELINE_CONFIG = PipelineConfig()
@@ -32,12 +52,17 @@ class Pipeline(Processor):
     Pipeline for processing HAR data (HarLog, Pydantic model).
     Uses threading for parallel transformation.
 
+    With the process strategy, worker processes are started once and
+    reused by later calls; use the pipeline as a context manager, or call
+    `close()`, to shut them down.
+
     Args:
         transformers: Sequence[Transformer]
             A sequence of transformers to apply to HAR entries.
             Defaults to an empty sequence.
         config: PipelineConfig
-            Configuration object with batch_size, processing_strategy, max_workers.
+            Configuration object with batch_size, processing_strategy,
+            max_workers, max_in_flight and transport.
             If not provided, uses DEFAULT_PIPELINE_CONFIG.
     """
 
@@ -52,17 +77,39 @@ class Pipeline(Processor):
         self.strategy = self._get_strategy(
             self.config.processing_strategy, self.config.max_workers
         )
+        self.max_in_flight = self.config.max_in_flight or 2 * (
+            self.config.max_workers or os.cpu_count() or 1
+        )
+
+    def __enter__(self) -> Pipeline:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool kept by the process strategy between
+        calls. The pipeline can still be used: a new pool is started.
+        """
+        self.strategy.close()
 
     def _get_strategy(
         self, strategy_name: str, max_workers: Optional[int]
     ) -> ProcessingStrategy:
         strategies = {
-            "process": ProcessPoolStrategy(max_workers),
+            "process": ProcessPoolStrategy(max_workers, self.config.transport),
+            "fork": ForkStrategy(max_workers, self.config.transport),
             "thread": ThreadPoolStrategy(max_workers),
             "sequential": SequentialStrategy(),
             "async": AsyncStrategy(),
         }
-        return strategies.get(strategy_name, ProcessPoolStrategy(max_workers))
+        return strategies.get(strategy_name, strategies["process"])
 
     def process(self, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -77,3 +124,22 @@ class Pipeline(Processor):
             )
         batches = _chunked(entries, self.batch_size)
         return self.strategy.process_batches(batches, self.transformers)
+
+    def process_iter(
+        self, entries: Iterable[dict[str, Any]]
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Process HAR entry dicts from any iterable, e.g. `iter_entries(...,
+        raw=True)`, yielding transformed dicts as their batches complete.
+
+        The input is consumed `batch_size` entries at a time, and at most
+        `max_in_flight` batches are taken but not yet yielded, so memory
+        does not grow with the input: a slow consumer holds back the
+        input. With the thread and process strategies results come in
+        completion order, as with `process`.
+        """
+        batches = _iter_chunked(entries, self.batch_size)
+        for batch in self.strategy.iter_batches(
+            batches, self.transformers, self.max_in_flight
+        ):
+            yield from batch
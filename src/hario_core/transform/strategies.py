@@ -1,9 +1,43 @@
+import gc
+import itertools
+import multiprocessing
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from hario_core.transform.interfaces import Transformer
-from hario_core.transform.worker import init_worker, process_batch
+from hario_core.transform.worker import (
+    decode_entries,
+    encode_entries,
+    has_datetimes,
+    init_worker,
+    process_batch,
+    process_installed_batch,
+    process_json_batch,
+    process_shared_batch,
+    share_batches,
+)
+
+# Tokens of the transformers installed in process pools.
+_generations = itertools.count(1)
+
+# Batch transports of `ProcessPoolStrategy`.
+TRANSPORTS = ("pickle", "json")
+
+# Held while batches are shared with workers being forked.
+_share_lock = threading.Lock()
 
 
 class ProcessingStrategy(ABC):
@@ -26,29 +60,208 @@ class ProcessingStrategy(ABC):
     ) -> List[Dict[str, Any]]:
         pass
 
+    def iter_batches(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        transformers: List[Transformer],
+        max_in_flight: int,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the transformed batches while *batches* is consumed, with at
+        most *max_in_flight* batches taken but not yet yielded.
+
+        The default processes one batch at a time, in order.
+        """
+        for batch in batches:
+            yield process_batch(batch, transformers)
+
+    def close(self) -> None:
+        """Releases resources kept between calls, such as worker pools."""
+
+
+def _iter_completed(
+    submit: Callable[[List[Dict[str, Any]]], "Future[Any]"],
+    batches: Iterable[List[Dict[str, Any]]],
+    max_in_flight: int,
+    result: Callable[["Future[Any]"], List[Dict[str, Any]]] = Future.result,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Submits *batches* with *submit*, never more than *max_in_flight* at
+    once, and yields the `result` of each in completion order. Pending
+    batches are cancelled if the consumer stops early.
+    """
+    pending: Set["Future[Any]"] = set()
+    try:
+        for batch in batches:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield result(future)
+            pending.add(submit(batch))
+        for future in as_completed(pending):
+            pending.discard(future)
+            yield result(future)
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class ProcessPoolStrategy(ProcessingStrategy):
     """
     Processing strategy that uses a ProcessPoolExecutor to process batches in parallel.
+
+    The pool is started on first use, with the transformers installed in
+    every worker by `init_worker`, and kept for later calls with the same
+    transformers, so process start-up and imports are paid once. Batches
+    only carry the token of the installed transformers, which are pickled
+    once per worker rather than once per batch. Call
+    `close()` (or close the owning `Pipeline`) to shut it down; a pool
+    whose strategy is garbage collected is shut down as well.
+
+    Args:
+        max_workers: Optional[int]
+            Number of worker processes, by default the CPU count.
+        transport: str
+            How batches and results travel to and from workers: `"pickle"`,
+            or `"json"` to send them as orjson-encoded bytes, which is much
+            cheaper for nested entry dicts. With `"json"` entries must be
+            JSON-compatible: tuples come back as lists, and a datetime
+            `startedDateTime` is restored, other datetimes stay strings.
     """
 
-    def __init__(self, max_workers: Optional[int] = None):
+    def __init__(self, max_workers: Optional[int] = None, transport: str = "pickle"):
+        if transport not in TRANSPORTS:
+            raise ValueError(
+                f"Unknown transport {transport!r}, expected one of {TRANSPORTS}"
+            )
         self.max_workers = max_workers
+        self.transport = transport
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._transformers: Tuple[Transformer, ...] = ()
+        self._token = 0
+        self._finalizer: Optional[weakref.finalize] = None
+
+    def _pool(self, transformers: List[Transformer]) -> ProcessPoolExecutor:
+        """Returns the pool, (re)started if the transformers changed."""
+        if self._executor is not None and (
+            len(transformers) != len(self._transformers)
+            or any(a is not b for a, b in zip(transformers, self._transformers))
+        ):
+            self.close()
+        if self._executor is None:
+            self._token = next(_generations)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_worker,
+                initargs=(transformers, self._token),
+            )
+            self._transformers = tuple(transformers)
+            self._finalizer = weakref.finalize(
+                self, self._executor.shutdown, wait=False, cancel_futures=True
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shuts the worker pool down, waiting for running batches."""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._transformers = ()
+
+    def _submit(self, executor: Executor, batch: List[Dict[str, Any]]) -> "Future[Any]":
+        if self.transport == "json":
+            return executor.submit(
+                process_json_batch,
+                encode_entries(batch),
+                self._token,
+                has_datetimes(batch),
+            )
+        return executor.submit(process_installed_batch, batch, self._token)
+
+    def _result(self, future: "Future[Any]") -> List[Dict[str, Any]]:
+        if self.transport == "json":
+            return decode_entries(*future.result())
+        result: List[Dict[str, Any]] = future.result()
+        return result
 
     def process_batches(
         self, batches: List[List[Dict[str, Any]]], transformers: List[Transformer]
     ) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
-        with ProcessPoolExecutor(
-            max_workers=self.max_workers,
-            initializer=init_worker,
-            initargs=(transformers,),
-        ) as executor:
-            futures = [
-                executor.submit(process_batch, batch, transformers) for batch in batches
-            ]
+        executor = self._pool(transformers)
+        try:
+            futures = [self._submit(executor, batch) for batch in batches]
             for future in as_completed(futures):
-                results.extend(future.result())
+                results.extend(self._result(future))
+        except BrokenProcessPool:
+            # A worker died: start a fresh pool on the next call.
+            self.close()
+            raise
+        return results
+
+    def iter_batches(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        transformers: List[Transformer],
+        max_in_flight: int,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        executor = self._pool(transformers)
+        try:
+            yield from _iter_completed(
+                partial(self._submit, executor), batches, max_in_flight, self._result
+            )
+        except BrokenProcessPool:
+            self.close()
+            raise
+
+
+class ForkStrategy(ProcessPoolStrategy):
+    """
+    Process strategy sharing the input with workers through `fork`.
+
+    `process_batches` stores the batches in the worker module before the
+    workers are forked, so they inherit them copy-on-write and receive
+    only batch positions; nothing is pickled on the input side. Results
+    come back with the `transport`, preferably `"json"`. The garbage
+    collector is frozen meanwhile, so that it does not touch, and copy, the
+    inherited pages.
+
+    The pool is forked for every call, since it has to see that call's
+    input. Streams given to `iter_batches` are not in memory ahead of time
+    and go through the persistent pool of `ProcessPoolStrategy`, as do all
+    calls on platforms without the `fork` start method (Windows).
+    """
+
+    def process_batches(
+        self, batches: List[List[Dict[str, Any]]], transformers: List[Transformer]
+    ) -> List[Dict[str, Any]]:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return super().process_batches(batches, transformers)
+        results: List[Dict[str, Any]] = []
+        token = next(_generations)
+        encode = self.transport == "json"
+        with _share_lock:
+            share_batches(batches)
+            gc.freeze()
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=init_worker,
+                    initargs=(transformers, token),
+                ) as executor:
+                    futures = [
+                        executor.submit(process_shared_batch, index, token, encode)
+                        for index in range(len(batches))
+                    ]
+                    for future in as_completed(futures):
+                        results.extend(self._result(future))
+            finally:
+                gc.unfreeze()
+                share_batches([])
         return results
 
 
@@ -72,6 +285,19 @@ class ThreadPoolStrategy(ProcessingStrategy):
                 results.extend(future.result())
         return results
 
+    def iter_batches(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        transformers: List[Transformer],
+        max_in_flight: int,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from _iter_completed(
+                partial(executor.submit, process_batch, transformers=transformers),
+                batches,
+                max_in_flight,
+            )
+
 
 class SequentialStrategy(ProcessingStrategy):
     """
@@ -1,19 +1,28 @@
-from typing import Any, Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import orjson
 
 from hario_core.transform.interfaces import Transformer
 
 _transformers: List[Transformer] = []
+# Identifies the transformers installed by `init_worker`.
+_token: Optional[int] = None
+# Batches set by the parent before forking, inherited copy-on-write.
+_shared_batches: List[List[Dict[str, Any]]] = []
 
 
-def init_worker(transformers: List[Transformer]) -> None:
+def init_worker(transformers: List[Transformer], token: Optional[int] = None) -> None:
     """
     Initialize the worker with the provided transformers.
 
     Args:
         transformers: List of transformers to apply
+        token: Identifies these transformers for `process_installed_batch`
     """
-    global _transformers
+    global _transformers, _token
     _transformers = transformers
+    _token = token
 
 
 def process_entry(entry_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -44,3 +53,103 @@ def process_batch(
     global _transformers
     _transformers = transformers
     return [process_entry(entry) for entry in batch]
+
+
+def process_installed_batch(
+    batch: List[Dict[str, Any]], token: int
+) -> List[Dict[str, Any]]:
+    """
+    Process a batch of entries with the transformers installed by
+    `init_worker`, so they are not sent along with every batch.
+
+    Args:
+        batch: List of entry dictionaries to process
+        token: The token the transformers were installed with
+
+    Returns:
+        List of processed entry dictionaries
+    """
+    if token != _token:
+        raise RuntimeError("The worker's transformers are out of date")
+    return [process_entry(entry) for entry in batch]
+
+
+def has_datetimes(batch: List[Dict[str, Any]]) -> bool:
+    """Tells whether the entries of *batch* hold `startedDateTime` as datetime."""
+    return bool(batch) and isinstance(batch[0].get("startedDateTime"), datetime)
+
+
+def encode_entries(entries: List[Dict[str, Any]]) -> bytes:
+    """Encodes entry dicts for the `"json"` transport."""
+    return orjson.dumps(entries)
+
+
+def decode_entries(data: bytes, datetimes: bool) -> List[Dict[str, Any]]:
+    """
+    Decodes entry dicts encoded by `encode_entries`.
+
+    Args:
+        data: The encoded entries
+        datetimes: Convert `startedDateTime` back to a datetime
+
+    Returns:
+        List of entry dictionaries
+    """
+    entries: List[Dict[str, Any]] = orjson.loads(data)
+    if datetimes:
+        for entry in entries:
+            started = entry.get("startedDateTime")
+            if isinstance(started, str):
+                entry["startedDateTime"] = datetime.fromisoformat(started)
+    return entries
+
+
+def process_json_batch(data: bytes, token: int, datetimes: bool) -> Tuple[bytes, bool]:
+    """
+    Process a batch encoded by `encode_entries` with the installed
+    transformers and encode the results the same way.
+
+    Args:
+        data: The encoded batch
+        token: The token the transformers were installed with
+        datetimes: Whether `startedDateTime` was a datetime
+
+    Returns:
+        The encoded results and whether to restore `startedDateTime`, as
+        the transformers left it
+    """
+    results = process_installed_batch(decode_entries(data, datetimes), token)
+    return encode_entries(results), has_datetimes(results)
+
+
+def share_batches(batches: List[List[Dict[str, Any]]]) -> None:
+    """
+    Make *batches* available to `process_shared_batch` in workers forked
+    from now on. Call with an empty list once the workers are done.
+
+    Args:
+        batches: List of batches of entry dictionaries
+    """
+    global _shared_batches
+    _shared_batches = batches
+
+
+def process_shared_batch(
+    index: int, token: int, encode: bool
+) -> Union[List[Dict[str, Any]], Tuple[bytes, bool]]:
+    """
+    Process the batch at *index* of the batches inherited from the parent
+    (see `share_batches`), so only the index is sent to the worker.
+
+    Args:
+        index: Position of the batch in the shared batches
+        token: The token the transformers were installed with
+        encode: Return the results encoded as by `process_json_batch`
+
+    Returns:
+        List of processed entry dictionaries, or their encoding
+    """
+    results = process_installed_batch(_shared_batches[index], token)
+    if encode:
+        return encode_entries(results), has_datetimes(results)
+    return results
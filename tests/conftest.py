@@ -1,7 +1,9 @@
 """Pytest fixtures for HARP."""
 
-from typing import Any, Dict, List, cast
+import copy
+from typing import Any, Callable, Dict, List, Optional, cast
 
+import orjson
 import pytest
 
 from hario_core.models import DevToolsEntry, Entry, HarLog
@@ -9,6 +11,55 @@ from hario_core.parse import validate
 
 from .samples import CHROME_DEVTOOLS_HAR, CLEANED_HAR
 
+# Sample entries used by the HAR builders, by kind.
+SAMPLE_ENTRIES: Dict[str, Dict[str, Any]] = {
+    "plain": CLEANED_HAR["log"]["entries"][0],
+    "devtools": CHROME_DEVTOOLS_HAR["log"]["entries"][0],
+}
+
+
+def build_entries(*kinds: str, count: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Deep copies of the sample entries of *kinds* ("plain" or "devtools"),
+    repeated in turn up to *count* entries (by default one per kind). The
+    `comment` of every entry is its position.
+    """
+    kinds = kinds or ("plain",)
+    count = len(kinds) if count is None else count
+    return [
+        dict(
+            copy.deepcopy(SAMPLE_ENTRIES[kinds[index % len(kinds)]]), comment=str(index)
+        )
+        for index in range(count)
+    ]
+
+
+def build_har(*kinds: str, count: Optional[int] = None) -> Dict[str, Any]:
+    """A HAR dict with the log of the DevTools sample and `build_entries`."""
+    entries = build_entries(*kinds, count=count)
+    return {"log": dict(CHROME_DEVTOOLS_HAR["log"], entries=entries)}
+
+
+@pytest.fixture
+def make_entries() -> Callable[..., List[Dict[str, Any]]]:
+    return build_entries
+
+
+@pytest.fixture
+def make_har() -> Callable[..., Dict[str, Any]]:
+    return build_har
+
+
+@pytest.fixture
+def mixed_har() -> Dict[str, Any]:
+    """A HAR mixing plain and DevTools entries."""
+    return build_har("plain", "devtools", "devtools", "plain", "devtools")
+
+
+@pytest.fixture
+def mixed_har_bytes(mixed_har: Dict[str, Any]) -> bytes:
+    return orjson.dumps(mixed_har)
+
 
 @pytest.fixture
 def chrome_devtools_har() -> Dict[str, Any]:
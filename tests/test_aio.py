@@ -0,0 +1,170 @@
+"""
+Unit tests for the asyncio parse API of hario-core.
+"""
+
+import asyncio
+import gzip
+import io
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry, HarLog
+from hario_core.parse import SnapshotCache, aiter_entries, aparse, iter_entries, parse
+from hario_core.parse.cache import SnapshotReader
+
+
+async def _collect(entries: Any) -> List[Any]:
+    return [entry async for entry in entries]
+
+
+@pytest.fixture(params=["default", "thread", "process"])
+def executor(request: pytest.FixtureRequest) -> Iterator[Optional[Executor]]:
+    if request.param == "default":
+        yield None
+    elif request.param == "thread":
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            yield pool
+    else:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            yield pool
+
+
+class TestAparse:
+    def test_aparse(
+        self, tmp_path: Path, mixed_har_bytes: bytes, executor: Optional[Executor]
+    ) -> None:
+        data = mixed_har_bytes
+        path = tmp_path / "test.har"
+        path.write_bytes(data)
+        expected = parse(data)
+
+        async def main() -> List[HarLog]:
+            return list(
+                await asyncio.gather(
+                    aparse(path, executor=executor),
+                    aparse(data, executor=executor, pause_gc=True),
+                    aparse(io.BytesIO(gzip.compress(data)), executor=executor),
+                    aparse(memoryview(data), executor=executor),
+                )
+            )
+
+        for har_log in asyncio.run(main()):
+            assert har_log == expected
+            assert type(har_log.entries[1]) is DevToolsEntry
+
+    def test_aparse_process_loads_snapshot_in_slices(
+        self, mixed_har_bytes: bytes
+    ) -> None:
+        with (
+            ProcessPoolExecutor(max_workers=1) as executor,
+            patch("hario_core.parse.aio.BATCH_SIZE", 2),
+            patch.object(
+                SnapshotReader,
+                "read_section",
+                autospec=True,
+                side_effect=SnapshotReader.read_section,
+            ) as read_section,
+        ):
+            har_log = asyncio.run(aparse(mixed_har_bytes, executor=executor))
+        assert har_log == parse(mixed_har_bytes)
+        # Two slices of DevTools entries, one of plain ones, then the end.
+        assert read_section.call_count == 4
+
+    def test_aparse_invalid(self, executor: Optional[Executor]) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(aparse(b"not a json", executor=executor))
+
+    def test_aparse_with_cache(
+        self, tmp_path: Path, mixed_har_bytes: bytes, executor: Optional[Executor]
+    ) -> None:
+        path = tmp_path / "test.har"
+        path.write_bytes(mixed_har_bytes)
+        cache = SnapshotCache(tmp_path / "cache")
+        first = asyncio.run(aparse(path, executor=executor, cache=cache))
+        assert list((tmp_path / "cache").glob("*.snap"))
+        assert asyncio.run(aparse(path, executor=executor, cache=cache)) == first
+
+
+class TestAiterEntries:
+    def test_aiter_entries(
+        self, mixed_har_bytes: bytes, executor: Optional[Executor]
+    ) -> None:
+        data = mixed_har_bytes
+        entries = asyncio.run(
+            _collect(aiter_entries(data, executor=executor, batch_size=3))
+        )
+        assert entries == list(iter_entries(data))
+        assert [entry.__class__ for entry in entries[:2]] == [Entry, DevToolsEntry]
+
+    def test_aiter_entries_raw(
+        self, mixed_har_bytes: bytes, executor: Optional[Executor]
+    ) -> None:
+        data = mixed_har_bytes
+        entries = asyncio.run(
+            _collect(aiter_entries(data, raw=True, executor=executor))
+        )
+        assert entries == orjson.loads(data)["log"]["entries"]
+
+    @pytest.mark.parametrize(
+        "invalid_bytes",
+        [
+            b'{"log": {"entries": [{"a": 1}',
+            orjson.dumps({"log": {"entries": [{"time": "oops"}]}}),
+        ],
+    )
+    def test_aiter_entries_invalid(
+        self, invalid_bytes: bytes, executor: Optional[Executor]
+    ) -> None:
+        with pytest.raises(ValueError):
+            asyncio.run(_collect(aiter_entries(invalid_bytes, executor=executor)))
+
+    def test_aiter_entries_stops_early(
+        self, tmp_path: Path, mixed_har_bytes: bytes
+    ) -> None:
+        path = tmp_path / "test.har"
+        path.write_bytes(mixed_har_bytes)
+
+        async def first() -> Any:
+            entries = aiter_entries(io.BytesIO(path.read_bytes()), batch_size=2)
+            async for entry in entries:
+                await entries.aclose()  # type: ignore[attr-defined]
+                return entry
+
+        assert isinstance(asyncio.run(first()), Entry)
+
+    def test_aiter_entries_cancel_does_not_block_loop(
+        self, mixed_har_bytes: bytes
+    ) -> None:
+        reading, release = threading.Event(), threading.Event()
+
+        class SlowReader(io.BytesIO):
+            def read(self, size: Optional[int] = -1, /) -> bytes:
+                if self.tell() and not reading.is_set():
+                    reading.set()
+                    release.wait(5)
+                return super().read(size)
+
+        async def main() -> float:
+            entries = aiter_entries(SlowReader(mixed_har_bytes), chunk_size=64)
+            task = asyncio.create_task(_collect(entries))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, reading.wait, 5)
+            task.cancel()
+            # The reader is closed once the running batch is done, without
+            # holding up the loop meanwhile.
+            start = time.monotonic()
+            await asyncio.sleep(0.01)
+            elapsed = time.monotonic() - start
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return elapsed
+
+        assert asyncio.run(main()) < 1
@@ -0,0 +1,88 @@
+"""
+Unit tests for batch parsing of many HAR files in hario-core.
+"""
+
+from pathlib import Path
+from typing import Iterator, List, Tuple
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, HarLog
+from hario_core.parse import parse, parse_many
+
+from .samples import CHROME_DEVTOOLS_HAR, CLEANED_HAR
+
+
+def _summary(har_log: HarLog) -> Tuple[int, List[str]]:
+    return len(har_log.entries), [type(entry).__name__ for entry in har_log.entries]
+
+
+@pytest.fixture
+def har_files(tmp_path: Path) -> List[Path]:
+    paths = []
+    for i, har in enumerate([CLEANED_HAR, CHROME_DEVTOOLS_HAR] * 3):
+        path = tmp_path / f"{i}.har"
+        path.write_bytes(orjson.dumps(har))
+        paths.append(path)
+    return paths
+
+
+class TestParseMany:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parse_many(self, har_files: List[Path], workers: int) -> None:
+        results = dict(parse_many(har_files, workers=workers))
+        assert set(results) == set(har_files)
+        for path, har_log in results.items():
+            assert isinstance(har_log, HarLog)
+            assert har_log == parse(path)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_errors_are_returned(
+        self, har_files: List[Path], tmp_path: Path, workers: int
+    ) -> None:
+        invalid = tmp_path / "invalid.har"
+        invalid.write_bytes(b"not a json")
+        missing = tmp_path / "missing.har"
+        results = dict(parse_many([invalid, missing, *har_files], workers=workers))
+        assert isinstance(results[invalid], ValueError)
+        assert isinstance(results[missing], FileNotFoundError)
+        assert all(isinstance(results[path], HarLog) for path in har_files)
+
+    def test_as_dicts(self, har_files: List[Path]) -> None:
+        results = dict(parse_many(har_files, workers=2, as_dicts=True))
+        for path, entries in results.items():
+            assert isinstance(entries, list)
+            assert entries == parse(path).model_dump()["entries"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_apply_runs_in_worker(self, har_files: List[Path], workers: int) -> None:
+        with patch("hario_core.parse.batch.load_snapshot") as load_snapshot:
+            results = dict(parse_many(har_files, workers=workers, apply=_summary))
+        load_snapshot.assert_not_called()
+        for path, summary in results.items():
+            assert summary == _summary(parse(path))
+
+    def test_apply_with_as_dicts(self, har_files: List[Path]) -> None:
+        with pytest.raises(ValueError, match="apply"):
+            next(parse_many(har_files, as_dicts=True, apply=_summary))
+
+    def test_paths_are_consumed_lazily(self, har_files: List[Path]) -> None:
+        pulled = []
+
+        def paths() -> Iterator[Path]:
+            for path in har_files:
+                pulled.append(path)
+                yield path
+
+        results = parse_many(paths(), workers=2, max_in_flight=2)
+        next(results)
+        assert len(pulled) <= 3
+        assert len(list(results)) == len(har_files) - 1
+
+    def test_devtools_models_survive_transport(self, har_files: List[Path]) -> None:
+        results = dict(parse_many(har_files[1:2], workers=2))
+        (har_log,) = results.values()
+        assert isinstance(har_log, HarLog)
+        assert type(har_log.entries[0]) is DevToolsEntry
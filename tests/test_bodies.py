@@ -0,0 +1,103 @@
+"""
+Unit tests for out-of-line body storage in hario-core.
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import orjson
+import pytest
+
+from hario_core.models import BodyRef, BodyStore
+from hario_core.parse import SnapshotCache, parse
+
+BIG_BODY = "QUJD" * 1000
+SMALL_BODY = "small"
+
+
+class TestBodyStore:
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> BodyStore:
+        return BodyStore(tmp_path / "bodies", threshold=1000)
+
+    @pytest.fixture
+    def har_bytes(self, make_har: Callable[..., Dict[str, Any]]) -> bytes:
+        har = make_har("plain", "devtools", "devtools")
+        entries = har["log"]["entries"]
+        for entry, text in zip(entries, [BIG_BODY, SMALL_BODY, BIG_BODY]):
+            entry["response"]["content"]["text"] = text
+        entries[1]["request"]["postData"] = {"mimeType": "text/plain", "text": BIG_BODY}
+        return orjson.dumps(har)
+
+    def _stored_files(self, store: BodyStore) -> List[Path]:
+        return [path for path in store.directory.rglob("*") if path.is_file()]
+
+    def test_parse_moves_large_bodies(self, store: BodyStore, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes, bodies=store)
+        texts = [entry.response.content.text for entry in har_log.entries]
+        assert isinstance(texts[0], BodyRef)
+        assert texts[1] == SMALL_BODY
+        assert isinstance(texts[2], BodyRef)
+        post_data = har_log.entries[1].request.postData
+        assert post_data is not None and isinstance(post_data.text, BodyRef)
+        assert texts[0].read() == str(texts[2]) == BIG_BODY
+        assert len(texts[0]) == len(BIG_BODY)
+        # Identical bodies are stored once.
+        assert len(self._stored_files(store)) == 1
+
+    def test_dumps_are_unchanged(self, store: BodyStore, har_bytes: bytes) -> None:
+        expected = parse(har_bytes)
+        har_log = parse(har_bytes, bodies=store)
+        assert har_log.model_dump() == expected.model_dump()
+        assert har_log.model_dump_json() == expected.model_dump_json()
+
+    def test_bodies_are_read_on_access(
+        self, store: BodyStore, har_bytes: bytes
+    ) -> None:
+        har_log = parse(har_bytes, bodies=store)
+        for path in self._stored_files(store):
+            path.unlink()
+        ref = har_log.entries[0].response.content.text
+        assert isinstance(ref, BodyRef)
+        with pytest.raises(FileNotFoundError):
+            ref.read()
+
+    def test_pickle_round_trip(self, store: BodyStore, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes, bodies=store)
+        restored = pickle.loads(pickle.dumps(har_log))
+        ref = restored.entries[0].response.content.text
+        assert isinstance(ref, BodyRef)
+        assert ref.store.directory == store.directory
+        assert restored == har_log
+
+    def test_offload_threshold(self, tmp_path: Path, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes)
+        assert (
+            BodyStore(tmp_path, threshold=len(BIG_BODY) + 1).offload(har_log.entries)
+            == 0
+        )
+        assert BodyStore(tmp_path, threshold=1).offload(har_log.entries) == 4
+
+    def test_with_snapshot_cache(
+        self, tmp_path: Path, store: BodyStore, har_bytes: bytes
+    ) -> None:
+        file_path = tmp_path / "test.har"
+        file_path.write_bytes(har_bytes)
+        cache = SnapshotCache(tmp_path / "cache")
+        first = parse(file_path, cache=cache, bodies=store)
+        second = parse(file_path, cache=cache, bodies=store)
+        assert isinstance(second.entries[0].response.content.text, BodyRef)
+        assert second == first
+        assert second.model_dump() == parse(har_bytes).model_dump()
+
+    def test_ref_equality(self, store: BodyStore) -> None:
+        ref = store.put(BIG_BODY)
+        assert ref == store.put(BIG_BODY)
+        assert hash(ref) == hash(store.put(BIG_BODY))
+        assert ref != store.put(BIG_BODY + "!")
+        assert ref != BIG_BODY
+
+    def test_lazy_is_rejected(self, store: BodyStore, har_bytes: bytes) -> None:
+        with pytest.raises(ValueError, match="lazy"):
+            parse(har_bytes, lazy=True, bodies=store)
@@ -0,0 +1,129 @@
+"""
+Unit tests for the on-disk snapshot cache in hario-core.
+"""
+
+import io
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry
+from hario_core.parse import SnapshotCache, parse
+from hario_core.parse.cache import SnapshotReader, dump_snapshot, load_snapshot
+
+from .samples import CLEANED_HAR
+
+
+class TestSnapshotCache:
+    @pytest.fixture
+    def har_file(self, tmp_path: Path, mixed_har_bytes: bytes) -> Path:
+        file_path = tmp_path / "test.har"
+        file_path.write_bytes(mixed_har_bytes)
+        return file_path
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> SnapshotCache:
+        return SnapshotCache(tmp_path / "cache")
+
+    def _snapshots(self, cache: SnapshotCache) -> list[Path]:
+        return sorted(cache.directory.glob("*.snap"))
+
+    def test_snapshot_roundtrip(self, mixed_har_bytes: bytes) -> None:
+        har_log = parse(mixed_har_bytes)
+        buffer = io.BytesIO()
+        dump_snapshot(har_log, buffer)
+        buffer.seek(0)
+        restored = load_snapshot(buffer, [DevToolsEntry, Entry])
+        assert restored == har_log
+        assert [entry.__class__ for entry in restored.entries] == [
+            Entry,
+            DevToolsEntry,
+            DevToolsEntry,
+            Entry,
+            DevToolsEntry,
+        ]
+
+    def test_snapshot_sections(self, mixed_har_bytes: bytes) -> None:
+        har_log = parse(mixed_har_bytes)
+        buffer = io.BytesIO()
+        dump_snapshot(har_log, buffer, section_size=2)
+        buffer.seek(0)
+        reader = SnapshotReader(buffer, [DevToolsEntry, Entry])
+        sections = 0
+        while reader.read_section():
+            sections += 1
+        assert sections == 3
+        assert reader.har_log() == har_log
+
+    def test_second_parse_loads_snapshot(
+        self, har_file: Path, cache: SnapshotCache
+    ) -> None:
+        expected = parse(har_file)
+        assert parse(har_file, cache=cache) == expected
+        assert len(self._snapshots(cache)) == 1
+        with patch("hario_core.parse.har_parser.validate_json") as validate_json:
+            assert parse(har_file, cache=cache) == expected
+        validate_json.assert_not_called()
+
+    def test_lookup_does_not_read_source(
+        self, har_file: Path, cache: SnapshotCache
+    ) -> None:
+        parse(har_file, cache=cache)
+        with patch("builtins.open", wraps=open) as opened:
+            parse(har_file, cache=cache)
+        assert [call.args[0] for call in opened.call_args_list] == [
+            *self._snapshots(cache)
+        ]
+
+    def test_changed_file_invalidates(
+        self, har_file: Path, cache: SnapshotCache
+    ) -> None:
+        parse(har_file, cache=cache)
+        har_file.write_bytes(orjson.dumps(CLEANED_HAR))
+        har_log = parse(har_file, cache=cache)
+        assert har_log == parse(orjson.dumps(CLEANED_HAR))
+        assert len(self._snapshots(cache)) == 2
+
+    def test_registry_change_invalidates(
+        self, har_file: Path, cache: SnapshotCache
+    ) -> None:
+        parse(har_file, cache=cache)
+        with patch("hario_core.parse.har_parser.ENTRY_MODEL_REGISTRY", []):
+            har_log = parse(har_file, cache=cache)
+        assert all(entry.__class__ is Entry for entry in har_log.entries)
+        assert len(self._snapshots(cache)) == 2
+
+    def test_corrupt_snapshot_is_rebuilt(
+        self, har_file: Path, cache: SnapshotCache
+    ) -> None:
+        expected = parse(har_file, cache=cache)
+        (snapshot,) = self._snapshots(cache)
+        snapshot.write_bytes(b"garbage")
+        assert parse(har_file, cache=cache) == expected
+        assert snapshot.read_bytes().startswith(b"HARSNAP")
+
+    def test_eviction_by_size(self, tmp_path: Path) -> None:
+        files = []
+        for i in range(3):
+            file_path = tmp_path / f"{i}.har"
+            file_path.write_bytes(orjson.dumps(dict(CLEANED_HAR, comment=str(i))))
+            files.append(file_path)
+        cache = SnapshotCache(tmp_path / "cache", max_bytes=1 << 30)
+        parse(files[0], cache=cache)
+        (first,) = self._snapshots(cache)
+        cache.max_bytes = first.stat().st_size * 2
+        # Make the first snapshot the least recently used one.
+        os.utime(first, ns=(0, 0))
+        parse(files[1], cache=cache)
+        parse(files[2], cache=cache)
+        snapshots = self._snapshots(cache)
+        assert len(snapshots) == 2
+        assert first not in snapshots
+
+    def test_non_path_sources_bypass_cache(self, cache: SnapshotCache) -> None:
+        parse(orjson.dumps(CLEANED_HAR), cache=cache)
+        parse(orjson.dumps(CLEANED_HAR), lazy=True, cache=cache)
+        assert self._snapshots(cache) == []
@@ -0,0 +1,126 @@
+"""
+Unit tests for the compact, slots-based entry records of hario-core.
+"""
+
+import gzip
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import orjson
+import pytest
+from pydantic import Field
+
+from hario_core.models import (
+    BodyRef,
+    BodyStore,
+    CompactDevToolsEntry,
+    CompactEntry,
+    CompactHarLog,
+    Entry,
+)
+from hario_core.models.compact import CompactContent, compact
+from hario_core.parse import SnapshotCache, parse
+from hario_core.parse.har_parser import ENTRY_MODEL_REGISTRY, register_entry_model
+
+
+class TestCompact:
+    @pytest.fixture
+    def har(self, make_har: Callable[..., Dict[str, Any]]) -> Dict[str, Any]:
+        har = make_har("plain", "devtools")
+        har["log"]["entries"][0]["custom"] = {"kept": True}
+        return har
+
+    @pytest.fixture
+    def har_bytes(self, har: Dict[str, Any]) -> bytes:
+        return orjson.dumps(har)
+
+    def test_parse_compact(self, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes, compact=True)
+        assert isinstance(har_log, CompactHarLog)
+        plain, devtools = har_log.entries
+        assert type(plain) is CompactEntry
+        assert type(devtools) is CompactDevToolsEntry
+        assert devtools.resourceType
+        assert plain.extra == {"custom": {"kept": True}}
+        headers = plain.request.headers
+        assert headers and all(type(header) is tuple for header in headers)
+        assert not hasattr(plain, "__dict__")
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_dump_matches_models(self, har_bytes: bytes, compress: bool) -> None:
+        # Compressed input is validated and converted in chunks.
+        src = gzip.compress(har_bytes) if compress else har_bytes
+        har_log = parse(har_bytes)
+        compact_log = parse(src, compact=True)
+        assert [entry.to_dict() for entry in compact_log.entries] == (
+            har_log.model_dump()["entries"]
+        )
+        assert compact_log.to_dict() == har_log.model_dump()
+
+    def test_record_equality_and_pickle(self, har_bytes: bytes) -> None:
+        entries = parse(har_bytes, compact=True).entries
+        again = parse(har_bytes, compact=True).entries
+        assert entries == again
+        assert entries[0] != entries[1]
+        assert pickle.loads(pickle.dumps(entries)) == entries
+
+    def test_record_init(self) -> None:
+        content = CompactContent(size=3, mimeType="text/plain", text="abc")
+        assert content.to_dict() == {
+            "size": 3,
+            "compression": None,
+            "mimeType": "text/plain",
+            "text": "abc",
+            "encoding": None,
+            "comment": None,
+        }
+        with pytest.raises(TypeError):
+            CompactContent(unknown=1)
+
+    def test_custom_entry_model(self, har_bytes: bytes) -> None:
+        class TaggedEntry(Entry):
+            tag: str = Field("tagged", alias="_tag")
+
+        register_entry_model(lambda entry: "custom" in entry, TaggedEntry)
+        try:
+            plain, devtools = parse(har_bytes, compact=True).entries
+        finally:
+            ENTRY_MODEL_REGISTRY.pop(0)
+        assert type(plain) is CompactEntry
+        assert plain.extra == {"custom": {"kept": True}, "tag": "tagged"}
+        assert type(devtools) is CompactDevToolsEntry
+
+    def test_compact_model(self, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes)
+        records = [compact(entry) for entry in har_log.entries]
+        assert records == parse(har_bytes, compact=True).entries
+
+    def test_bodies(self, tmp_path: Path, har: Dict[str, Any]) -> None:
+        har["log"]["entries"][0]["response"]["content"]["text"] = "body" * 100
+        har_bytes = orjson.dumps(har)
+        store = BodyStore(tmp_path, threshold=100)
+        har_log = parse(har_bytes, compact=True, bodies=store)
+        text = har_log.entries[0].response.content.text
+        assert isinstance(text, BodyRef)
+        assert har_log.to_dict() == parse(har_bytes).model_dump()
+
+    def test_invalid(self, har_bytes: bytes) -> None:
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse(har_bytes.replace(b'"request"', b'"requests"'), compact=True)
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse(gzip.compress(har_bytes[:-10]), compact=True)
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"lazy": True}, {"workers": 2}, {"lazy": True, "workers": 4}],
+    )
+    def test_unsupported_options(self, har_bytes: bytes, options: Any) -> None:
+        with pytest.raises(ValueError, match="not supported with compact=True"):
+            parse(har_bytes, compact=True, **options)
+
+    def test_cache_is_rejected(self, tmp_path: Path, har_bytes: bytes) -> None:
+        file_path = tmp_path / "test.har"
+        file_path.write_bytes(har_bytes)
+        with pytest.raises(ValueError, match="cache"):
+            parse(file_path, compact=True, cache=SnapshotCache(tmp_path / "cache"))
@@ -0,0 +1,125 @@
+"""
+Unit tests for the columnar HarFrame of hario-core.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict
+
+import orjson
+import pytest
+
+from hario_core.parse import parse
+
+np = pytest.importorskip("numpy")
+
+from hario_core.analysis import Categories, HarFrame  # noqa: E402
+
+
+class TestHarFrame:
+    @pytest.fixture
+    def har_bytes(self, make_har: Callable[..., Dict[str, Any]]) -> bytes:
+        har = make_har("plain", "devtools", count=6)
+        for index, entry in enumerate(har["log"]["entries"]):
+            entry["time"] = float(index * 100)
+            entry["response"]["status"] = 404 if index == 5 else 200
+            entry["response"]["content"]["size"] = index
+            entry["request"]["method"] = "POST" if index < 2 else "GET"
+            entry["timings"]["ssl"] = None
+        return orjson.dumps(har)
+
+    @pytest.fixture
+    def frame(self, har_bytes: bytes) -> HarFrame:
+        return HarFrame.from_log(parse(har_bytes))
+
+    def test_columns(self, frame: HarFrame, har_bytes: bytes) -> None:
+        har_log = parse(har_bytes)
+        assert len(frame) == 6
+        assert frame["time"].dtype == np.float64
+        assert frame["time"].tolist() == [entry.time for entry in har_log.entries]
+        assert frame["response.status"].tolist() == [200] * 5 + [404]
+        assert np.isnan(frame["timings.ssl"]).all()
+        # DevTools-only columns are missing on plain entries.
+        assert frame["response.transferSize"][0] == -1
+        assert frame["response.transferSize"][1] >= 0
+        assert frame["resourceType"].decode()[:2] == [None, "stylesheet"]
+        started = har_log.entries[0].startedDateTime
+        epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+        microseconds = (started - epoch) // timedelta(microseconds=1)
+        assert frame["startedDateTime"][0] == microseconds * 1000
+        assert frame.datetimes().dtype == np.dtype("datetime64[ns]")
+
+    def test_sources_agree(self, frame: HarFrame, har_bytes: bytes) -> None:
+        others = [
+            HarFrame.from_log(parse(har_bytes, compact=True)),
+            HarFrame.read(har_bytes),
+            HarFrame.from_entries(parse(har_bytes).entries, rows_per_chunk=4),
+        ]
+        for other in others:
+            assert other.columns == frame.columns
+            for name in frame.columns:
+                column, other_column = frame[name], other[name]
+                if isinstance(column, Categories):
+                    assert column.decode() == other_column.decode()
+                else:
+                    assert np.array_equal(column, other_column, equal_nan=True)
+
+    def test_filter(self, frame: HarFrame) -> None:
+        methods = frame["request.method"]
+        assert (methods == "GET").tolist() == [False, False] + [True] * 4
+        assert (methods != "GET").sum() == 2
+        assert not (methods == "PATCH").any()
+        assert methods.isin(["GET", "POST"]).all()
+        selected = frame[(frame["time"] >= 200) & (methods == "GET")]
+        assert len(selected) == 4
+        assert selected["response.content.size"].tolist() == [2, 3, 4, 5]
+        assert selected["request.method"].counts() == {"GET": 4}
+        assert len(frame[np.array([0, 5])]) == 2
+
+    def test_aggregate(self, frame: HarFrame) -> None:
+        by = "request.method"
+        assert frame["request.method"].counts() == {"GET": 4, "POST": 2}
+        assert frame.aggregate(by, func="count") == {"POST": 2.0, "GET": 4.0}
+        assert frame.aggregate(by, "response.content.size") == {
+            "POST": 1.0,
+            "GET": 14.0,
+        }
+        assert frame.aggregate(by, "time", "mean") == {"POST": 50.0, "GET": 350.0}
+        assert frame.aggregate(by, "time", "max") == {"POST": 100.0, "GET": 500.0}
+        assert frame.aggregate("resourceType", "time", "min") == {
+            None: 0.0,
+            "stylesheet": 100.0,
+        }
+        assert frame.aggregate(by, "timings.ssl") == {}
+        with pytest.raises(ValueError):
+            frame.aggregate("time", "time")
+        with pytest.raises(ValueError):
+            frame.aggregate(by, "time", "median")
+
+    def test_aggregate_skips_missing_ints(self, frame: HarFrame) -> None:
+        # Plain entries have no transferSize (-1); only DevTools ones count.
+        sizes = frame["response.transferSize"]
+        devtools = sizes[1::2].astype(np.float64)
+        assert (sizes[::2] == -1).all() and (devtools >= 0).all()
+        by = "request.method"
+        assert frame.aggregate(by, "response.transferSize", "mean") == {
+            "POST": devtools[0],
+            "GET": devtools[1:].mean(),
+        }
+        assert frame.aggregate(by, "response.transferSize", "min") == {
+            "POST": devtools[0],
+            "GET": devtools[1:].min(),
+        }
+        assert frame.aggregate(by, "response.transferSize", "sum") == {
+            "POST": devtools[0],
+            "GET": devtools[1:].sum(),
+        }
+
+    def test_empty(self) -> None:
+        frame = HarFrame.from_entries([])
+        assert len(frame) == 0
+        assert frame["time"].dtype == np.float64
+        assert frame["request.method"].counts() == {}
+
+    def test_invalid_columns(self) -> None:
+        with pytest.raises(ValueError):
+            HarFrame({"a": np.zeros(2), "b": np.zeros(3)})
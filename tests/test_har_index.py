@@ -0,0 +1,95 @@
+"""
+Unit tests for the secondary entry indexes of hario-core.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+import orjson
+import pytest
+
+from hario_core.parse import parse
+
+np = pytest.importorskip("numpy")
+
+from hario_core.analysis import HarIndex  # noqa: E402
+
+_START = datetime(2025, 6, 5, 16, 0, tzinfo=timezone.utc)
+
+
+class TestHarIndex:
+    @pytest.fixture
+    def har_bytes(self, make_har: Callable[..., Dict[str, Any]]) -> bytes:
+        har = make_har("devtools", count=8)
+        for index, entry in enumerate(har["log"]["entries"]):
+            host = "api.test" if index % 2 else "cdn.test:8443"
+            entry["request"]["url"] = f"https://{host}/item/{index}"
+            entry["response"]["status"] = (200, 304, 404, 503)[index % 4]
+            entry["response"]["content"]["mimeType"] = (
+                "application/json; charset=utf-8" if index % 2 else "text/css"
+            )
+            entry["pageref"] = f"page_{index // 4}"
+            entry["_connectionId"] = str(index % 3)
+            # Entries start in reverse order.
+            started = _START + timedelta(seconds=8 - index)
+            entry["startedDateTime"] = started.isoformat()
+        return orjson.dumps(har)
+
+    @pytest.fixture
+    def index(self, har_bytes: bytes) -> HarIndex:
+        return HarIndex.from_log(parse(har_bytes))
+
+    def test_lookup(self, index: HarIndex) -> None:
+        assert index.lookup("host", "api.test").tolist() == [1, 3, 5, 7]
+        assert index.lookup("host", "cdn.test").tolist() == [0, 2, 4, 6]
+        assert index.lookup("status_class", 5).tolist() == [3, 7]
+        assert index.lookup("mimeType", "application/json").tolist() == [1, 3, 5, 7]
+        assert index.lookup("connectionId", "0").tolist() == [0, 3, 6]
+        assert index.lookup("resourceType", "stylesheet").tolist() == list(range(8))
+        assert index.lookup("pageref", "page_9").tolist() == []
+        assert index.values("pageref") == {"page_0": 4, "page_1": 4}
+
+    def test_query(self, index: HarIndex) -> None:
+        assert index.query(host="api.test", status_class=[4, 5]).tolist() == [3, 7]
+        errors = index.query(host="API.Test", status_class=range(4, 6))
+        assert errors.tolist() == [3, 7]
+        assert index.lookup("host", "CDN.test").tolist() == [0, 2, 4, 6]
+        assert index.query(host="api.test", pageref="page_1").tolist() == [5, 7]
+        assert index.query(status_class=2, mimeType="TEXT/CSS").tolist() == [0, 4]
+        assert index.query(host="api.test", status_class=2).tolist() == []
+        assert index.query(host="other.test").tolist() == []
+        assert index.query().tolist() == list(range(8))
+        entries = index.find(connectionId="1", pageref="page_0")
+        assert entries == [index.entries[1]]
+
+    def test_time_range(self, index: HarIndex) -> None:
+        after = _START + timedelta(seconds=3)
+        before = _START + timedelta(seconds=6)
+        # Entry i starts at second 8 - i.
+        assert index.query(started_after=after).tolist() == [0, 1, 2, 3, 4, 5]
+        assert index.query(started_before=before).tolist() == [3, 4, 5, 6, 7]
+        window = index.query(started_after=after, started_before=before)
+        assert window.tolist() == [3, 4, 5]
+        assert index.query(started_after=after, host="api.test").tolist() == [1, 3, 5]
+        assert index.query(started_after=before, started_before=after).tolist() == []
+        naive = datetime(2025, 6, 5, 16, 0, 6)
+        assert index.query(started_after=naive).tolist() == [0, 1, 2]
+
+    def test_models_and_records_agree(self, har_bytes: bytes) -> None:
+        models = HarIndex.from_log(parse(har_bytes))
+        records = HarIndex.from_log(parse(har_bytes, compact=True))
+        queries: List[Dict[str, Any]] = [
+            {"host": "api.test"},
+            {"status_class": 3, "connectionId": ["1", "2"]},
+            {"mimeType": "text/css", "started_before": _START + timedelta(seconds=5)},
+        ]
+        for criteria in queries:
+            assert models.query(**criteria).tolist() == (
+                records.query(**criteria).tolist()
+            )
+
+    def test_empty(self) -> None:
+        index = HarIndex([])
+        assert len(index) == 0
+        assert index.query(host="api.test").tolist() == []
+        assert index.query(started_after=_START).tolist() == []
@@ -6,8 +6,11 @@ Unit tests for the HAR parser in hario-core.
 - Ensure correct error handling for invalid and edge-case inputs.
 """
 
+import gc
+import gzip
 import io
 import json
+import pickle
 from pathlib import Path
 from typing import Any, Callable, Dict, Type
 from unittest.mock import patch
@@ -19,10 +22,15 @@ from hario_core.models import DevToolsEntry, Entry, HarLog
 from hario_core.parse import (
     entry_selector,
     har_parser,
+    iter_entries,
     parse,
+    parse_entries,
     register_entry_model,
     validate,
+    validate_json,
 )
+from hario_core.parse.har_parser import CachedEntrySelector, is_devtools_entry
+from hario_core.transform import Pipeline, by_field, set_id
 
 from .samples import (
     CHROME_DEVTOOLS_HAR,
@@ -109,6 +117,17 @@ class TestHarParser:
         har_log = parse(har_bytes)
         assert isinstance(har_log.entries[0], expected_type)
 
+    @pytest.mark.parametrize(
+        "har_bytes", [CLEANED_HAR_BYTES, CHROME_DEVTOOLS_HAR_BYTES]
+    )
+    def test_validate_json_matches_validate(self, har_bytes: bytes) -> None:
+        har_log = validate_json(har_bytes)
+        expected = validate(orjson.loads(har_bytes))
+        assert type(har_log) is HarLog
+        assert har_log.entries[0].__class__ is expected.entries[0].__class__
+        assert har_log == expected
+        assert pickle.loads(pickle.dumps(har_log)) == expected
+
     def test_load_har_with_mixed_entries(self) -> None:
         har_log = validate(CHROME_DEVTOOLS_HAR)
         assert len(har_log.entries) == 1
@@ -204,8 +223,10 @@ class TestHarParser:
         def never_true_detector(entry: Dict[str, Any]) -> bool:
             return False
 
-        register_entry_model(never_true_detector, DevToolsEntry)
-        model = entry_selector(cleaned_entry)
+        registry = list(har_parser.ENTRY_MODEL_REGISTRY)
+        with patch("hario_core.parse.har_parser.ENTRY_MODEL_REGISTRY", registry):
+            register_entry_model(never_true_detector, DevToolsEntry)
+            model = entry_selector(cleaned_entry)
         assert model is Entry
 
     def test_validate_empty_entries(self, cleaned_har: Dict[str, Any]) -> None:
@@ -259,3 +280,153 @@ class TestHarParser:
         assert isinstance(entry_dump["initiator"], dict)
         assert entry_dump["initiator"]["type"] == "parser"
         assert "transferSize" in entry_dump["response"]
+
+    def test_har_log_model_dump_json_preserves_extension_fields(self) -> None:
+        har_log = parse(CHROME_DEVTOOLS_HAR_BYTES)
+        dumped = orjson.loads(har_log.model_dump_json(by_alias=True))
+        entry_dump = dumped["entries"][0]
+        assert entry_dump["_initiator"]["type"] == "parser"
+        assert "_transferSize" in entry_dump["response"]
+        assert dumped == har_log.model_dump(mode="json", by_alias=True)
+
+    def test_har_log_model_dump_dumps_entries_once(self) -> None:
+        har_log = parse(CHROME_DEVTOOLS_HAR_BYTES)
+        with patch.object(
+            DevToolsEntry, "model_dump", side_effect=AssertionError
+        ) as entry_dump:
+            dumped = har_log.model_dump(exclude={"pages"})
+        entry_dump.assert_not_called()
+        assert "pages" not in dumped
+        assert dumped["entries"] == [entry.model_dump() for entry in har_log.entries]
+
+
+MIXED_TYPES = [Entry, DevToolsEntry, DevToolsEntry, Entry, DevToolsEntry]
+
+
+class TestMixedEntries:
+    def _types(self, har_log: HarLog) -> list[type]:
+        return [entry.__class__ for entry in har_log.entries]
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_validate_mixed(
+        self, mixed_har: Dict[str, Any], workers: int | None
+    ) -> None:
+        har_log = validate(mixed_har, workers=workers)
+        assert self._types(har_log) == MIXED_TYPES
+
+    def test_validate_json_mixed(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        har_log = validate_json(data)
+        assert type(har_log) is HarLog
+        assert self._types(har_log) == MIXED_TYPES
+        assert har_log == validate(mixed_har)
+        with patch("hario_core.parse.har_parser.JSON_CHUNK_SIZE", 1):
+            assert validate_json(memoryview(data)) == har_log
+
+    def test_lazy_and_iter_entries_mixed(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        lazy_log = parse(data, lazy=True)
+        assert [entry.__class__ for entry in lazy_log.entries] == MIXED_TYPES
+        entries = list(iter_entries(data))
+        assert [entry.__class__ for entry in entries] == MIXED_TYPES
+
+    def test_detectors_run_once_per_signature(self, mixed_har: Dict[str, Any]) -> None:
+        calls = []
+
+        def counting_detector(entry: Dict[str, Any]) -> bool:
+            calls.append(entry)
+            return is_devtools_entry(entry)
+
+        select = CachedEntrySelector(((counting_detector, DevToolsEntry),))
+        models = [select(entry) for entry in mixed_har["log"]["entries"]]
+        assert models == MIXED_TYPES
+        assert len(calls) == 2
+
+
+class TestPauseGcParse:
+    def test_pause_gc_matches_default(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        har_log = parse(data, pause_gc=True)
+        assert type(har_log) is HarLog
+        assert har_log == parse(data)
+
+    def test_pause_gc_disables_gc(self) -> None:
+        states = []
+
+        def recording_detector(entry: Dict[str, Any]) -> bool:
+            states.append(gc.isenabled())
+            return False
+
+        data = orjson.dumps(CLEANED_HAR)
+        registry = [(recording_detector, DevToolsEntry)]
+        with patch("hario_core.parse.har_parser.ENTRY_MODEL_REGISTRY", registry):
+            parse(data, pause_gc=True)
+        assert states == [False]
+        assert gc.isenabled()
+
+    def test_pause_gc_still_validates(self) -> None:
+        with pytest.raises(ValueError):
+            parse(orjson.dumps(INVALID_HAR_NO_VERSION), pause_gc=True)
+        assert gc.isenabled()
+
+
+class TestParseEntries:
+    def test_matches_model_dump(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        expected = parse(data).model_dump()["entries"]
+        with patch("hario_core.parse.har_parser.ENTRY_CHUNK_SIZE", 2):
+            assert parse_entries(data) == expected
+        assert set(DevToolsEntry.model_fields) <= set(expected[1])
+
+    def test_compressed_input_is_scanned(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        expected = parse(data).model_dump()["entries"]
+        with patch("hario_core.parse.har_parser.JSON_CHUNK_SIZE", 1):
+            assert parse_entries(io.BytesIO(gzip.compress(data))) == expected
+            raw = parse_entries(gzip.compress(data), validate=False)
+        assert raw == parse_entries(data, validate=False)
+
+    def test_without_validation(self, mixed_har: Dict[str, Any]) -> None:
+        data = orjson.dumps(mixed_har)
+        raw_entries = mixed_har["log"]["entries"]
+        entries = parse_entries(data, validate=False)
+        assert [entry.keys() for entry in entries] == [
+            entry.keys() for entry in raw_entries
+        ]
+        assert entries[0]["request"] == raw_entries[0]["request"]
+        validated = parse_entries(data)
+        assert raw_entries[0]["startedDateTime"].endswith("Z")
+        started = [entry["startedDateTime"] for entry in validated]
+        assert [entry["startedDateTime"] for entry in entries] == started
+        streamed = parse_entries(io.BytesIO(gzip.compress(data)), validate=False)
+        assert [entry["startedDateTime"] for entry in streamed] == started
+        id_fn = by_field(["request.url", "startedDateTime"])
+        assert [id_fn(entry) for entry in entries] == [
+            id_fn(entry) for entry in validated
+        ]
+
+    def test_pipeline_ready(self) -> None:
+        entries = parse_entries(CHROME_DEVTOOLS_HAR_BYTES)
+        results = Pipeline([set_id(by_field(["request.url"]))]).process(entries)
+        assert len(results) == 1
+        assert "id" in results[0]
+
+    @pytest.mark.parametrize(
+        "invalid_bytes",
+        [
+            b"not a json",
+            orjson.dumps(INVALID_HAR_NO_LOG),
+            orjson.dumps(INVALID_HAR_NO_ENTRIES),
+            orjson.dumps(INVALID_HAR_ROOT_NOT_DICT),
+        ],
+    )
+    @pytest.mark.parametrize("validate_entries", [True, False])
+    def test_invalid_cases(self, invalid_bytes: bytes, validate_entries: bool) -> None:
+        with pytest.raises(ValueError):
+            parse_entries(invalid_bytes, validate=validate_entries)
+
+    def test_invalid_entries_and_log(self) -> None:
+        with pytest.raises(ValueError):
+            parse_entries(orjson.dumps({"log": {"entries": [{"time": "oops"}]}}))
+        with pytest.raises(ValueError):
+            parse_entries(orjson.dumps(INVALID_HAR_NO_VERSION))
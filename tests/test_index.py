@@ -0,0 +1,121 @@
+"""
+Unit tests for the sidecar entry index of hario-core.
+"""
+
+import gzip
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry
+from hario_core.parse import IndexedHar, build_index, open_indexed, parse
+from hario_core.parse.index import EntryIndex, index_path_for, load_index
+
+
+@pytest.fixture
+def url_har(make_har: Callable[..., Dict[str, Any]]) -> Callable[[int], bytes]:
+    """Builds HAR bytes whose entry URLs end with their position."""
+
+    def build(count: int) -> bytes:
+        har = make_har("plain", "devtools", count=count)
+        for index, entry in enumerate(har["log"]["entries"]):
+            entry["request"]["url"] = f"https://example.com/{index}"
+        return orjson.dumps(har, option=orjson.OPT_INDENT_2)
+
+    return build
+
+
+class TestIndex:
+    @pytest.fixture
+    def har_path(self, tmp_path: Path, url_har: Callable[[int], bytes]) -> Path:
+        path = tmp_path / "sample.har"
+        path.write_bytes(url_har(5))
+        return path
+
+    def test_random_access(self, har_path: Path) -> None:
+        with open_indexed(har_path) as har:
+            assert isinstance(har, IndexedHar)
+            assert len(har) == 5
+            assert har[3].request.url == "https://example.com/3"
+            assert har[-1].request.url == "https://example.com/4"
+            assert type(har[0]) is Entry
+            assert type(har[1]) is DevToolsEntry
+            assert [entry.request.url for entry in har[1:4:2]] == [
+                "https://example.com/1",
+                "https://example.com/3",
+            ]
+            assert har.get_many([4, 0]) == [har[4], har[0]]
+            assert list(har) == parse(har_path).entries
+            assert orjson.loads(har.raw(2))["request"]["url"].endswith("/2")
+            assert har.log.creator.name == "WebInspector"
+            assert har.log.entries == []
+            with pytest.raises(IndexError):
+                har[5]
+
+    def test_sidecar_written_and_reused(self, har_path: Path) -> None:
+        sidecar = index_path_for(har_path)
+        assert not sidecar.exists()
+        open_indexed(har_path).close()
+        assert sidecar.exists()
+        index = load_index(har_path)
+        assert index is not None and len(index) == 5
+        mtime = sidecar.stat().st_mtime_ns
+        open_indexed(har_path).close()
+        assert sidecar.stat().st_mtime_ns == mtime
+
+    def test_stale_sidecar_rebuilt(
+        self, har_path: Path, url_har: Callable[[int], bytes]
+    ) -> None:
+        open_indexed(har_path).close()
+        har_path.write_bytes(url_har(3))
+        assert load_index(har_path) is None
+        with open_indexed(har_path) as har:
+            assert len(har) == 3
+            assert har[2].request.url == "https://example.com/2"
+
+    def test_touched_file_invalidates(self, har_path: Path) -> None:
+        build_index(har_path)
+        stat = har_path.stat()
+        os.utime(har_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert load_index(har_path) is None
+
+    def test_custom_index_path(self, har_path: Path, tmp_path: Path) -> None:
+        sidecar = tmp_path / "elsewhere.idx"
+        with open_indexed(har_path, index_path=sidecar) as har:
+            assert har[0].request.url == "https://example.com/0"
+        assert sidecar.exists()
+        assert not index_path_for(har_path).exists()
+
+    def test_corrupt_sidecar_rebuilt(self, har_path: Path) -> None:
+        index_path_for(har_path).write_bytes(b"garbage")
+        with open_indexed(har_path) as har:
+            assert len(har) == 5
+
+    def test_dump_load_roundtrip(self, har_path: Path) -> None:
+        index = build_index(har_path)
+        with open(index_path_for(har_path), "rb") as fh:
+            loaded = EntryIndex.load(fh)
+        assert list(loaded.starts) == list(index.starts)
+        assert list(loaded.lengths) == list(index.lengths)
+        assert loaded.log_json == index.log_json
+        data = har_path.read_bytes()
+        start, end = loaded.span(0)
+        assert orjson.loads(data[start:end])["request"]["url"].endswith("/0")
+
+    def test_invalid(self, har_path: Path, tmp_path: Path) -> None:
+        compressed = tmp_path / "sample.har.gz"
+        compressed.write_bytes(gzip.compress(har_path.read_bytes()))
+        with pytest.raises(ValueError, match="Compressed"):
+            open_indexed(compressed)
+        broken = tmp_path / "broken.har"
+        broken.write_bytes(b'{"log": {"entries": [{"a": 1}')
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            open_indexed(broken)
+        invalid = tmp_path / "invalid.har"
+        invalid.write_bytes(b'{"log": {"entries": [{"a": 1}]}}')
+        with open_indexed(invalid) as har:
+            with pytest.raises(ValueError, match="Invalid HAR entry at index 0"):
+                har[0]
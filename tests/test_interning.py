@@ -0,0 +1,75 @@
+"""
+Unit tests for string interning in hario-core models.
+"""
+
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import interning
+from hario_core.models.interning import clear_interned, intern
+from hario_core.parse import parse, parse_entries, validate
+
+LONG_VALUE = "Mozilla/5.0 " * 10
+
+
+@pytest.fixture
+def har_dict(make_har: Callable[..., Dict[str, Any]]) -> Dict[str, Any]:
+    har = make_har("devtools", count=3)
+    for entry in har["log"]["entries"]:
+        entry["request"]["headers"].append({"name": "user-agent", "value": LONG_VALUE})
+    # A fresh decode, so no string object is shared up front.
+    result: Dict[str, Any] = orjson.loads(orjson.dumps(har))
+    return result
+
+
+def _shared(strings: List[str]) -> bool:
+    """True if equal strings are the same object."""
+    return len({id(value) for value in strings}) == len(set(strings))
+
+
+class TestInterning:
+    def test_intern(self) -> None:
+        value = "".join(["content", "-type"])
+        assert intern(value) is intern("content-type")
+        long_value = "x" * (interning.INTERN_MAX_LENGTH + 1)
+        assert intern(long_value) is long_value
+
+    def test_table_is_bounded(self) -> None:
+        clear_interned()
+        with patch.object(interning, "INTERN_TABLE_SIZE", 2):
+            for value in ["a", "b", "c", "d"]:
+                intern(value)
+            assert len(interning._TABLE) <= 2
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_models_validated_from_dicts(
+        self, har_dict: Dict[str, Any], lazy: bool
+    ) -> None:
+        har_log = validate(har_dict, lazy=lazy)
+        headers = [h for entry in har_log.entries for h in entry.request.headers]
+        assert _shared([header.name for header in headers])
+        # Long values are interned too.
+        assert _shared([header.value for header in headers])
+        assert _shared([entry.response.content.mimeType for entry in har_log.entries])
+
+    def test_models_validated_from_json(self, har_dict: Dict[str, Any]) -> None:
+        har_log = parse(orjson.dumps(har_dict))
+        headers = [h for entry in har_log.entries for h in entry.request.headers]
+        assert _shared([header.name for header in headers])
+        # Longer than pydantic-core's string cache allows.
+        assert _shared([header.value for header in headers])
+        assert _shared([entry.response.content.mimeType for entry in har_log.entries])
+
+    @pytest.mark.parametrize("validate_entries", [True, False])
+    def test_pipeline_dicts(
+        self, har_dict: Dict[str, Any], validate_entries: bool
+    ) -> None:
+        entries = parse_entries(orjson.dumps(har_dict), validate=validate_entries)
+        headers = [h for entry in entries for h in entry["request"]["headers"]]
+        assert _shared([header["name"] for header in headers])
+        assert _shared(
+            [header["value"] for header in headers if len(header["value"]) <= 64]
+        )
@@ -0,0 +1,83 @@
+"""
+Unit tests for lazy HarLog validation in hario-core.
+"""
+
+import pickle
+from typing import Any, Callable, Dict, List
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry, LazyEntries, LazyHarLog
+from hario_core.parse import entry_selector, parse, validate
+
+from .samples import CHROME_DEVTOOLS_HAR, CHROME_DEVTOOLS_HAR_BYTES
+
+
+class TestLazyHarLog:
+    def test_parse_lazy(self) -> None:
+        har_log = parse(CHROME_DEVTOOLS_HAR_BYTES, lazy=True)
+        assert isinstance(har_log, LazyHarLog)
+        assert isinstance(har_log.entries, LazyEntries)
+        assert len(har_log.entries) == 1
+        assert type(har_log.entries[0]) is DevToolsEntry
+        assert har_log.creator.name == "WebInspector"
+
+    def test_lazy_dump_matches_eager(self) -> None:
+        lazy_log = validate(CHROME_DEVTOOLS_HAR, lazy=True)
+        eager_log = validate(CHROME_DEVTOOLS_HAR)
+        assert lazy_log.model_dump() == eager_log.model_dump()
+        assert orjson.loads(lazy_log.model_dump_json()) == lazy_log.model_dump(
+            mode="json"
+        )
+
+    def test_entries_validated_on_access(
+        self, make_entries: Callable[..., List[Dict[str, Any]]]
+    ) -> None:
+        raw = make_entries(count=3)
+        raw[2]["time"] = "not a number"
+        entries = LazyEntries(raw, entry_selector)
+        assert entries[0].comment == "0"
+        assert [entry.comment for entry in entries[:2]] == ["0", "1"]
+        with pytest.raises(ValueError, match="index 2"):
+            entries[-1]
+        with pytest.raises(IndexError):
+            entries[3]
+
+    def test_entries_cache(
+        self, make_entries: Callable[..., List[Dict[str, Any]]]
+    ) -> None:
+        entries = LazyEntries(make_entries(count=4), entry_selector, cache_size=2)
+        first = entries[0]
+        assert entries[0] is first
+        entries[1]
+        entries[2]
+        # Evicted from the LRU cache, validated again.
+        assert entries[0] is not first
+        assert entries[0] == first
+
+    def test_lazy_selects_model_per_entry(
+        self, make_entries: Callable[..., List[Dict[str, Any]]]
+    ) -> None:
+        raw = make_entries("plain", "plain", "devtools")
+        entries = LazyEntries(raw, entry_selector)
+        assert [type(entry) for entry in entries] == [Entry, Entry, DevToolsEntry]
+
+    def test_lazy_pickle(self) -> None:
+        har_log = validate(CHROME_DEVTOOLS_HAR, lazy=True)
+        restored = pickle.loads(pickle.dumps(har_log))
+        assert restored.entries[0] == har_log.entries[0]
+
+    def test_workers_are_rejected(self) -> None:
+        with pytest.raises(ValueError, match="not supported with lazy=True"):
+            parse(CHROME_DEVTOOLS_HAR_BYTES, lazy=True, workers=2)
+        with pytest.raises(ValueError, match="not supported with lazy=True"):
+            parse(CHROME_DEVTOOLS_HAR_BYTES, lazy=True, workers=2, where=bool)
+        with pytest.raises(ValueError, match="not supported with lazy=True"):
+            validate(CHROME_DEVTOOLS_HAR, lazy=True, workers=2)
+
+    def test_parse_lazy_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            parse(b"[]", lazy=True)
+        with pytest.raises(ValueError):
+            parse(orjson.dumps({"log": {"entries": []}}), lazy=True)
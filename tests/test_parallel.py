@@ -0,0 +1,85 @@
+"""
+Unit tests for parallel entry validation in hario-core.
+"""
+
+import gzip
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry
+from hario_core.parse import parse, validate
+
+
+class TestParallelValidation:
+    @pytest.mark.parametrize(
+        "kind, expected_type", [("plain", Entry), ("devtools", DevToolsEntry)]
+    )
+    def test_validate_with_workers(
+        self,
+        make_har: Callable[..., Dict[str, Any]],
+        kind: str,
+        expected_type: type[Entry],
+    ) -> None:
+        har = make_har(kind, count=9)
+        har_log = validate(har, workers=2)
+        assert all(type(entry) is expected_type for entry in har_log.entries)
+        assert har_log == validate(har)
+
+    def test_parse_with_workers_keeps_order(
+        self, make_har: Callable[..., Dict[str, Any]]
+    ) -> None:
+        data = orjson.dumps(make_har("devtools", count=7))
+        har_log = parse(data, workers=3)
+        assert [entry.comment for entry in har_log.entries] == [
+            str(i) for i in range(7)
+        ]
+
+    def test_validate_mixed_models_in_one_pool(
+        self, make_har: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = make_har("plain", "devtools", count=5)
+        with patch(
+            "hario_core.parse.parallel.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            har_log = validate(har, workers=2)
+        pool.assert_called_once()
+        assert har_log == validate(har)
+        assert [type(entry) for entry in har_log.entries] == [
+            Entry,
+            DevToolsEntry,
+            Entry,
+            DevToolsEntry,
+            Entry,
+        ]
+
+    def test_parse_with_workers_invalid_entry(
+        self, make_har: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = make_har(count=4)
+        har["log"]["entries"][3]["time"] = "oops"
+        with pytest.raises(ValueError):
+            parse(orjson.dumps(har), workers=2)
+
+    def test_parse_with_workers_ships_raw_slices(
+        self, make_har: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = make_har("devtools", "plain", "plain", "devtools", count=6)
+        data = orjson.dumps(har)
+        expected = validate(har)
+        # The document is never decoded in the parent process.
+        with patch("hario_core.parse.har_parser.loads", side_effect=AssertionError):
+            for src in (data, memoryview(data), gzip.compress(data)):
+                har_log = parse(src, workers=2)
+                assert har_log == expected
+                assert [type(entry) for entry in har_log.entries] == [
+                    DevToolsEntry,
+                    Entry,
+                    Entry,
+                    DevToolsEntry,
+                    DevToolsEntry,
+                    Entry,
+                ]
@@ -1,4 +1,7 @@
-from typing import Any, Dict, List
+import multiprocessing
+from datetime import datetime
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List
 
 import pytest
 
@@ -10,7 +13,30 @@ from hario_core.transform import (
     normalize_sizes,
     set_id,
     uuid,
+    worker,
 )
+from hario_core.transform.strategies import ForkStrategy, ProcessPoolStrategy
+from hario_core.transform.worker import init_worker, process_installed_batch
+
+
+class CountingTransformer:
+    """Counts how many times it is pickled, in the parent process."""
+
+    pickles = 0
+
+    def __call__(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        data["counted"] = True
+        return data
+
+    def __getstate__(self) -> Dict[str, Any]:
+        CountingTransformer.pickles += 1
+        return self.__dict__
+
+
+def date_to_text(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces the `startedDateTime` datetime with a non-ISO string."""
+    data["startedDateTime"] = f"started at {data['startedDateTime'].year}"
+    return data
 
 
 class TestPipeline:
@@ -101,3 +127,164 @@ class TestPipeline:
         assert results[0]["request.headersSize"] == 0
         assert "request.headers" in results[0]
         assert isinstance(results[0]["request.headers"], str)
+
+    @pytest.mark.parametrize("strategy", ["process", "thread", "sequential", "async"])
+    def test_process_iter(
+        self, cleaned_entries: List[Dict[str, Any]], strategy: str
+    ) -> None:
+        entries = [dict(cleaned_entries[0], comment=str(index)) for index in range(10)]
+        config = PipelineConfig(
+            batch_size=3,
+            processing_strategy=strategy,
+            max_workers=2,
+            max_in_flight=2,
+        )
+        pipeline = Pipeline(transformers=[normalize_sizes(), flatten()], config=config)
+        results = list(pipeline.process_iter(iter(entries)))
+        assert sorted(result["comment"] for result in results) == sorted(
+            str(index) for index in range(10)
+        )
+        assert results[0]["request.headersSize"] == 0
+
+    def test_process_iter_bounded(self, cleaned_entries: List[Dict[str, Any]]) -> None:
+        consumed: List[int] = []
+
+        def entries() -> Iterator[Dict[str, Any]]:
+            for index in range(100):
+                consumed.append(index)
+                yield dict(cleaned_entries[0], comment=str(index))
+
+        config = PipelineConfig(
+            batch_size=5, processing_strategy="thread", max_workers=2, max_in_flight=2
+        )
+        results = Pipeline(config=config).process_iter(entries())
+        next(results)
+        # At most max_in_flight batches (and the one being taken) are read.
+        assert len(consumed) <= 3 * 5
+        assert len(list(results)) == 99
+
+    def test_process_iter_invalid_input_typeerror(self) -> None:
+        pipeline = Pipeline(transformers=[set_id(uuid())])
+        with pytest.raises(TypeError, match="Pipeline.process_iter expects"):
+            list(pipeline.process_iter(["not a dict"]))  # type: ignore
+
+    def test_process_pool_reused(self, cleaned_entries: List[Dict[str, Any]]) -> None:
+        config = PipelineConfig(
+            batch_size=1, processing_strategy="process", max_workers=2
+        )
+        with Pipeline(transformers=[normalize_sizes()], config=config) as pipeline:
+            strategy = pipeline.strategy
+            assert isinstance(strategy, ProcessPoolStrategy)
+            pipeline.process(cleaned_entries)
+            executor = strategy._executor
+            assert executor is not None
+            results = pipeline.process(cleaned_entries)
+            assert list(pipeline.process_iter(cleaned_entries)) == results
+            assert strategy._executor is executor
+            # Other transformers need a fresh pool.
+            pipeline.transformers = [normalize_sizes(), flatten()]
+            assert "request.headersSize" in pipeline.process(cleaned_entries)[0]
+            assert strategy._executor is not executor
+        assert strategy._executor is None
+        # A closed pipeline starts a new pool when used again.
+        assert pipeline.process(cleaned_entries)[0]["request.headersSize"] == 0
+        pipeline.close()
+
+    def test_process_transformers_installed_once(
+        self, cleaned_entries: List[Dict[str, Any]]
+    ) -> None:
+        entries = [dict(cleaned_entries[0]) for _ in range(8)]
+        config = PipelineConfig(
+            batch_size=1, processing_strategy="process", max_workers=2
+        )
+        CountingTransformer.pickles = 0
+        with Pipeline(transformers=[CountingTransformer()], config=config) as pipeline:
+            results = pipeline.process(entries)
+            results += list(pipeline.process_iter(entries))
+        assert len(results) == 16 and all(result["counted"] for result in results)
+        # At most once per worker (none when workers are forked), not per batch.
+        assert CountingTransformer.pickles <= 2
+
+    def test_stale_worker_token(self) -> None:
+        init_worker([normalize_sizes()], token=1)
+        assert process_installed_batch([], 1) == []
+        with pytest.raises(RuntimeError):
+            process_installed_batch([], 2)
+
+    @pytest.mark.parametrize("transport", ["pickle", "json"])
+    def test_process_transport(
+        self, cleaned_entries: List[Dict[str, Any]], transport: str
+    ) -> None:
+        entries = [dict(cleaned_entries[0], comment=str(index)) for index in range(5)]
+        transformers = [set_id(by_field(["request.url", "startedDateTime"]))]
+        expected = Pipeline(transformers=transformers).process(entries)
+        config = PipelineConfig(
+            batch_size=2,
+            processing_strategy="process",
+            max_workers=2,
+            transport=transport,
+        )
+        with Pipeline(transformers=transformers, config=config) as pipeline:
+            results = pipeline.process(entries)
+            streamed = list(pipeline.process_iter(entries))
+        key = itemgetter("comment")
+        assert sorted(results, key=key) == expected
+        assert sorted(streamed, key=key) == expected
+        assert isinstance(results[0]["startedDateTime"], datetime)
+
+    @pytest.mark.parametrize("strategy", ["process", "fork"])
+    def test_transports_keep_transformed_dates(
+        self, cleaned_entries: List[Dict[str, Any]], strategy: str
+    ) -> None:
+        entries = [dict(cleaned_entries[0], comment=str(index)) for index in range(4)]
+        outputs = []
+        for transport in ["pickle", "json"]:
+            config = PipelineConfig(
+                batch_size=2,
+                processing_strategy=strategy,
+                max_workers=2,
+                transport=transport,
+            )
+            pipeline = Pipeline(transformers=[date_to_text], config=config)
+            with pipeline:
+                outputs.append(
+                    sorted(pipeline.process(entries), key=itemgetter("comment"))
+                )
+        assert outputs[0] == outputs[1]
+        assert outputs[1][0]["startedDateTime"] == "started at 2025"
+
+    def test_unknown_transport(self) -> None:
+        with pytest.raises(ValueError, match="Unknown transport"):
+            Pipeline(
+                config=PipelineConfig(processing_strategy="process", transport="xml")
+            )
+
+    @pytest.mark.parametrize("transport", ["pickle", "json"])
+    def test_fork_strategy(
+        self, cleaned_entries: List[Dict[str, Any]], transport: str
+    ) -> None:
+        entries = [dict(cleaned_entries[0], comment=str(index)) for index in range(7)]
+        transformers = [set_id(by_field(["request.url", "startedDateTime"])), flatten()]
+        expected = Pipeline(transformers=transformers).process(entries)
+        config = PipelineConfig(
+            batch_size=2,
+            processing_strategy="fork",
+            max_workers=2,
+            transport=transport,
+        )
+        CountingTransformer.pickles = 0
+        with Pipeline(
+            transformers=[*transformers, CountingTransformer()], config=config
+        ) as pipeline:
+            assert isinstance(pipeline.strategy, ForkStrategy)
+            results = pipeline.process(entries)
+            if "fork" in multiprocessing.get_all_start_methods():
+                # Batches were inherited and transformers not pickled.
+                assert CountingTransformer.pickles == 0
+                assert worker._shared_batches == []
+            streamed = list(pipeline.process_iter(iter(entries)))
+        key = itemgetter("comment")
+        for result in results + streamed:
+            assert result.pop("counted")
+        assert sorted(results, key=key) == expected
+        assert sorted(streamed, key=key) == expected
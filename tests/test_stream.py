@@ -0,0 +1,301 @@
+"""
+Unit tests for streaming entry iteration in hario-core.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import DevToolsEntry, Entry
+from hario_core.parse import JsonSource, iter_entries, parse, parse_entries
+from hario_core.parse.stream import detect_compression, iter_entry_spans
+
+from .samples import (
+    CHROME_DEVTOOLS_HAR,
+    CHROME_DEVTOOLS_HAR_BYTES,
+    CLEANED_HAR,
+    CLEANED_HAR_BYTES,
+    INVALID_HAR_NO_ENTRIES,
+    INVALID_HAR_NO_LOG,
+    INVALID_HAR_ROOT_NOT_DICT,
+)
+
+
+@pytest.fixture
+def har_with_entries(
+    make_har: Callable[..., Dict[str, Any]]
+) -> Callable[..., Dict[str, Any]]:
+    """`make_har` with a root member before the log, as some tools write."""
+
+    def build(*kinds: str, count: int) -> Dict[str, Any]:
+        return {"comment": "before log", **make_har(*kinds, count=count)}
+
+    return build
+
+
+class TestIterEntries:
+    @pytest.mark.parametrize(
+        "har_bytes, expected_type",
+        [
+            (CLEANED_HAR_BYTES, Entry),
+            (CHROME_DEVTOOLS_HAR_BYTES, DevToolsEntry),
+        ],
+    )
+    def test_iter_entries_models(
+        self, har_bytes: bytes, expected_type: type[Entry]
+    ) -> None:
+        entries = list(iter_entries(har_bytes))
+        assert len(entries) == 1
+        assert type(entries[0]) is expected_type
+
+    def test_iter_entries_raw(self) -> None:
+        entries = list(iter_entries(CHROME_DEVTOOLS_HAR_BYTES, raw=True))
+        assert entries == CHROME_DEVTOOLS_HAR["log"]["entries"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+    def test_iter_entries_from_file(
+        self,
+        tmp_path: Path,
+        har_with_entries: Callable[..., Dict[str, Any]],
+        chunk_size: int,
+    ) -> None:
+        har = har_with_entries("devtools", count=5)
+        file_path = tmp_path / "test.har"
+        file_path.write_bytes(orjson.dumps(har, option=orjson.OPT_INDENT_2))
+        entries = list(iter_entries(file_path, raw=True, chunk_size=chunk_size))
+        assert entries == har["log"]["entries"]
+
+    def test_iter_entries_from_file_like(
+        self, har_with_entries: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = har_with_entries("plain", count=3)
+        entries = list(iter_entries(io.BytesIO(orjson.dumps(har)), chunk_size=16))
+        assert len(entries) == 3
+        assert all(type(entry) is Entry for entry in entries)
+
+    def test_iter_entries_is_lazy(
+        self, har_with_entries: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = har_with_entries("plain", count=3)
+        data = orjson.dumps(har)
+        # Truncated input fails only once the broken entry is reached.
+        iterator = iter_entries(io.BytesIO(data[:-200]), chunk_size=16)
+        assert isinstance(next(iterator), Entry)
+        with pytest.raises(ValueError):
+            list(iterator)
+
+    def test_iter_entries_empty(self) -> None:
+        har = dict(CLEANED_HAR, log=dict(CLEANED_HAR["log"], entries=[]))
+        assert list(iter_entries(orjson.dumps(har))) == []
+
+    def test_iter_entry_spans_offsets(
+        self, har_with_entries: Callable[..., Dict[str, Any]]
+    ) -> None:
+        har = har_with_entries("plain", count=2)
+        data = orjson.dumps(har, option=orjson.OPT_INDENT_2)
+        spans = list(iter_entry_spans(io.BytesIO(data), chunk_size=32))
+        assert len(spans) == 2
+        for (start, end, entry_bytes), entry in zip(spans, har["log"]["entries"]):
+            assert data[start:end] == entry_bytes
+            assert orjson.loads(entry_bytes) == entry
+
+    def test_iter_entry_spans_strings_with_brackets(self) -> None:
+        entry = {"text": 'a "quoted" ]} [{ \\', "nested": [{"x": "}"}]}
+        data = orjson.dumps({"log": {"entries": [entry, entry]}})
+        spans = list(iter_entry_spans(io.BytesIO(data), chunk_size=3))
+        assert [orjson.loads(span[2]) for span in spans] == [entry, entry]
+
+    @pytest.mark.parametrize(
+        "invalid_bytes",
+        [
+            b"not a json",
+            b'{"log": {"entries": [{"a": 1}',
+            orjson.dumps(INVALID_HAR_NO_LOG),
+            orjson.dumps(INVALID_HAR_NO_ENTRIES),
+            orjson.dumps(INVALID_HAR_ROOT_NOT_DICT),
+            orjson.dumps({"log": {"entries": [{"time": "oops"}]}}),
+        ],
+    )
+    def test_iter_entries_invalid_cases(self, invalid_bytes: bytes) -> None:
+        with pytest.raises(ValueError):
+            list(iter_entries(invalid_bytes))
+
+
+class TestMappedSources:
+    @pytest.fixture
+    def har_file(
+        self, tmp_path: Path, har_with_entries: Callable[..., Dict[str, Any]]
+    ) -> Path:
+        file_path = tmp_path / "test.har"
+        har = har_with_entries("devtools", count=5)
+        file_path.write_bytes(orjson.dumps(har, option=orjson.OPT_INDENT_2))
+        return file_path
+
+    def test_parse_mapped_file(self, har_file: Path) -> None:
+        expected = parse(har_file.read_bytes())
+        with (
+            patch("hario_core.parse.stream.MMAP_THRESHOLD", 0),
+            patch("hario_core.parse.har_parser.JSON_CHUNK_SIZE", 1),
+        ):
+            har_log = parse(har_file)
+        assert har_log == expected
+        assert type(har_log.entries[0]) is DevToolsEntry
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_parse_mmap_and_memoryview(self, har_file: Path, lazy: bool) -> None:
+        expected = parse(har_file.read_bytes())
+        with open(har_file, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                assert parse(mapped, lazy=lazy).model_dump() == expected.model_dump()
+                with memoryview(mapped) as view:
+                    har_log = parse(view, lazy=lazy)
+                    assert har_log.model_dump() == expected.model_dump()
+
+    def test_iter_entries_mmap(self, har_file: Path) -> None:
+        with open(har_file, "rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                assert len(list(iter_entries(mapped))) == 5
+
+    def test_parse_mapped_file_empty_entries(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "empty.har"
+        har = dict(CLEANED_HAR, log=dict(CLEANED_HAR["log"], entries=[]))
+        file_path.write_bytes(orjson.dumps(har))
+        with patch("hario_core.parse.stream.MMAP_THRESHOLD", 0):
+            assert parse(file_path).entries == []
+
+    def test_parse_mapped_file_invalid(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "invalid.har"
+        file_path.write_bytes(b"")
+        with patch("hario_core.parse.stream.MMAP_THRESHOLD", 0):
+            with pytest.raises(ValueError):
+                parse(file_path)
+
+    @pytest.mark.parametrize(
+        "har_bytes",
+        [
+            b'{"junk": nope!!, "log": ' + CLEANED_HAR_BYTES[7:],
+            CLEANED_HAR_BYTES[:-1] + b', "junk": [1, oops]}',
+            CLEANED_HAR_BYTES + b" trailing",
+            CLEANED_HAR_BYTES + b"{}",
+        ],
+    )
+    def test_invalid_outside_entries(self, har_bytes: bytes) -> None:
+        # Rejected whatever the size or kind of the source.
+        sources: List[Callable[[], JsonSource]] = [
+            lambda: har_bytes,
+            lambda: memoryview(har_bytes),
+            lambda: gzip.compress(har_bytes),
+            lambda: io.BytesIO(gzip.compress(har_bytes)),
+        ]
+        for source in sources:
+            with pytest.raises(ValueError, match="Invalid HAR file"):
+                parse(source())
+            with pytest.raises(ValueError, match="Invalid HAR file"):
+                list(iter_entries(source()))
+
+    def test_whitespace_after_root(self) -> None:
+        har_bytes = CLEANED_HAR_BYTES + b" \n\t\r\n"
+        assert parse(memoryview(har_bytes)) == parse(CLEANED_HAR_BYTES)
+
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+class TestCompressedSources:
+    @pytest.fixture
+    def har_bytes(self, har_with_entries: Callable[..., Dict[str, Any]]) -> bytes:
+        har = har_with_entries("devtools", count=5)
+        return orjson.dumps(har, option=orjson.OPT_INDENT_2)
+
+    @pytest.mark.parametrize("compression", COMPRESSORS)
+    def test_detect_compression(self, compression: str) -> None:
+        assert detect_compression(COMPRESSORS[compression](b"{}")) == compression
+
+    def test_detect_compression_plain(self) -> None:
+        assert detect_compression(CLEANED_HAR_BYTES) is None
+
+    @pytest.mark.parametrize("compression", COMPRESSORS)
+    def test_parse_compressed_file(
+        self, tmp_path: Path, har_bytes: bytes, compression: str
+    ) -> None:
+        file_path = tmp_path / f"test.har.{compression}"
+        file_path.write_bytes(COMPRESSORS[compression](har_bytes))
+        expected = parse(har_bytes)
+        with patch("hario_core.parse.har_parser.JSON_CHUNK_SIZE", 1):
+            har_log = parse(file_path)
+        assert har_log == expected
+        assert type(har_log.entries[0]) is DevToolsEntry
+
+    @pytest.mark.parametrize("compression", COMPRESSORS)
+    def test_parse_compressed_bytes_and_file_like(
+        self, har_bytes: bytes, compression: str
+    ) -> None:
+        expected = parse(har_bytes)
+        compressed = COMPRESSORS[compression](har_bytes)
+        assert parse(compressed) == expected
+        assert parse(io.BytesIO(compressed)) == expected
+        assert parse(io.BytesIO(compressed), lazy=True).model_dump() == (
+            expected.model_dump()
+        )
+
+    @pytest.mark.parametrize("compression", COMPRESSORS)
+    def test_iter_entries_compressed(
+        self, tmp_path: Path, har_bytes: bytes, compression: str
+    ) -> None:
+        file_path = tmp_path / f"test.har.{compression}"
+        file_path.write_bytes(COMPRESSORS[compression](har_bytes))
+        expected = orjson.loads(har_bytes)["log"]["entries"]
+        assert list(iter_entries(file_path, raw=True, chunk_size=64)) == expected
+        stream = io.BytesIO(file_path.read_bytes())
+        assert list(iter_entries(stream, raw=True, chunk_size=64)) == expected
+
+    def test_parse_plain_file_like(self, har_bytes: bytes) -> None:
+        assert parse(io.BytesIO(har_bytes)) == parse(har_bytes)
+        assert list(iter_entries(io.StringIO(har_bytes.decode()), raw=True)) == (
+            orjson.loads(har_bytes)["log"]["entries"]
+        )
+
+    def test_parse_zstd(self, har_bytes: bytes) -> None:
+        zstandard = pytest.importorskip("zstandard")
+        compressed = zstandard.ZstdCompressor().compress(har_bytes)
+        assert detect_compression(compressed) == "zstd"
+        assert parse(compressed) == parse(har_bytes)
+
+    def test_parse_truncated(self, har_bytes: bytes) -> None:
+        with pytest.raises(ValueError):
+            parse(gzip.compress(har_bytes)[:-100])
+
+    @pytest.mark.parametrize("compression", [*COMPRESSORS, "zstd"])
+    def test_parse_corrupt(self, har_bytes: bytes, compression: str) -> None:
+        if compression == "zstd":
+            zstandard = pytest.importorskip("zstandard")
+            compressor = zstandard.ZstdCompressor(write_checksum=True)
+            compressed = compressor.compress(har_bytes)
+        else:
+            compressed = COMPRESSORS[compression](har_bytes)
+        middle = len(compressed) // 2
+        corrupt = (
+            compressed[:middle]
+            + bytes(byte ^ 0xFF for byte in compressed[middle : middle + 8])
+            + compressed[middle + 8 :]
+        )
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse(corrupt)
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse(io.BytesIO(corrupt), lazy=True)
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            list(iter_entries(corrupt))
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse_entries(corrupt)
@@ -0,0 +1,123 @@
+"""
+Unit tests for filtering entries before validation in hario-core.
+"""
+
+import gzip
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from hario_core.models import CompactHarLog, DevToolsEntry
+from hario_core.parse import Where, iter_entries, parse
+
+_START = datetime(2025, 6, 5, 16, 0, tzinfo=timezone.utc)
+
+
+def _urls(entries: Any) -> List[str]:
+    return [entry.request.url.rsplit("/", 1)[1] for entry in entries]
+
+
+class TestWhere:
+    @pytest.fixture
+    def har(self, make_har: Callable[..., Dict[str, Any]]) -> Dict[str, Any]:
+        har = make_har("devtools", count=6)
+        for index, entry in enumerate(har["log"]["entries"]):
+            host = "api.test" if index % 2 else "cdn.test"
+            entry["request"]["url"] = f"https://{host}/v1/{index}"
+            entry["request"]["method"] = "POST" if index == 3 else "GET"
+            entry["response"]["status"] = 500 + index if index >= 4 else 200
+            entry["_resourceType"] = "xhr" if index % 2 else "script"
+            started = _START + timedelta(seconds=index)
+            entry["startedDateTime"] = started.isoformat().replace("+00:00", "Z")
+        return har
+
+    @pytest.fixture
+    def har_bytes(self, har: Dict[str, Any]) -> bytes:
+        return orjson.dumps(har)
+
+    @pytest.mark.parametrize(
+        "where, expected",
+        [
+            (Where(host="API.test"), ["1", "3", "5"]),
+            (Where(url_prefix="https://cdn.test/"), ["0", "2", "4"]),
+            (
+                Where(url_prefix=["https://cdn.test/v1/0", "https://api.test/v1/5"]),
+                ["0", "5"],
+            ),
+            (Where(method="post"), ["3"]),
+            (Where(status=range(500, 600)), ["4", "5"]),
+            (Where(status=200, resource_type="xhr"), ["1", "3"]),
+            (
+                Where(resource_type=["xhr", "script"], method=["GET"]),
+                ["0", "1", "2", "4", "5"],
+            ),
+            (Where(started_after=_START + timedelta(seconds=4)), ["4", "5"]),
+            (Where(started_before=datetime(2025, 6, 5, 16, 0, 2)), ["0", "1"]),
+            (lambda entry: entry["request"]["url"].endswith("/2"), ["2"]),
+        ],
+    )
+    def test_parse(self, har_bytes: bytes, where: Any, expected: List[str]) -> None:
+        har_log = parse(har_bytes, where=where)
+        assert _urls(har_log.entries) == expected
+        assert all(type(entry) is DevToolsEntry for entry in har_log.entries)
+        assert _urls(iter_entries(har_bytes, where=where)) == expected
+
+    def test_sources_and_modes(self, har_bytes: bytes) -> None:
+        where = Where(host="api.test", status=200)
+        expected = parse(har_bytes, where=where).model_dump()
+        assert parse(gzip.compress(har_bytes), where=where).model_dump() == expected
+        assert parse(har_bytes, where=where, lazy=True).model_dump() == expected
+        compact_log = parse(har_bytes, compact=True, where=where)
+        assert isinstance(compact_log, CompactHarLog)
+        assert compact_log.to_dict() == expected
+        raw = list(iter_entries(har_bytes, raw=True, where=where))
+        assert [entry["request"]["url"] for entry in raw] == [
+            "https://api.test/v1/1",
+            "https://api.test/v1/3",
+        ]
+
+    def test_document_is_not_decoded_whole(self, har_bytes: bytes) -> None:
+        where = Where(host="api.test")
+        expected = parse(har_bytes, where=where).model_dump()
+        with patch("hario_core.parse.har_parser.loads", side_effect=AssertionError):
+            for src in (har_bytes, gzip.compress(har_bytes), memoryview(har_bytes)):
+                assert parse(src, where=where).model_dump() == expected
+                assert parse(src, where=where, workers=2).model_dump() == expected
+                compact_log = parse(src, compact=True, where=where)
+                assert compact_log.to_dict() == expected
+        assert parse(gzip.compress(har_bytes), where=where, lazy=True).model_dump() == (
+            expected
+        )
+
+    def test_rejected_entries_are_not_validated(self, har: Dict[str, Any]) -> None:
+        del har["log"]["entries"][0]["response"]
+        har["log"]["entries"][2]["request"]["url"] = None
+        har_bytes = orjson.dumps(har)
+        with pytest.raises(ValueError, match="Invalid HAR file"):
+            parse(har_bytes)
+        assert _urls(parse(har_bytes, where=Where(host="api.test")).entries) == [
+            "1",
+            "3",
+            "5",
+        ]
+        # Entries lacking the filtered field do not match.
+        assert len(parse(har_bytes, where=Where(status=range(500, 600))).entries) == 2
+
+    @pytest.mark.parametrize(
+        "started",
+        [
+            "2025-06-05T16:00:03.12Z",
+            "2025-06-05T16:00:03.1234567Z",
+            "2025-06-05T17:00:03+0100",
+        ],
+    )
+    def test_started_formats(self, started: str) -> None:
+        entry = {"request": {}, "startedDateTime": started}
+        assert Where(started_after=_START + timedelta(seconds=3))(entry)
+        assert not Where(started_before=_START + timedelta(seconds=3))(entry)
+
+    def test_repr(self) -> None:
+        assert repr(Where(method="get")) == "Where(method=frozenset({'GET'}))"